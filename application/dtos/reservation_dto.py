@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -15,6 +15,7 @@ class ReservationRequestDTO:
     seat_count: int
     user_id: Optional[str] = None
     user_password: Optional[str] = None
+    seat_grades: Optional[List[Dict]] = None
     
     
 @dataclass
@@ -1,42 +1,100 @@
 import logging
+import re
+from dataclasses import replace
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
+from config.settings import Settings
 from domain.entities import (
     Reservation, Performance, SeatPreference, UserCredentials,
     SeatSelectionType, SeatDirection
 )
 from domain.use_cases import MakeReservationUseCase
+from domain.cancellation import CancellationToken
 from application.dtos.reservation_dto import ReservationRequestDTO, ReservationResponseDTO
 from infrastructure.web_driver.driver_manager import WebDriverManager
 from infrastructure.interpark.interpark_repository import InterparkRepository
+from infrastructure.tracing.trace_recorder import TraceRecorder
+from infrastructure.cache.detail_cache import PerformanceDetailCache
+from infrastructure.profiling.cpu_profiler import CpuProfiler
 
 logger = logging.getLogger(__name__)
 
 
 class ReservationService:
-    def __init__(self):
-        self.driver_manager = WebDriverManager()
+    def __init__(self, settings=Settings, detail_cache: Optional[PerformanceDetailCache] = None,
+                 cpu_profiler: Optional[CpuProfiler] = None,
+                 scope_factory: Optional[Callable[[], Any]] = None):
+        self.settings = settings
+        self.detail_cache = detail_cache
+        self.cpu_profiler = cpu_profiler or CpuProfiler.from_settings(settings)
+        # 예매 실행마다 DI 스코프를 열어 WebDriverManager를 받고, 끝나면 스코프와 함께 정리
+        self.scope_factory = scope_factory
+        self.driver_manager: Optional[WebDriverManager] = None
+        self._scope = None
+        # 실패 후 브라우저를 유지 중인 요청 (공연 URL, 날짜, 시간)
+        self._resumable_key: Optional[tuple] = None
         
     def make_reservation(self, 
                         request_dto: ReservationRequestDTO,
-                        progress_callback: Optional[Callable[[str], None]] = None) -> ReservationResponseDTO:
+                        progress_callback: Optional[Callable[[str], None]] = None,
+                        cancel_token: Optional[CancellationToken] = None) -> ReservationResponseDTO:
         """예매 서비스 실행"""
+        cancel_token = cancel_token or CancellationToken()
+        trace_recorder = None
+        keep_browser = False
+        
+        # 같은 공연/회차의 이전 실행이 브라우저를 남겨 뒀다면 이어서 진행
+        request_key = (request_dto.performance_url, request_dto.date, request_dto.time)
+        resume = (self._resumable_key == request_key and self.driver_manager is not None
+                  and self.driver_manager.is_alive())
+        if not resume:
+            self.cleanup()
+            self._scope = self.scope_factory() if self.scope_factory else None
+            self.driver_manager = self._scope.resolve(WebDriverManager) if self._scope else WebDriverManager()
+        self._resumable_key = None
+        
         try:
-            reservation = self._create_reservation_entity(request_dto)
+            reservation = self._create_reservation_entity(self._with_cached_detail(request_dto))
+            
+            if not resume:
+                self.driver_manager.initialize(
+                    headless=self.settings.WEBDRIVER_HEADLESS,
+                    wait_timeout=self.settings.WEBDRIVER_TIMEOUT,
+                    poll_frequency=self.settings.WEBDRIVER_POLL_INTERVAL
+                )
             
-            self.driver_manager.initialize()
+            if self.settings.TRACE_ENABLED:
+                trace_recorder = TraceRecorder(self.settings.TRACE_DIR)
+                self.driver_manager.add_command_listener(trace_recorder.record_command)
             
-            repository = InterparkRepository(self.driver_manager)
-            use_case = MakeReservationUseCase(repository)
+            repository = InterparkRepository(self.driver_manager, self.settings, trace_recorder, cancel_token)
+            use_case = MakeReservationUseCase(repository, self.settings.MAX_SEAT_RETRY)
+            use_case.add_phase_listener(self.driver_manager.command_profiler.on_phase)
+            if trace_recorder:
+                use_case.add_phase_listener(trace_recorder.on_phase)
             
-            success = use_case.execute(reservation, progress_callback)
+            with self.cpu_profiler.profile("make_reservation"):
+                success = use_case.execute(reservation, progress_callback, cancel_token, resume=resume)
             
-            if success:
+            keep_browser = (not success and not cancel_token.is_cancelled
+                            and self.settings.RESUME_KEEP_BROWSER and use_case.completed_phase is not None)
+            
+            if cancel_token.is_cancelled:
+                return ReservationResponseDTO(
+                    success=False,
+                    message="예매가 중지되었습니다."
+                )
+            elif success:
                 return ReservationResponseDTO(
                     success=True,
                     message="좌석 선택이 완료되었습니다. 결제를 진행해주세요."
                 )
+            elif keep_browser:
+                return ReservationResponseDTO(
+                    success=False,
+                    message="예매에 실패했습니다. 다시 시작하면 열린 브라우저에서 이어서 진행합니다."
+                )
             else:
                 return ReservationResponseDTO(
                     success=False,
@@ -44,29 +102,58 @@ class ReservationService:
                 )
                 
         except Exception as e:
-            logger.error(f"Reservation service error: {str(e)}")
+            logger.error("Reservation service error: %s", e)
             return ReservationResponseDTO(
                 success=False,
                 message="예매 중 오류가 발생했습니다.",
                 error=str(e)
             )
         finally:
-            self.cleanup()
+            if trace_recorder:
+                self.driver_manager.remove_command_listener(trace_recorder.record_command)
+                trace_recorder.save()
+            if self.settings.COMMAND_REPORT_TOP_N:
+                self.driver_manager.command_profiler.log_report(self.settings.COMMAND_REPORT_TOP_N)
+            self.driver_manager.command_profiler.reset()
+            if keep_browser:
+                self._resumable_key = request_key
+                logger.info("브라우저 유지 - 다음 실행에서 이어서 진행")
+            else:
+                self.cleanup()
             
     def cleanup(self):
         """리소스 정리"""
+        self._resumable_key = None
         try:
-            self.driver_manager.quit()
+            if self._scope:
+                self._scope.dispose()
+                self._scope = None
+            elif self.driver_manager:
+                self.driver_manager.quit()
         except Exception as e:
-            logger.error(f"Cleanup error: {str(e)}")
+            logger.error("Cleanup error: %s", e)
+            
+    def _with_cached_detail(self, dto: ReservationRequestDTO) -> ReservationRequestDTO:
+        """좌석 등급 정보가 없으면 상세 정보 캐시에서 채움"""
+        if dto.seat_grades or not self.detail_cache:
+            return dto
             
+        match = re.search(r'/goods/(\d+)', dto.performance_url or '')
+        detail = self.detail_cache.get(match.group(1)) if match else None
+        if not detail or not detail.get('seat_grades'):
+            return dto
+            
+        logger.info("캐시된 좌석 등급 정보 사용: %s", match.group(1))
+        return replace(dto, seat_grades=detail['seat_grades'])
+        
     def _create_reservation_entity(self, dto: ReservationRequestDTO) -> Reservation:
         """DTO를 도메인 엔티티로 변환"""
         performance = Performance(
             name=dto.performance_name,
             url=dto.performance_url,
             date=dto.date,
-            time=dto.time
+            time=dto.time,
+            seat_grades=dto.seat_grades
         )
         
         seat_type_map = {
@@ -1,41 +1,180 @@
-from typing import Dict, Any, Type
+from enum import Enum
+from typing import Dict, Any, Type, Optional, Callable, List
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 
+class Lifetime(Enum):
+    """서비스 수명"""
+    SINGLETON = "singleton"  # 컨테이너 전체에서 하나
+    SCOPED = "scoped"        # 스코프(예: 예매 실행 1회)마다 하나
+    TRANSIENT = "transient"  # 요청할 때마다 새로 생성
+
+
+class Registration:
+    """서비스 등록 정보"""
+    
+    def __init__(self, factory: Callable[['DIContainer'], Any], lifetime: Lifetime,
+                 dispose: Optional[Callable[[Any], None]] = None):
+        self.factory = factory
+        self.lifetime = lifetime
+        self.dispose = dispose
+
+
 class DIContainer:
-    """간단한 의존성 주입 컨테이너"""
+    """간단한 의존성 주입 컨테이너
+    
+    팩토리는 처음 해결될 때 호출되며(지연 생성) 해결 중인 컨테이너를 인자로 받는다.
+    create_scope()로 만든 하위 컨테이너는 등록 정보와 싱글톤을 공유하고 SCOPED 서비스만 따로 가진다.
+    """
     
-    def __init__(self):
-        self._services: Dict[Type, Any] = {}
-        self._factories: Dict[Type, Any] = {}
+    def __init__(self, parent: Optional['DIContainer'] = None):
+        self._parent = parent
+        self._registrations: Dict[Type, Registration] = parent._registrations if parent else {}
+        self._instances: Dict[Type, Any] = {}
+        # 생성 순서대로 보관해 역순으로 정리
+        self._disposables: List[tuple] = []
+        self._lock = threading.RLock()
         
-    def register(self, interface: Type, implementation: Any = None, factory: Any = None):
-        """서비스 등록"""
-        if implementation:
-            self._services[interface] = implementation
+    def register(self, interface: Type, implementation: Any = None, factory: Any = None,
+                 lifetime: Lifetime = Lifetime.SINGLETON, dispose: Optional[Callable[[Any], None]] = None):
+        """서비스 등록 (implementation은 이미 만든 인스턴스, factory는 컨테이너를 받는 생성 함수)"""
+        if self._parent:
+            raise ValueError("Services must be registered on the root container")
+        if implementation is not None:
+            self._registrations[interface] = Registration(lambda c: implementation, Lifetime.SINGLETON)
+            self._instances[interface] = implementation
         elif factory:
-            self._factories[interface] = factory
+            self._registrations[interface] = Registration(factory, lifetime, dispose)
+            self._instances.pop(interface, None)
         else:
             raise ValueError("Implementation or factory must be provided")
             
     def resolve(self, interface: Type) -> Any:
         """서비스 해결"""
-        if interface in self._services:
-            return self._services[interface]
+        registration = self._registrations.get(interface)
+        if registration is None:
+            raise ValueError(f"Service {interface} not registered")
             
-        if interface in self._factories:
-            instance = self._factories[interface]()
-            self._services[interface] = instance
-            return instance
+        if registration.lifetime == Lifetime.TRANSIENT:
+            return registration.factory(self)
+            
+        if registration.lifetime == Lifetime.SINGLETON:
+            return self._root()._get_or_create(interface, registration)
             
-        raise ValueError(f"Service {interface} not registered")
+        if self._parent is None:
+            raise ValueError(f"Scoped service {interface} must be resolved from a scope")
+        return self._get_or_create(interface, registration)
+        
+    def is_registered(self, interface: Type) -> bool:
+        return interface in self._registrations
         
+    def create_scope(self) -> 'DIContainer':
+        """하위 스코프 생성 (with 문으로 사용하면 끝날 때 SCOPED 서비스 정리)"""
+        return DIContainer(parent=self._root())
+        
+    def dispose(self):
+        """이 컨테이너가 만든 인스턴스 정리 (생성 역순)"""
+        with self._lock:
+            disposables = list(reversed(self._disposables))
+            self._disposables.clear()
+            self._instances.clear()
+            
+        for interface, instance, dispose in disposables:
+            try:
+                dispose(instance)
+            except Exception as e:
+                logger.error("서비스 정리 실패 (%s): %s", getattr(interface, '__name__', interface), e)
+                
     def clear(self):
         """컨테이너 초기화"""
-        self._services.clear()
-        self._factories.clear()
+        self.dispose()
+        if self._parent is None:
+            self._registrations.clear()
+            
+    def __enter__(self) -> 'DIContainer':
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.dispose()
+        
+    def _root(self) -> 'DIContainer':
+        return self._parent._root() if self._parent else self
+        
+    def _get_or_create(self, interface: Type, registration: Registration) -> Any:
+        with self._lock:
+            if interface in self._instances:
+                return self._instances[interface]
+                
+            instance = registration.factory(self)
+            self._instances[interface] = instance
+            if registration.dispose:
+                self._disposables.append((interface, instance, registration.dispose))
+            return instance
+
+
+container = DIContainer()
 
 
-container = DIContainer()
\ No newline at end of file
+def configure_container(target: DIContainer = container) -> DIContainer:
+    """설정을 로드하고 애플리케이션 서비스 구성 (컴포지션 루트)"""
+    from config.settings import Settings
+    from infrastructure.http_client.http_transport import HttpTransport
+    from infrastructure.cache.detail_cache import PerformanceDetailCache, StaticDetailCache
+    from infrastructure.cache.catalog_snapshot import CatalogSnapshot
+    from infrastructure.cache.search_result_cache import SearchResultCache
+    from infrastructure.profiling.cpu_profiler import CpuProfiler
+    from infrastructure.interpark.performance_crawler import PerformanceCrawler
+    from infrastructure.interpark.detail_prefetcher import DetailPrefetcher
+    from infrastructure.interpark.catalog_pipeline import CatalogPipeline
+    from infrastructure.concurrency.keyed_executor import KeyedExecutor
+    from infrastructure.web_driver.driver_manager import WebDriverManager
+    from application.services.reservation_service import ReservationService
+    
+    Settings.load()
+    target.clear()
+    
+    target.register(Settings, implementation=Settings)
+    
+    # 프로세스 전체에서 공유 (세션, 캐시, 작업자 풀)
+    target.register(HttpTransport, factory=lambda c: HttpTransport.from_settings(c.resolve(Settings)),
+                    dispose=lambda transport: transport.close())
+    target.register(PerformanceDetailCache, factory=lambda c: PerformanceDetailCache.from_settings(c.resolve(Settings)))
+    target.register(StaticDetailCache, factory=lambda c: StaticDetailCache.from_settings(c.resolve(Settings)))
+    target.register(CatalogSnapshot, factory=lambda c: CatalogSnapshot.from_settings(c.resolve(Settings)))
+    target.register(SearchResultCache, factory=lambda c: SearchResultCache.from_settings(c.resolve(Settings)))
+    target.register(CpuProfiler, factory=lambda c: CpuProfiler.from_settings(c.resolve(Settings)))
+    target.register(PerformanceCrawler, factory=lambda c: PerformanceCrawler(
+        transport=c.resolve(HttpTransport),
+        settings=c.resolve(Settings),
+        detail_cache=c.resolve(PerformanceDetailCache),
+        cpu_profiler=c.resolve(CpuProfiler)
+    ))
+    # 정적 HTML에서 파싱한 상세 정보는 브라우저로 추출한 캐시와 분리 (예매에는 사용하지 않음)
+    target.register(CatalogPipeline, factory=lambda c: CatalogPipeline.from_settings(
+        c.resolve(HttpTransport),
+        c.resolve(CatalogSnapshot),
+        c.resolve(StaticDetailCache),
+        c.resolve(Settings)
+    ))
+    target.register(KeyedExecutor, factory=lambda c: KeyedExecutor.from_settings(c.resolve(Settings)),
+                    dispose=lambda executor: executor.shutdown())
+    target.register(DetailPrefetcher, factory=lambda c: DetailPrefetcher(
+        c.resolve(PerformanceCrawler).get_performance_detail,
+        executor=c.resolve(KeyedExecutor)
+    ), dispose=lambda prefetcher: prefetcher.shutdown())
+    
+    # 예매 실행마다 새 브라우저 (스코프 종료 시 종료)
+    target.register(WebDriverManager, factory=lambda c: WebDriverManager(),
+                    lifetime=Lifetime.SCOPED, dispose=lambda manager: manager.quit())
+    
+    target.register(ReservationService, factory=lambda c: ReservationService(
+        settings=c.resolve(Settings),
+        detail_cache=c.resolve(PerformanceDetailCache),
+        cpu_profiler=c.resolve(CpuProfiler),
+        scope_factory=c.create_scope
+    ), dispose=lambda service: service.cleanup())
+    
+    return target
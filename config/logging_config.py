@@ -0,0 +1,167 @@
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, TextIO
+
+from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class EnqueueStats:
+    """로그 기록 호출이 호출 스레드에서 쓴 시간 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, duration: float):
+        with self._lock:
+            self.count += 1
+            self.total += duration
+            self.max = max(self.max, duration)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'count': self.count,
+                'avg_us': self.total / self.count * 1e6 if self.count else 0.0,
+                'max_us': self.max * 1e6
+            }
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷하지 않고 큐에만 넣는 핸들러
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 포맷하지만,
+    같은 프로세스 안의 큐이므로 포맷(% 치환, 예외 문자열화)은 리스너 스레드에 맡긴다.
+    다만 리스너가 포맷하기 전에 호출 측이 인자를 바꿀 수 있으므로 변경 가능한 인자는 복사해 둔다.
+    """
+
+    IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), tuple, frozenset)
+
+    def __init__(self, log_queue, stats: EnqueueStats):
+        super().__init__(log_queue)
+        self.stats = stats
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if isinstance(record.args, dict):
+            record.args = {key: self._snapshot(value) for key, value in record.args.items()}
+        elif record.args:
+            record.args = tuple(self._snapshot(arg) for arg in record.args)
+        return record
+
+    @classmethod
+    def _snapshot(cls, value):
+        """로그 인자의 기록 시점 값 (복사할 수 없으면 repr 문자열)"""
+        if isinstance(value, cls.IMMUTABLE_TYPES):
+            return value
+        try:
+            return copy.copy(value)
+        except Exception:
+            return repr(value)
+
+    def emit(self, record: logging.LogRecord):
+        started = time.perf_counter()
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+        self.stats.add(time.perf_counter() - started)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class LoggingPipeline:
+    """QueueHandler → QueueListener 로그 파이프라인
+
+    애플리케이션 스레드는 큐에 넣기만 하고 콘솔/파일 출력은 리스너 스레드가 담당한다.
+    """
+
+    def __init__(self, settings=Settings, stream: Optional[TextIO] = None):
+        self.stats = EnqueueStats()
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = NonBlockingQueueHandler(self.queue, self.stats)
+
+        console = logging.StreamHandler(stream or sys.stderr)
+        console.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+        handlers = [console]
+
+        if settings.LOG_FILE:
+            directory = os.path.dirname(settings.LOG_FILE)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                settings.LOG_FILE, maxBytes=settings.LOG_FILE_MAX_BYTES,
+                backupCount=settings.LOG_FILE_BACKUPS, encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(file_handler)
+
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+    def start(self, settings=Settings):
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(settings.LOG_LEVEL)
+
+        # 모듈별 로그 레벨 (예: {"infrastructure.interpark": "DEBUG"})
+        for name, level in settings.LOG_LEVELS.items():
+            logging.getLogger(name).setLevel(level)
+
+        self.listener.start()
+
+    def stop(self):
+        """남은 로그를 모두 출력하고 리스너 종료"""
+        stats = self.stats.snapshot()
+        logger.info("로그 기록 %s건, 호출 스레드 평균 %.1fus / 최대 %.1fus",
+                    stats['count'], stats['avg_us'], stats['max_us'])
+        self.listener.stop()
+        logging.getLogger().removeHandler(self.queue_handler)
+
+
+_pipeline: Optional[LoggingPipeline] = None
+
+
+def configure_logging(settings=Settings, stream: Optional[TextIO] = None) -> LoggingPipeline:
+    """로그 파이프라인 구성 (이미 구성돼 있으면 교체)"""
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.stop()
+
+    _pipeline = LoggingPipeline(settings, stream)
+    _pipeline.start(settings)
+    Settings.flush_pending_logs()
+    return _pipeline
+
+
+def shutdown_logging():
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
@@ -1,25 +1,137 @@
+import json
+import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class Settings:
-    """애플리케이션 설정"""
-    
+    """애플리케이션 설정
+
+    기본값 → 프로파일 → 설정 파일 → 환경 변수(INTERPARK_<이름>) 순서로 덮어쓴다.
+    """
+
+    ENV_PREFIX = "INTERPARK_"
+    SETTINGS_FILE = os.getenv("INTERPARK_SETTINGS_FILE", "settings.json")
+    PROFILE = "default"
+
     # WebDriver 설정
     WEBDRIVER_TIMEOUT = 10
     WEBDRIVER_HEADLESS = False
-    
+    # 대기 조건 확인 간격 (취소 반응 시간의 상한)
+    WEBDRIVER_POLL_INTERVAL = 0.2
+
     # 재시도 설정
     MAX_QUEUE_RETRY = 60
     MAX_SEAT_RETRY = 100
-    
+    # 대기열 통과 후 실패하면 브라우저를 유지해 다음 실행에서 이어서 진행
+    RESUME_KEEP_BROWSER = True
+    QUEUE_RETRY_INTERVAL = 0.5
+
+    # 대기 설정 (초)
+    SEAT_FRAME_SETTLE_DELAY = 1.0
+    DETAIL_PAGE_LOAD_DELAY = 3.0
+    DETAIL_CLICK_DELAY = 1.0
+    COUNTDOWN_POLL_INTERVAL = 0.1
+    COUNTDOWN_IDLE_INTERVAL = 10.0
+
+    # HTTP 설정
+    HTTP_CONNECT_TIMEOUT = 3.05
+    HTTP_READ_TIMEOUT = 10.0
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.3
+    HTTP_POOL_MAXSIZE = 20
+
+    # 공연 검색 설정
+    SEARCH_DEBOUNCE_MS = 300
+    SEARCH_MIN_CHARS = 2
+    SEARCH_CACHE_SIZE = 64
+    SEARCH_CACHE_TTL = 600
+    DETAIL_PREFETCH_TOP_K = 3
+
+    # 검색 다이얼로그 백그라운드 작업자 수, 동시에 띄우는 브라우저 수 제한
+    BACKGROUND_WORKERS = 4
+    MAX_BROWSER_JOBS = 2
+
+    # UI 응답성 측정 (하트비트 주기, 경고 기준 - 밀리초)
+    UI_LAG_INTERVAL_MS = 100
+    UI_LAG_WARN_MS = 200
+
+    # 로컬 캐시 설정 (CACHE_DIR를 비우면 디스크 캐시 끔)
+    CACHE_DIR = "cache"
+    DETAIL_CACHE_TTL = 6 * 3600
+
+    # 공연 목록 동기화 파이프라인 (가져오기 스레드 수, 파싱 프로세스 수 - 0이면 CPU 코어 수, 파싱 대기 큐 크기)
+    CATALOG_FETCH_WORKERS = 8
+    CATALOG_PARSE_WORKERS = 0
+    CATALOG_QUEUE_SIZE = 64
+
+    # 좌석 점수 가중치 (SeatScoringWeights 필드명: 값)
+    SEAT_SCORE_WEIGHTS: Dict[str, Any] = {}
+    SEAT_PLAN_DEPTH = 64
+    SEAT_PLAN_REFRESH_RATIO = 0.2
+
+    # 좌석 조회/클릭을 chromedriver 대신 DevTools 프로토콜로 직접 실행 (websocket-client 필요)
+    CDP_BACKEND_ENABLED = False
+
+    # WebDriver 명령 통계 (실행 후 상위 N개 로그 출력, 0이면 끔)
+    COMMAND_REPORT_TOP_N = 10
+
+    # 추적 설정
+    TRACE_ENABLED = False
+    TRACE_DIR = "traces"
+
+    # CPU 프로파일링 (예매 실행/크롤러 호출마다 cProfile 기록)
+    CPU_PROFILE_ENABLED = False
+    CPU_PROFILE_DIR = "profiles"
+    CPU_PROFILE_KEEP = 20
+    CPU_PROFILE_TOP_N = 20
+
     # 로그 설정
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+    LOG_LEVELS: Dict[str, str] = {}
+    LOG_FILE = "logs/interpark.jsonl"
+    LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+    LOG_FILE_BACKUPS = 3
+    LOG_VIEW_MAX_LINES = 2000
+    LOG_VIEW_DRAIN_MS = 100
+
     # OCR 설정
     TESSERACT_CONFIG = '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    
+
+    # 지연 시간 프로파일
+    PROFILES: Dict[str, Dict[str, Any]] = {
+        "default": {},
+        "fast-local": {
+            "WEBDRIVER_TIMEOUT": 5,
+            "MAX_QUEUE_RETRY": 150,
+            "QUEUE_RETRY_INTERVAL": 0.2,
+            "SEAT_FRAME_SETTLE_DELAY": 0.3,
+            "DETAIL_PAGE_LOAD_DELAY": 1.5,
+            "DETAIL_CLICK_DELAY": 0.5,
+            "COUNTDOWN_POLL_INTERVAL": 0.05,
+            "HTTP_CONNECT_TIMEOUT": 2.0,
+            "HTTP_READ_TIMEOUT": 5.0
+        },
+        "conservative": {
+            "WEBDRIVER_TIMEOUT": 20,
+            "QUEUE_RETRY_INTERVAL": 1.0,
+            "SEAT_FRAME_SETTLE_DELAY": 2.0,
+            "DETAIL_PAGE_LOAD_DELAY": 5.0,
+            "DETAIL_CLICK_DELAY": 1.5,
+            "HTTP_READ_TIMEOUT": 20.0,
+            "HTTP_MAX_RETRIES": 5,
+            "HTTP_BACKOFF_FACTOR": 0.5,
+            "MAX_BROWSER_JOBS": 1
+        }
+    }
+
+    _defaults: Optional[Dict[str, Any]] = None
+    # 로깅 구성 전에 load()가 남긴 로그 (configure_logging에서 출력)
+    _pending_logs: List[Tuple[int, str, tuple]] = []
+
     @classmethod
     def get_all_settings(cls) -> Dict[str, Any]:
         """모든 설정 반환"""
@@ -27,4 +139,92 @@ class Settings:
             attr: getattr(cls, attr)
             for attr in dir(cls)
             if not callable(getattr(cls, attr)) and not attr.startswith("_")
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def load(cls, config_file: Optional[str] = None) -> None:
+        """설정 계층 적용 (기본값 → 프로파일 → 파일 → 환경 변수)"""
+        if cls._defaults is None:
+            cls._defaults = cls.get_all_settings()
+        else:
+            cls._apply(cls._defaults)
+
+        file_values = cls._read_file(config_file or cls.SETTINGS_FILE)
+        env_values = cls._read_env()
+
+        profile = env_values.get("PROFILE") or file_values.get("PROFILE") or cls.PROFILE
+        if profile not in cls.PROFILES:
+            cls._log(logging.WARNING, "알 수 없는 설정 프로파일: %s - 기본값 사용", profile)
+            profile = "default"
+
+        cls._apply(cls.PROFILES[profile])
+        cls._apply(file_values)
+        cls._apply(env_values)
+        cls.PROFILE = profile
+
+        cls._log(logging.INFO, "설정 로드 완료 (프로파일: %s)", profile)
+
+    @classmethod
+    def flush_pending_logs(cls) -> None:
+        """로깅 구성 전에 남긴 로그 출력"""
+        pending, cls._pending_logs = cls._pending_logs, []
+        for level, message, args in pending:
+            logger.log(level, message, *args)
+
+    @classmethod
+    def _log(cls, level: int, message: str, *args) -> None:
+        # 아직 로그 핸들러가 없으면 모아 두었다가 configure_logging 이후 출력
+        if logging.getLogger().handlers:
+            logger.log(level, message, *args)
+        else:
+            cls._pending_logs.append((level, message, args))
+
+    @classmethod
+    def _read_file(cls, path: str) -> Dict[str, Any]:
+        """JSON 설정 파일 읽기"""
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                values = json.load(f)
+            return {key.upper(): value for key, value in values.items()}
+        except Exception as e:
+            cls._log(logging.ERROR, "설정 파일 읽기 실패 (%s): %s", path, e)
+            return {}
+
+    @classmethod
+    def _read_env(cls) -> Dict[str, Any]:
+        """INTERPARK_ 접두사 환경 변수 읽기"""
+        values = {}
+        for key, raw in os.environ.items():
+            if not key.startswith(cls.ENV_PREFIX):
+                continue
+            name = key[len(cls.ENV_PREFIX):]
+            if name == "PROFILE" or hasattr(cls, name):
+                values[name] = raw
+        return values
+
+    @classmethod
+    def _apply(cls, values: Dict[str, Any]) -> None:
+        """알려진 설정 키에 값 적용 (기존 타입으로 변환)"""
+        for name, value in values.items():
+            if name.startswith("_") or not hasattr(cls, name) or callable(getattr(cls, name)):
+                continue
+            try:
+                setattr(cls, name, cls._coerce(getattr(cls, name), value))
+            except (TypeError, ValueError) as e:
+                cls._log(logging.ERROR, "잘못된 설정 값 %s=%r: %s", name, value, e)
+
+    @staticmethod
+    def _coerce(current: Any, value: Any) -> Any:
+        if not isinstance(value, str) or isinstance(current, str):
+            return value
+        if isinstance(current, bool):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        if isinstance(current, int):
+            return int(value)
+        if isinstance(current, float):
+            return float(value)
+        if isinstance(current, dict):
+            return json.loads(value)
+        return value
@@ -0,0 +1,34 @@
+import threading
+
+
+class OperationCancelledError(Exception):
+    """취소 토큰에 의해 작업이 중단됨"""
+    pass
+
+
+class CancellationToken:
+    """여러 계층에 전달되는 협조적 취소 토큰"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+        
+    def cancel(self):
+        """취소 요청"""
+        self._event.set()
+        
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+        
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelledError("Operation cancelled")
+            
+    def wait(self, timeout: float) -> bool:
+        """timeout 동안 대기하되 취소되면 즉시 True 반환"""
+        return self._event.wait(timeout)
+        
+    def sleep(self, seconds: float):
+        """취소 가능한 sleep (취소 시 OperationCancelledError)"""
+        if self._event.wait(seconds):
+            raise OperationCancelledError("Operation cancelled")
@@ -4,7 +4,8 @@ from .reservation import (
     SeatPreference,
     UserCredentials,
     SeatSelectionType,
-    SeatDirection
+    SeatDirection,
+    ReservationPhase
 )
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     'SeatPreference',
     'UserCredentials',
     'SeatSelectionType',
-    'SeatDirection'
+    'SeatDirection',
+    'ReservationPhase'
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from enum import Enum
 
 
@@ -15,12 +15,20 @@ class SeatDirection(Enum):
     LEFT = "left"
 
 
+class ReservationPhase(Enum):
+    QUEUE = "queue"
+    RESERVATION_WINDOW = "reservation_window"
+    CAPTCHA = "captcha"
+    SEAT_SELECTION = "seat_selection"
+
+
 @dataclass
 class Performance:
     name: str
     url: str
     date: str
     time: str
+    seat_grades: Optional[List[Dict]] = None
     
     def __post_init__(self):
         if not self.name or not self.url:
@@ -53,8 +61,4 @@ class Reservation:
     performance: Performance
     target_time: datetime
     seat_preference: SeatPreference
-    credentials: Optional[UserCredentials] = None
-    
-    def __post_init__(self):
-        if self.target_time <= datetime.now():
-            raise ValueError("Target time must be in the future")
\ No newline at end of file
+    credentials: Optional[UserCredentials] = None
\ No newline at end of file
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional
-from domain.entities import Reservation
+from domain.entities import Reservation, ReservationPhase
 
 
 class ReservationRepository(ABC):
@@ -27,4 +27,8 @@ class ReservationRepository(ABC):
     @abstractmethod
     def handle_seat_conflict(self) -> bool:
         """좌석 충돌 처리"""
-        pass
\ No newline at end of file
+        pass
+    
+    def detect_phase(self) -> Optional[ReservationPhase]:
+        """현재 상태에서 이어서 진행할 단계 (알 수 없으면 None - 처음부터 진행)"""
+        return None
\ No newline at end of file
@@ -1,59 +1,141 @@
 import logging
-from typing import Callable, Optional
-from domain.entities import Reservation
+from typing import Callable, List, Optional
+from domain.cancellation import CancellationToken, OperationCancelledError
+from domain.entities import Reservation, ReservationPhase
 from domain.repositories.reservation_repository import ReservationRepository
 
 logger = logging.getLogger(__name__)
 
+# 예매 단계 순서 (각 단계를 통과하면 체크포인트)
+PHASE_ORDER = [
+    ReservationPhase.QUEUE,
+    ReservationPhase.RESERVATION_WINDOW,
+    ReservationPhase.CAPTCHA,
+    ReservationPhase.SEAT_SELECTION
+]
+
+PHASE_LABELS = {
+    ReservationPhase.QUEUE: "대기열",
+    ReservationPhase.RESERVATION_WINDOW: "예매창",
+    ReservationPhase.CAPTCHA: "보안문자",
+    ReservationPhase.SEAT_SELECTION: "좌석 선택"
+}
+
 
 class MakeReservationUseCase:
-    def __init__(self, repository: ReservationRepository):
+    def __init__(self, repository: ReservationRepository, max_retry_attempts: int = 100):
         self.repository = repository
-        self.max_retry_attempts = 100
+        self.max_retry_attempts = max_retry_attempts
+        self._phase_listeners: List[Callable[[ReservationPhase], None]] = []
+        self._cancel_token: Optional[CancellationToken] = None
+        # 마지막으로 통과한 단계 (실패 후 이어서 진행 가능한지 판단용)
+        self.completed_phase: Optional[ReservationPhase] = None
+        self._phase_steps = {
+            ReservationPhase.QUEUE: self._enter_queue,
+            ReservationPhase.RESERVATION_WINDOW: self._enter_reservation_window,
+            ReservationPhase.CAPTCHA: self._solve_captcha,
+            ReservationPhase.SEAT_SELECTION: self._select_seats
+        }
+        
+    def add_phase_listener(self, listener: Callable[[ReservationPhase], None]):
+        """단계 전환 알림 리스너 등록"""
+        self._phase_listeners.append(listener)
         
     def execute(self, reservation: Reservation, 
-                progress_callback: Optional[Callable[[str], None]] = None) -> bool:
+                progress_callback: Optional[Callable[[str], None]] = None,
+                cancel_token: Optional[CancellationToken] = None,
+                resume: bool = False) -> bool:
+        """예매 실행 (resume이면 브라우저에 남은 진행 상태를 확인해 완료된 단계는 건너뜀)"""
+        self._cancel_token = cancel_token
+        self.completed_phase = None
         try:
-            self._log_progress("대기열 진입 시도 중...", progress_callback)
+            start_phase = self._resume_phase(progress_callback) if resume else ReservationPhase.QUEUE
+            start_index = PHASE_ORDER.index(start_phase)
+            if start_index > 0:
+                self.completed_phase = PHASE_ORDER[start_index - 1]
             
-            if not self.repository.enter_queue(reservation):
-                self._log_progress("대기열 진입 실패", progress_callback)
-                return False
+            for phase in PHASE_ORDER[start_index:]:
+                self._enter_phase(phase)
+                if not self._phase_steps[phase](reservation, progress_callback):
+                    return False
+                self.completed_phase = phase
                 
-            self._log_progress("예매창 진입 중...", progress_callback)
+            return True
             
-            if not self.repository.enter_reservation_window():
-                self._log_progress("예매창 진입 실패", progress_callback)
-                return False
-                
-            self._log_progress("보안문자 처리 중...", progress_callback)
-            
-            captcha_result = self.repository.solve_captcha()
-            if captcha_result is None:
-                self._log_progress("보안문자 처리 실패", progress_callback)
-                return False
-                
-            self._log_progress("좌석 선택 중...", progress_callback)
-            
-            for attempt in range(self.max_retry_attempts):
-                if self.repository.select_seats(reservation):
-                    self._log_progress("좌석 선택 성공!", progress_callback)
-                    return True
-                    
-                if not self.repository.handle_seat_conflict():
-                    continue
-                    
-                self._log_progress(f"좌석 선택 재시도 중... ({attempt + 1}/{self.max_retry_attempts})", 
-                                 progress_callback)
-                
-            self._log_progress("좌석 선택 실패 (최대 재시도 횟수 초과)", progress_callback)
+        except OperationCancelledError:
+            self._log_progress("예매가 취소되었습니다.", progress_callback)
             return False
             
         except Exception as e:
-            logger.error(f"예매 중 오류 발생: {str(e)}")
+            logger.error("예매 중 오류 발생: %s", e)
             self._log_progress(f"오류 발생: {str(e)}", progress_callback)
             return False
             
+    def _resume_phase(self, progress_callback: Optional[Callable[[str], None]]) -> ReservationPhase:
+        """이어서 진행할 단계 (브라우저 상태로 확인할 수 없으면 처음부터)"""
+        phase = self.repository.detect_phase()
+        if phase is None or phase == ReservationPhase.QUEUE:
+            return ReservationPhase.QUEUE
+            
+        self._log_progress(f"이전 진행 상태에서 재개: {PHASE_LABELS[phase]}", progress_callback)
+        return phase
+        
+    def _enter_queue(self, reservation: Reservation, progress_callback) -> bool:
+        self._log_progress("대기열 진입 시도 중...", progress_callback)
+        
+        if not self.repository.enter_queue(reservation):
+            self._log_progress("대기열 진입 실패", progress_callback)
+            return False
+        return True
+        
+    def _enter_reservation_window(self, reservation: Reservation, progress_callback) -> bool:
+        self._log_progress("예매창 진입 중...", progress_callback)
+        
+        if not self.repository.enter_reservation_window():
+            self._log_progress("예매창 진입 실패", progress_callback)
+            return False
+        return True
+        
+    def _solve_captcha(self, reservation: Reservation, progress_callback) -> bool:
+        self._log_progress("보안문자 처리 중...", progress_callback)
+        
+        captcha_result = self.repository.solve_captcha()
+        if captcha_result is None:
+            self._log_progress("보안문자 처리 실패", progress_callback)
+            return False
+        return True
+        
+    def _select_seats(self, reservation: Reservation, progress_callback) -> bool:
+        self._log_progress("좌석 선택 중...", progress_callback)
+        
+        for attempt in range(self.max_retry_attempts):
+            self._check_cancelled()
+            
+            if self.repository.select_seats(reservation):
+                self._log_progress("좌석 선택 성공!", progress_callback)
+                return True
+                
+            if not self.repository.handle_seat_conflict():
+                continue
+                
+            self._log_progress(f"좌석 선택 재시도 중... ({attempt + 1}/{self.max_retry_attempts})", 
+                             progress_callback)
+            
+        self._log_progress("좌석 선택 실패 (최대 재시도 횟수 초과)", progress_callback)
+        return False
+        
+    def _check_cancelled(self):
+        if self._cancel_token:
+            self._cancel_token.raise_if_cancelled()
+            
+    def _enter_phase(self, phase: ReservationPhase):
+        self._check_cancelled()
+        for listener in self._phase_listeners:
+            try:
+                listener(phase)
+            except Exception as e:
+                logger.error("단계 리스너 오류: %s", e)
+                
     def _log_progress(self, message: str, callback: Optional[Callable[[str], None]]):
         logger.info(message)
         if callback:
@@ -0,0 +1,136 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CatalogDiff:
+    """두 공연 목록 사이의 변경 내용 (공연 ID 기준)"""
+    added: List[Dict] = field(default_factory=list)
+    removed: List[Dict] = field(default_factory=list)
+    changed: List[Dict] = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+class CatalogSnapshot:
+    """마지막으로 파싱한 공연 목록 스냅샷 (다이얼로그 즉시 표시용)
+
+    필드 이름은 한 번만 저장하고 공연은 값 배열로 저장해 파일을 작게 유지한다.
+    """
+
+    FORMAT_VERSION = 1
+    FIELDS = ('id', 'name', 'place', 'start_date', 'end_date', 'poster_url', 'url')
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.saved_at: Optional[float] = None
+        self._performances: Optional[List[Dict]] = None
+        self._lock = threading.Lock()
+        # 읽고 합쳐서 저장하는 동안 다른 갱신이 끼어들지 않도록 함
+        self._upsert_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "CatalogSnapshot":
+        return cls(os.path.join(settings.CACHE_DIR, "catalog.json") if settings.CACHE_DIR else None)
+
+    def load(self) -> Optional[List[Dict]]:
+        """스냅샷 읽기 (한 번 읽은 뒤에는 메모리에서 반환)"""
+        with self._lock:
+            if self._performances is None:
+                self._performances = self._read_file()
+            return list(self._performances) if self._performances is not None else None
+
+    def save(self, performances: List[Dict]):
+        """스냅샷 교체 (빈 목록은 저장하지 않음)"""
+        if not performances:
+            return
+
+        saved_at = time.time()
+        with self._lock:
+            self._performances = list(performances)
+            self.saved_at = saved_at
+
+        if not self.path:
+            return
+
+        payload = {
+            'v': self.FORMAT_VERSION,
+            'saved_at': saved_at,
+            'fields': self.FIELDS,
+            'rows': [[perf.get(name, '') for name in self.FIELDS] for perf in performances]
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            temp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+            logger.debug("공연 목록 스냅샷 저장: %s개", len(performances))
+        except OSError as e:
+            logger.error("공연 목록 스냅샷 저장 실패: %s", e)
+
+    def upsert(self, performances: List[Dict]):
+        """공연 ID 기준으로 기존 스냅샷에 반영 (새로 받은 공연을 앞에 두고 나머지는 기존 순서 유지)"""
+        if not performances:
+            return
+
+        with self._upsert_lock:
+            existing = self.load() or []
+            merged = {perf['id']: perf for perf in existing}
+            fresh: Dict[str, Dict] = {}
+            for performance in performances:
+                fresh.setdefault(performance['id'], dict(merged.get(performance['id'], {}))).update(performance)
+            ordered = list(fresh.values())
+            ordered.extend(perf for perf in existing if perf['id'] not in fresh)
+            self.save(ordered)
+
+    @staticmethod
+    def diff(old: List[Dict], new: List[Dict]) -> CatalogDiff:
+        """공연 ID 기준으로 추가/삭제/변경된 공연 계산"""
+        old_by_id = {perf.get('id'): perf for perf in old}
+        new_ids = set()
+        result = CatalogDiff()
+
+        for perf in new:
+            performance_id = perf.get('id')
+            new_ids.add(performance_id)
+            previous = old_by_id.get(performance_id)
+            if previous is None:
+                result.added.append(perf)
+            elif previous != perf:
+                result.changed.append(perf)
+
+        result.removed = [perf for perf in old if perf.get('id') not in new_ids]
+        return result
+
+    def _read_file(self) -> Optional[List[Dict]]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            if not content:
+                return None
+            payload = json.loads(content)
+
+            if payload.get('v') != self.FORMAT_VERSION:
+                logger.info("공연 목록 스냅샷 형식이 달라 무시합니다.")
+                return None
+
+            fields = payload['fields']
+            self.saved_at = payload.get('saved_at')
+            return [dict(zip(fields, row)) for row in payload['rows']]
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error("공연 목록 스냅샷 읽기 실패: %s", e)
+            return None
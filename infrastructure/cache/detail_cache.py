@@ -0,0 +1,141 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ISO_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+PERFORMANCE_ID_PATTERN = re.compile(r'[\w-]+')
+
+
+class PerformanceDetailCache:
+    """공연 상세 정보 캐시 (메모리 + 공연별 JSON 파일, TTL 적용)
+
+    이미 지난 공연 날짜는 꺼낼 때 제외하고, 남은 날짜가 없으면 항목을 버린다.
+    """
+
+    DIRECTORY = "details"
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = 6 * 3600, max_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "PerformanceDetailCache":
+        cache_dir = os.path.join(settings.CACHE_DIR, cls.DIRECTORY) if settings.CACHE_DIR else None
+        return cls(cache_dir=cache_dir, ttl=settings.DETAIL_CACHE_TTL)
+
+    def get(self, performance_id: str) -> Optional[Dict]:
+        """유효한 상세 정보 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(performance_id)
+            if entry is not None:
+                self._entries.move_to_end(performance_id)
+
+        if entry is None:
+            entry = self._read_file(performance_id)
+            if entry is None:
+                return None
+            self._remember(performance_id, entry)
+
+        if time.time() - entry['saved_at'] > self.ttl:
+            logger.debug("상세 정보 캐시 만료: %s", performance_id)
+            self.invalidate(performance_id)
+            return None
+
+        detail = self._drop_past_dates(entry['detail'])
+        if detail is None:
+            logger.debug("상세 정보 캐시의 공연 날짜가 모두 지남: %s", performance_id)
+            self.invalidate(performance_id)
+        return detail
+
+    def put(self, performance_id: str, detail: Dict):
+        entry = {'saved_at': time.time(), 'detail': detail}
+        self._remember(performance_id, entry)
+        self._write_file(performance_id, entry)
+
+    def invalidate(self, performance_id: str):
+        with self._lock:
+            self._entries.pop(performance_id, None)
+
+        path = self._path(performance_id)
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error("상세 정보 캐시 파일 삭제 실패: %s", e)
+
+    def _remember(self, performance_id: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[performance_id] = entry
+            self._entries.move_to_end(performance_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _drop_past_dates(detail: Dict) -> Optional[Dict]:
+        dates = detail.get('dates') or []
+        if not dates:
+            return detail
+
+        today = date.today().isoformat()
+        upcoming = [d for d in dates if not ISO_DATE_PATTERN.fullmatch(d) or d >= today]
+        if not upcoming:
+            return None
+        if len(upcoming) == len(dates):
+            return detail
+        return {**detail, 'dates': upcoming}
+
+    def _path(self, performance_id: str) -> Optional[str]:
+        if not self.cache_dir or not PERFORMANCE_ID_PATTERN.fullmatch(performance_id):
+            return None
+        return os.path.join(self.cache_dir, f"{performance_id}.json")
+
+    def _read_file(self, performance_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path(performance_id)
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+            if 'saved_at' in entry and 'detail' in entry:
+                return entry
+        except (OSError, ValueError) as e:
+            logger.error("상세 정보 캐시 파일 읽기 실패: %s", e)
+        return None
+
+    def _write_file(self, performance_id: str, entry: Dict[str, Any]):
+        path = self._path(performance_id)
+        if not path:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체해 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 함
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error("상세 정보 캐시 파일 저장 실패: %s", e)
+
+
+class StaticDetailCache(PerformanceDetailCache):
+    """카탈로그 파이프라인이 정적 HTML에서 파싱한 상세 정보 (source='static')
+
+    휴리스틱 결과이므로 공연 선택 화면의 날짜/시간 미리보기에만 사용하고 예매에는 사용하지 않는다.
+    """
+
+    DIRECTORY = "static_details"
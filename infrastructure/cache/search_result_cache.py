@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """검색어별 검색 결과 LRU 캐시 (TTL 적용)"""
+
+    def __init__(self, max_entries: int = 64, ttl: float = 600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "SearchResultCache":
+        return cls(max_entries=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL)
+
+    def get(self, keyword: str) -> Optional[List[Dict]]:
+        key = self._normalize(keyword)
+        with self._lock:
+            return self._get_locked(key)
+
+    def put(self, keyword: str, results: List[Dict]):
+        """성공한 검색 결과만 저장할 것 (실패를 빈 목록으로 저장하면 TTL 동안 결과가 비어 보임)"""
+        key = self._normalize(keyword)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refine_from_prefix(self, keyword: str) -> Optional[List[Dict]]:
+        """캐시된 가장 긴 접두어 결과를 현재 검색어로 로컬 필터링"""
+        key = self._normalize(keyword)
+        with self._lock:
+            for length in range(len(key) - 1, 0, -1):
+                prefix_results = self._get_locked(key[:length])
+                if prefix_results is not None:
+                    break
+            else:
+                return None
+
+        refined = [perf for perf in prefix_results if self._matches(perf, key)]
+        logger.debug("접두어 캐시로 검색어 '%s' 결과 %s건 추정", keyword, len(refined))
+        return refined
+
+    def _get_locked(self, key: str) -> Optional[List[Dict]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        saved_at, results = entry
+        if time.monotonic() - saved_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    @staticmethod
+    def _matches(performance: Dict, key: str) -> bool:
+        text = f"{performance.get('name', '')} {performance.get('place', '')}".casefold()
+        return key in text
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        return keyword.strip().casefold()
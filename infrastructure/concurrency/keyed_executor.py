@@ -0,0 +1,115 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class _Task:
+    """제출된 작업 상태"""
+
+    def __init__(self, key: Optional[str], future: Future):
+        self.key = key
+        self.future = future
+        self.started = False
+
+
+class KeyedExecutor:
+    """작업 키 기반 공용 작업자 풀 (같은 키는 마지막 요청만 유효)
+
+    같은 키로 새 작업을 제출하면 이전 작업은 취소된다. 아직 시작하지 않은 작업은 실행되지 않고,
+    이미 실행 중인 작업은 끝까지 실행되지만 결과는 버려진다 (반환된 Future가 취소 상태가 됨).
+    browser=True 작업은 max_browser_jobs개 작업자만 있는 별도 풀에서 실행해
+    브라우저 작업이 밀려도 일반 작업자를 붙잡지 않는다.
+    """
+
+    def __init__(self, max_workers: int = 4, max_browser_jobs: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="background")
+        self._browser_executor = ThreadPoolExecutor(max_workers=max_browser_jobs, thread_name_prefix="browser")
+        self._tasks: Dict[str, _Task] = {}
+        # 키 없는 작업을 포함해 아직 끝나지 않은 모든 작업 (종료 시 취소용)
+        self._pending: Set[_Task] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls, settings) -> "KeyedExecutor":
+        return cls(max_workers=settings.BACKGROUND_WORKERS, max_browser_jobs=settings.MAX_BROWSER_JOBS)
+
+    def submit(self, key: Optional[str], fn: Callable, *args, browser: bool = False, **kwargs) -> Future:
+        """작업 제출 (key가 None이면 다른 작업을 대체하지 않음, 종료 후에는 취소된 Future 반환)"""
+        future = Future()
+        task = _Task(key, future)
+        executor = self._browser_executor if browser else self._executor
+        # 종료와 겹치지 않도록 풀에 넣는 것까지 잠금 안에서 처리 (submit은 대기하지 않음)
+        with self._lock:
+            if self._closed:
+                self._cancel(task)
+                return future
+            if key is not None:
+                previous = self._tasks.get(key)
+                if previous is not None:
+                    self._cancel(previous)
+                    logger.debug("이전 작업 대체: %s", key)
+                self._tasks[key] = task
+            self._pending.add(task)
+            executor.submit(self._run, task, fn, args, kwargs)
+        return future
+
+    def cancel(self, key: str) -> bool:
+        """아직 시작하지 않은 작업 취소 (실행 중이면 False)"""
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None or task.started:
+                return False
+            del self._tasks[key]
+            return self._cancel(task)
+
+    def shutdown(self):
+        """대기 작업 취소 (실행 중인 작업은 끝까지 진행해 결과를 전달)"""
+        with self._lock:
+            self._closed = True
+            for task in self._pending:
+                if not task.started:
+                    self._cancel(task)
+            # 풀에서 버려지는 작업은 _run이 호출되지 않으므로 여기서 정리
+            self._pending = {task for task in self._pending if task.started}
+            self._tasks.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._browser_executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _cancel(task: _Task) -> bool:
+        """작업 취소 (시작 전이면 wait()/as_completed() 대기자에게도 바로 알림)"""
+        if not task.future.cancel():
+            return False
+        if not task.started:
+            task.future.set_running_or_notify_cancel()
+        return True
+
+    def _run(self, task: _Task, fn: Callable, args, kwargs):
+        # 풀에서 차례를 기다리는 사이 대체됐을 수 있음
+        with self._lock:
+            if task.future.cancelled():
+                self._pending.discard(task)
+                return
+            task.started = True
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(task, lambda: task.future.set_exception(e))
+        else:
+            self._finish(task, lambda: task.future.set_result(result))
+
+    def _finish(self, task: _Task, complete: Callable):
+        with self._lock:
+            self._pending.discard(task)
+            if task.key is not None and self._tasks.get(task.key) is task:
+                del self._tasks[task.key]
+            # 대체된 작업의 결과는 버림. 실행 상태로 바꾼 뒤에는 취소되지 않으므로
+            # 완료 콜백은 잠금 밖에서 호출해도 됨
+            if not task.future.set_running_or_notify_cancel():
+                return
+        complete()
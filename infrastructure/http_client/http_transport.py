@@ -0,0 +1,262 @@
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """회로 차단기가 열려 요청이 거부됨"""
+
+
+class RetryBudget:
+    """요청 수 대비 재시도 비율 제한"""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 3, window_seconds: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """요청 기록"""
+        with self._lock:
+            now = time.monotonic()
+            self._requests.append(now)
+            self._expire(now)
+
+    def try_spend(self) -> bool:
+        """재시도 가능 여부 확인 후 예산 차감"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = max(self.min_retries, int(len(self._requests) * self.ratio))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    def _expire(self, now: float):
+        cutoff = now - self.window_seconds
+        for bucket in (self._requests, self._retries):
+            while bucket and bucket[0] < cutoff:
+                bucket.popleft()
+
+
+class CircuitBreaker:
+    """호스트별 회로 차단기"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                # 일정 시간 후 시험 요청 허용
+                self.state = self.HALF_OPEN
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class LatencyMetrics:
+    """엔드포인트별 지연 시간 통계"""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, elapsed_ms: float, error: bool = False):
+        """요청 결과 기록"""
+        with self._lock:
+            samples = self._samples.setdefault(endpoint, deque(maxlen=self.max_samples))
+            samples.append(elapsed_ms)
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if error:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """엔드포인트별 p50/p95/p99 통계 반환"""
+        with self._lock:
+            result = {}
+            for endpoint, samples in self._samples.items():
+                ordered = sorted(samples)
+                result[endpoint] = {
+                    'count': self._counts.get(endpoint, 0),
+                    'errors': self._errors.get(endpoint, 0),
+                    'p50': self._percentile(ordered, 50),
+                    'p95': self._percentile(ordered, 95),
+                    'p99': self._percentile(ordered, 99)
+                }
+            return result
+
+    def format_report(self) -> List[str]:
+        """로그/GUI 출력용 문자열 목록"""
+        lines = []
+        for endpoint, stats in sorted(self.snapshot().items()):
+            lines.append(
+                f"{endpoint}: n={stats['count']} err={stats['errors']} "
+                f"p50={stats['p50']:.0f}ms p95={stats['p95']:.0f}ms p99={stats['p99']:.0f}ms"
+            )
+        return lines
+
+    def log_report(self):
+        """통계를 로그로 출력"""
+        for line in self.format_report():
+            logger.info("HTTP 지연 통계 - %s", line)
+
+    @staticmethod
+    def _percentile(ordered: List[float], percent: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HttpTransport:
+    """타임아웃, 재시도, 회로 차단, 지연 통계를 갖춘 공용 HTTP 전송 계층"""
+
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    _ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+    def __init__(self,
+                 connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.3,
+                 backoff_max: float = 5.0,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 20,
+                 retry_budget_ratio: float = 0.2,
+                 breaker_failure_threshold: int = 5,
+                 breaker_reset_timeout: float = 30.0):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+
+        self.session = requests.Session()
+        # 재시도는 직접 관리하므로 어댑터 재시도는 끔
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio)
+        self.metrics = LatencyMetrics()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings=Settings) -> 'HttpTransport':
+        """설정 값으로 생성"""
+        return cls(
+            connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+            read_timeout=settings.HTTP_READ_TIMEOUT,
+            max_retries=settings.HTTP_MAX_RETRIES,
+            backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE
+        )
+
+    def close(self):
+        """연결 풀 정리"""
+        self.session.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """재시도와 회로 차단을 적용한 요청"""
+        kwargs.setdefault('timeout', self.timeout)
+        parsed = urlparse(url)
+        host = parsed.netloc
+        endpoint = f"{method} {host}{self._ID_SEGMENT.sub('/{id}', parsed.path)}"
+        breaker = self._get_breaker(host)
+
+        self.retry_budget.record_request()
+        attempt = 0
+
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for {host}")
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self.metrics.record(endpoint, (time.perf_counter() - started) * 1000, error=True)
+                breaker.record_failure()
+                if not self._should_retry(attempt):
+                    raise
+                logger.debug("HTTP 재시도 (%s/%s) %s: %s", attempt + 1, self.max_retries, endpoint, e)
+            else:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                failed = response.status_code in self.RETRY_STATUS_CODES
+                self.metrics.record(endpoint, elapsed_ms, error=failed)
+
+                if not failed:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure()
+                if not self._should_retry(attempt):
+                    return response
+                logger.debug("HTTP 재시도 (%s/%s) %s: status %s", attempt + 1, self.max_retries, endpoint, response.status_code)
+                response.close()
+
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+    def _should_retry(self, attempt: int) -> bool:
+        return attempt < self.max_retries and self.retry_budget.try_spend()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 (full jitter)"""
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay)
+
+    def _get_breaker(self, host: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_failure_threshold, self.breaker_reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
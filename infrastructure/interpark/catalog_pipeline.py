@@ -0,0 +1,254 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from infrastructure.http_client.http_transport import HttpTransport
+from infrastructure.cache.catalog_snapshot import CatalogSnapshot
+from infrastructure.cache.detail_cache import PerformanceDetailCache
+from infrastructure.interpark.performance_crawler import (
+    PerformanceCrawler, parse_latest_performances, parse_detail_page
+)
+
+logger = logging.getLogger(__name__)
+
+LISTING = "listing"
+DETAIL = "detail"
+
+
+@dataclass
+class PageJob:
+    """가져와서 파싱할 페이지"""
+    kind: str
+    key: str
+    url: str
+    html: Optional[str] = None
+    result: object = None
+    error: Optional[str] = None
+
+
+@dataclass
+class StageMetrics:
+    """단계별 처리량, 적체량 통계"""
+    name: str
+    processed: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    backlog: int = 0
+    max_backlog: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def enqueued(self, count: int = 1):
+        with self._lock:
+            self.backlog += count
+            self.max_backlog = max(self.max_backlog, self.backlog)
+
+    def done(self, duration: float, error: bool = False):
+        with self._lock:
+            self.backlog -= 1
+            self.processed += 1
+            self.busy_seconds += duration
+            if error:
+                self.errors += 1
+
+    def format(self, elapsed: float) -> str:
+        rate = self.processed / elapsed if elapsed else 0.0
+        return (f"{self.name}: {self.processed}건 ({rate:.1f}건/초, 오류 {self.errors}), "
+                f"작업 시간 {self.busy_seconds:.2f}초, 최대 적체 {self.max_backlog}")
+
+
+@dataclass
+class PipelineReport:
+    """동기화 결과"""
+    performances: int
+    details: int
+    elapsed: float
+    stages: List[StageMetrics]
+
+    def format_report(self) -> str:
+        lines = [f"공연 목록 동기화: 공연 {self.performances}개, 상세 정보 {self.details}개, {self.elapsed:.2f}초"]
+        lines.extend(f"  {stage.format(self.elapsed)}" for stage in self.stages)
+        return "\n".join(lines)
+
+
+def parse_page(kind: str, key: str, url: str, html: str, size: int):
+    """파싱 단계 작업 (작업 프로세스에서 실행)"""
+    if kind == LISTING:
+        return parse_latest_performances(html, size, PerformanceCrawler.DETAIL_URL)
+    return parse_detail_page(key, html, url)
+
+
+class CatalogPipeline:
+    """공연 목록/상세 페이지 수집 파이프라인
+
+    가져오기(스레드) → 제한된 큐 → 파싱(프로세스 풀) → 저장(스냅샷, 상세 정보 캐시) 단계로 나눠
+    네트워크 대기와 HTML 파싱이 겹쳐 실행되도록 한다. 큐가 가득 차면 가져오기 단계가 기다린다.
+    """
+
+    def __init__(self, transport: HttpTransport, snapshot: CatalogSnapshot,
+                 detail_cache: Optional[PerformanceDetailCache] = None, fetch_workers: int = 8,
+                 parse_workers: int = 0, queue_size: int = 64):
+        self.transport = transport
+        self.snapshot = snapshot
+        self.detail_cache = detail_cache
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+
+    @classmethod
+    def from_settings(cls, transport: HttpTransport, snapshot: CatalogSnapshot,
+                      detail_cache: Optional[PerformanceDetailCache], settings) -> "CatalogPipeline":
+        return cls(transport, snapshot, detail_cache,
+                   fetch_workers=settings.CATALOG_FETCH_WORKERS,
+                   parse_workers=settings.CATALOG_PARSE_WORKERS,
+                   queue_size=settings.CATALOG_QUEUE_SIZE)
+
+    def sync(self, listing_urls: Optional[Iterable[str]] = None, detail_ids: Iterable[str] = (),
+             include_details: bool = True, size: int = 200) -> PipelineReport:
+        """목록 페이지를 수집해 스냅샷에 반영하고, 발견한 공연의 상세 정보를 캐시에 저장"""
+        run = _PipelineRun(self, size, include_details)
+        return run.execute(list(listing_urls or [PerformanceCrawler.LIST_URL]), list(detail_ids))
+
+
+class _PipelineRun:
+    """sync() 한 번의 실행 상태"""
+
+    def __init__(self, pipeline: CatalogPipeline, size: int, include_details: bool):
+        self.pipeline = pipeline
+        self.size = size
+        self.include_details = include_details
+        self.fetch_metrics = StageMetrics("가져오기")
+        self.parse_metrics = StageMetrics("파싱")
+        self.sink_metrics = StageMetrics("저장")
+        self.parse_queue: "queue.Queue[Optional[PageJob]]" = queue.Queue(maxsize=pipeline.queue_size)
+        self.sink_queue: "queue.Queue[PageJob]" = queue.Queue()
+        # 파싱 프로세스마다 대기 작업을 하나씩 더 두어 작업자가 쉬지 않도록 함
+        self.parse_slots = threading.BoundedSemaphore(pipeline.parse_workers * 2)
+        self.catalog: Dict[str, Dict] = {}
+        self.seen_details = set()
+        self.details = 0
+        self.pending = 0
+
+    def execute(self, listing_urls: List[str], detail_ids: List[str]) -> PipelineReport:
+        started = time.perf_counter()
+        fetch_pool = ThreadPoolExecutor(max_workers=self.pipeline.fetch_workers, thread_name_prefix="catalog-fetch")
+        # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+        parse_pool = ProcessPoolExecutor(max_workers=self.pipeline.parse_workers,
+                                         mp_context=multiprocessing.get_context("spawn"))
+        dispatcher = threading.Thread(target=self._dispatch, args=(parse_pool,), name="catalog-parse", daemon=True)
+        dispatcher.start()
+
+        try:
+            for url in listing_urls:
+                self._submit_fetch(fetch_pool, PageJob(LISTING, url, url))
+            for performance_id in detail_ids:
+                self._submit_detail(fetch_pool, performance_id)
+
+            # 저장 단계는 호출 스레드에서 실행 (완료된 작업 수로 종료 판단)
+            while self.pending:
+                self._sink(fetch_pool, self.sink_queue.get())
+        finally:
+            # 가져오기 작업이 큐에 넣기를 마친 뒤 파싱 단계 종료
+            fetch_pool.shutdown(wait=True, cancel_futures=True)
+            self.parse_queue.put(None)
+            dispatcher.join()
+            parse_pool.shutdown(wait=True, cancel_futures=True)
+
+        if self.catalog:
+            self.pipeline.snapshot.upsert(list(self.catalog.values()))
+
+        report = PipelineReport(
+            performances=len(self.catalog),
+            details=self.details,
+            elapsed=time.perf_counter() - started,
+            stages=[self.fetch_metrics, self.parse_metrics, self.sink_metrics]
+        )
+        logger.info(report.format_report())
+        return report
+
+    def _submit_detail(self, fetch_pool: ThreadPoolExecutor, performance_id: str):
+        if performance_id in self.seen_details:
+            return
+        self.seen_details.add(performance_id)
+        url = f"{PerformanceCrawler.DETAIL_URL}/{performance_id}"
+        self._submit_fetch(fetch_pool, PageJob(DETAIL, performance_id, url))
+
+    def _submit_fetch(self, fetch_pool: ThreadPoolExecutor, job: PageJob):
+        self.pending += 1
+        self.fetch_metrics.enqueued()
+        fetch_pool.submit(self._fetch, job)
+
+    def _fetch(self, job: PageJob):
+        """가져오기 단계 (작업 스레드)"""
+        started = time.perf_counter()
+        try:
+            response = self.pipeline.transport.get(job.url)
+            response.raise_for_status()
+            job.html = response.text
+        except Exception as e:
+            job.error = f"가져오기 실패: {e}"
+
+        self.fetch_metrics.done(time.perf_counter() - started, error=job.error is not None)
+        if job.error:
+            self._to_sink(job)
+        else:
+            self.parse_metrics.enqueued()
+            # 큐가 가득 차면 파싱 단계가 따라올 때까지 대기
+            self.parse_queue.put(job)
+
+    def _dispatch(self, parse_pool: ProcessPoolExecutor):
+        """파싱 단계 (큐에서 꺼내 프로세스 풀에 전달)"""
+        while True:
+            job = self.parse_queue.get()
+            if job is None:
+                return
+            self.parse_slots.acquire()
+            started = time.perf_counter()
+            try:
+                future = parse_pool.submit(parse_page, job.kind, job.key, job.url, job.html, self.size)
+            except RuntimeError as e:
+                # 풀이 이미 종료됨
+                self.parse_slots.release()
+                job.error = f"파싱 실패: {e}"
+                self.parse_metrics.done(0.0, error=True)
+                self._to_sink(job)
+                continue
+            job.html = None
+            future.add_done_callback(lambda f, job=job, started=started: self._on_parsed(job, f, started))
+
+    def _on_parsed(self, job: PageJob, future, started: float):
+        self.parse_slots.release()
+        try:
+            job.result = future.result()
+        except Exception as e:
+            job.error = f"파싱 실패: {e}"
+        self.parse_metrics.done(time.perf_counter() - started, error=job.error is not None)
+        self._to_sink(job)
+
+    def _to_sink(self, job: PageJob):
+        self.sink_metrics.enqueued()
+        self.sink_queue.put(job)
+
+    def _sink(self, fetch_pool: ThreadPoolExecutor, job: PageJob):
+        """저장 단계 (목록은 공연 ID 기준으로 합치고 상세 정보는 캐시에 저장)"""
+        started = time.perf_counter()
+        try:
+            if job.error:
+                logger.warning("%s (%s)", job.error, job.url)
+            elif job.kind == LISTING:
+                for performance in job.result:
+                    self.catalog.setdefault(performance['id'], {}).update(performance)
+                    if self.include_details:
+                        self._submit_detail(fetch_pool, performance['id'])
+            elif job.result.get('dates') or job.result.get('times'):
+                if self.pipeline.detail_cache:
+                    self.pipeline.detail_cache.put(job.key, job.result)
+                self.details += 1
+        finally:
+            self.pending -= 1
+            self.sink_metrics.done(time.perf_counter() - started, error=job.error is not None)
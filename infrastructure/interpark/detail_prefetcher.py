@@ -0,0 +1,105 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, Optional
+
+from infrastructure.concurrency.keyed_executor import KeyedExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class DetailPrefetcher:
+    """공연 상세 정보 미리 불러오기 (공연 ID 기준, 작업자 수 제한)
+
+    목록에서 보이거나 마우스가 올라간 공연의 상세 정보를 클릭 전에 불러 둔다.
+    화면에서 벗어난 공연의 대기 중인 작업은 취소한다.
+    상세 정보는 브라우저로 불러오므로 공용 작업자 풀의 브라우저 작업 제한을 따른다.
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[Dict]], executor: KeyedExecutor,
+                 max_results: int = 128):
+        self.fetch = fetch
+        self.max_results = max_results
+        self._executor = executor
+        self._futures: Dict[str, Future] = {}
+        self._results: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get(self, performance_id: str) -> Optional[Dict]:
+        """이미 불러온 상세 정보 반환 (없으면 None)"""
+        with self._lock:
+            detail = self._results.get(performance_id)
+            if detail is not None:
+                self._results.move_to_end(performance_id)
+            return detail
+
+    def prefetch(self, performance_ids: Iterable[str]):
+        """주어진 공연들을 미리 불러오고, 목록에 없는 대기 작업은 취소"""
+        wanted = list(dict.fromkeys(performance_ids))
+        with self._lock:
+            if self._closed:
+                return
+            for performance_id, future in list(self._futures.items()):
+                if performance_id not in wanted and self._executor.cancel(self._key(performance_id)):
+                    del self._futures[performance_id]
+                    logger.debug("상세 정보 미리 불러오기 취소: %s", performance_id)
+
+            for performance_id in wanted:
+                self._submit_locked(performance_id)
+
+    def request(self, performance_id: str) -> Future:
+        """선택한 공연의 상세 정보 요청 (다른 대기 작업보다 먼저 실행)"""
+        with self._lock:
+            detail = self._results.get(performance_id)
+            if detail is not None:
+                future = Future()
+                future.set_result(detail)
+                return future
+
+            # 작업자가 바로 집도록 다른 대기 작업은 비움
+            for other_id, future in list(self._futures.items()):
+                if other_id != performance_id and self._executor.cancel(self._key(other_id)):
+                    del self._futures[other_id]
+
+            return self._submit_locked(performance_id)
+
+    def shutdown(self):
+        """대기 작업 취소 (실행 중인 작업은 끝까지 진행, 작업자 풀은 공용이므로 종료하지 않음)"""
+        with self._lock:
+            self._closed = True
+            for performance_id in list(self._futures):
+                self._executor.cancel(self._key(performance_id))
+            self._futures.clear()
+
+    def _submit_locked(self, performance_id: str) -> Future:
+        future = self._futures.get(performance_id)
+        if future is not None:
+            return future
+        if performance_id in self._results:
+            future = Future()
+            future.set_result(self._results[performance_id])
+            return future
+
+        future = self._executor.submit(self._key(performance_id), self._load, performance_id, browser=True)
+        self._futures[performance_id] = future
+        return future
+
+    @staticmethod
+    def _key(performance_id: str) -> str:
+        return f"detail:{performance_id}"
+
+    def _load(self, performance_id: str) -> Optional[Dict]:
+        detail = None
+        try:
+            detail = self.fetch(performance_id)
+            return detail
+        finally:
+            with self._lock:
+                self._futures.pop(performance_id, None)
+                if detail:
+                    self._results[performance_id] = detail
+                    self._results.move_to_end(performance_id)
+                    while len(self._results) > self.max_results:
+                        self._results.popitem(last=False)
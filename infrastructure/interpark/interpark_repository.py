@@ -1,39 +1,46 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
 import logging
 from typing import Optional
 
-from domain.entities import Reservation
+from config.settings import Settings
+from domain.cancellation import CancellationToken, OperationCancelledError
+from domain.entities import Reservation, ReservationPhase
 from domain.repositories.reservation_repository import ReservationRepository
 from infrastructure.web_driver.driver_manager import WebDriverManager
 from infrastructure.ocr.captcha_solver import CaptchaSolver
 from infrastructure.interpark.seat_selector import SeatSelector
+from infrastructure.interpark.seat_scoring import SeatScoringWeights
+from infrastructure.tracing.trace_recorder import TraceRecorder
 
 logger = logging.getLogger(__name__)
 
 
 class InterparkRepository(ReservationRepository):
-    def __init__(self, driver_manager: WebDriverManager):
+    def __init__(self, driver_manager: WebDriverManager, settings=Settings,
+                 trace_recorder: Optional[TraceRecorder] = None,
+                 cancel_token: Optional[CancellationToken] = None):
         self.driver_manager = driver_manager
-        self.captcha_solver = CaptchaSolver()
+        self.settings = settings
+        self.trace_recorder = trace_recorder
+        self.cancel_token = cancel_token or CancellationToken()
+        self.captcha_solver = CaptchaSolver(settings.TESSERACT_CONFIG)
         self.seat_selector: Optional[SeatSelector] = None
         
     def enter_queue(self, reservation: Reservation) -> bool:
         """대기열 진입"""
         try:
             driver = self.driver_manager.get_driver()
-            wait = self.driver_manager.get_wait()
             
             driver.get(reservation.performance.url)
             
             retry_count = 0
-            max_retries = 60
+            max_retries = self.settings.MAX_QUEUE_RETRY
             
             while retry_count < max_retries:
                 try:
-                    book_button = wait.until(
+                    book_button = self._wait_until(
                         EC.element_to_be_clickable((By.CLASS_NAME, "btn_book"))
                     )
                     book_button.click()
@@ -42,34 +49,39 @@ class InterparkRepository(ReservationRepository):
                     
                 except TimeoutException:
                     retry_count += 1
-                    logger.debug(f"Retrying queue entry... ({retry_count}/{max_retries})")
-                    time.sleep(0.5)
+                    logger.debug("Retrying queue entry... (%s/%s)", retry_count, max_retries)
+                    self.cancel_token.sleep(self.settings.QUEUE_RETRY_INTERVAL)
                     driver.refresh()
                     
             logger.error("Failed to enter queue after maximum retries")
             return False
             
+        except OperationCancelledError:
+            raise
+            
         except Exception as e:
-            logger.error(f"Error entering queue: {str(e)}")
+            logger.error("Error entering queue: %s", e)
             return False
             
     def enter_reservation_window(self) -> bool:
         """예매창 진입"""
         try:
             driver = self.driver_manager.get_driver()
-            wait = self.driver_manager.get_wait()
             
             driver.switch_to.window(driver.window_handles[-1])
             
-            wait.until(
+            self._wait_until(
                 EC.presence_of_element_located((By.ID, "divBookSeat"))
             )
             
             logger.info("Successfully entered reservation window")
             return True
             
+        except OperationCancelledError:
+            raise
+            
         except Exception as e:
-            logger.error(f"Error entering reservation window: {str(e)}")
+            logger.error("Error entering reservation window: %s", e)
             return False
             
     def solve_captcha(self) -> Optional[str]:
@@ -101,8 +113,11 @@ class InterparkRepository(ReservationRepository):
             logger.info("No captcha element found - skipping")
             return ""
             
+        except OperationCancelledError:
+            raise
+            
         except Exception as e:
-            logger.error(f"Error solving captcha: {str(e)}")
+            logger.error("Error solving captcha: %s", e)
             return None
             
     def select_seats(self, reservation: Reservation) -> bool:
@@ -113,12 +128,27 @@ class InterparkRepository(ReservationRepository):
             seat_frame = driver.find_element(By.ID, "ifrmSeat")
             driver.switch_to.frame(seat_frame)
             
-            time.sleep(1)
+            self.cancel_token.sleep(self.settings.SEAT_FRAME_SETTLE_DELAY)
+            
+            if self.trace_recorder:
+                self.trace_recorder.record_seat_map(driver.page_source)
+            
+            # 좌석 조회/클릭은 가능하면 CDP로 직접 처리 (팝업 창이 바뀌면 다시 연결)
+            cdp = self.driver_manager.get_cdp_backend() if self.settings.CDP_BACKEND_ENABLED else None
             
             if not self.seat_selector:
-                self.seat_selector = SeatSelector(driver)
+                self.seat_selector = SeatSelector(
+                    driver,
+                    seat_grades=reservation.performance.seat_grades,
+                    weights=SeatScoringWeights.from_dict(self.settings.SEAT_SCORE_WEIGHTS),
+                    plan_depth=self.settings.SEAT_PLAN_DEPTH,
+                    plan_refresh_ratio=self.settings.SEAT_PLAN_REFRESH_RATIO,
+                    cdp=cdp,
+                    cdp_frame="#ifrmSeat"
+                )
             else:
                 self.seat_selector.clear_selection()
+                self.seat_selector.cdp = cdp
                 
             success = self.seat_selector.select_seats(reservation.seat_preference)
             
@@ -126,8 +156,11 @@ class InterparkRepository(ReservationRepository):
             
             return success
             
+        except OperationCancelledError:
+            raise
+            
         except Exception as e:
-            logger.error(f"Error selecting seats: {str(e)}")
+            logger.error("Error selecting seats: %s", e)
             return False
             
     def handle_seat_conflict(self) -> bool:
@@ -139,8 +172,16 @@ class InterparkRepository(ReservationRepository):
             
             try:
                 alert_popup = driver.find_element(By.CLASS_NAME, "alert_popup")
+                popup_text = alert_popup.text
+                conflict = "이미 선택된 좌석" in popup_text
+                
+                if self.trace_recorder:
+                    self.trace_recorder.record_popup(popup_text, conflict)
                 
-                if "이미 선택된 좌석" in alert_popup.text:
+                if conflict:
+                    if self.seat_selector:
+                        self.seat_selector.mark_conflict()
+                        
                     close_button = alert_popup.find_element(By.CLASS_NAME, "btn_close")
                     close_button.click()
                     
@@ -152,6 +193,51 @@ class InterparkRepository(ReservationRepository):
                 
             return False
             
+        except OperationCancelledError:
+            raise
+            
+        except Exception as e:
+            logger.error("Error handling seat conflict: %s", e)
+            return False
+            
+    def detect_phase(self) -> Optional[ReservationPhase]:
+        """브라우저에 남은 화면으로 이어서 진행할 단계 판단"""
+        try:
+            driver = self.driver_manager.get_driver()
+            
+            handles = driver.window_handles
+            if len(handles) < 2:
+                # 예매창이 열리지 않음 - 대기열부터
+                return None
+                
+            driver.switch_to.window(handles[-1])
+            driver.switch_to.default_content()
+            
+            if not driver.find_elements(By.ID, "divBookSeat"):
+                return ReservationPhase.RESERVATION_WINDOW
+                
+            captcha = driver.find_elements(By.ID, "imgCaptcha")
+            if captcha and captcha[0].is_displayed():
+                return ReservationPhase.CAPTCHA
+                
+            if driver.find_elements(By.ID, "ifrmSeat"):
+                return ReservationPhase.SEAT_SELECTION
+                
+            return ReservationPhase.CAPTCHA
+            
+        except OperationCancelledError:
+            raise
+            
         except Exception as e:
-            logger.error(f"Error handling seat conflict: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error("Error detecting reservation phase: %s", e)
+            return None
+            
+    def _wait_until(self, condition):
+        """취소 토큰을 폴링 간격마다 확인하는 WebDriverWait.until"""
+        wait = self.driver_manager.get_wait()
+        
+        def cancellable_condition(driver):
+            self.cancel_token.raise_if_cancelled()
+            return condition(driver)
+            
+        return wait.until(cancellable_condition)
@@ -8,10 +8,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
 
+from config.settings import Settings
 from infrastructure.web_driver.driver_manager import WebDriverManager
+from infrastructure.http_client.http_transport import HttpTransport
+from infrastructure.cache.detail_cache import PerformanceDetailCache
+from infrastructure.profiling.cpu_profiler import CpuProfiler, profiled
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+GOODS_PATTERN = re.compile(r'/goods/(\d+)')
+DOT_DATE_PATTERN = re.compile(r'\d{4}\.\d{2}\.\d{2}')
 
 
 class PerformanceCrawler:
@@ -23,8 +29,14 @@ class PerformanceCrawler:
     DETAIL_URL = f"{TICKET_BASE_URL}/goods"
     LIST_URL = f"{TICKET_BASE_URL}/contents/genre/concert"
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, transport: Optional[HttpTransport] = None, settings=Settings,
+                 detail_cache: Optional[PerformanceDetailCache] = None,
+                 cpu_profiler: Optional[CpuProfiler] = None):
+        self.settings = settings
+        self.detail_cache = detail_cache
+        self.cpu_profiler = cpu_profiler or CpuProfiler.from_settings(settings)
+        self.transport = transport or HttpTransport.from_settings(settings)
+        self.session = self.transport.session
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -32,16 +44,16 @@ class PerformanceCrawler:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive'
         })
-        self.driver_manager = None
         
-    def search_performances(self, keyword: str) -> List[Dict]:
-        """공연 검색"""
+    @profiled("crawler.search_performances")
+    def search_performances(self, keyword: str) -> Optional[List[Dict]]:
+        """공연 검색 (요청/파싱 실패 시 None - 결과 없음과 구분)"""
         try:
             # 인터파크 티켓 사이트에서 검색
             search_url = f"{self.TICKET_BASE_URL}/search?q={requests.utils.quote(keyword)}"
-            logger.info(f"공연 검색 중: {search_url}")
+            logger.info("공연 검색 중: %s", search_url)
             
-            response = self.session.get(search_url)
+            response = self.transport.get(search_url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -60,7 +72,7 @@ class PerformanceCrawler:
                     if '/goods/' not in href:
                         continue
                         
-                    goods_code = re.search(r'/goods/(\d+)', href)
+                    goods_code = GOODS_PATTERN.search(href)
                     if not goods_code:
                         continue
                     goods_code = goods_code.group(1)
@@ -77,7 +89,7 @@ class PerformanceCrawler:
                     date_elem = item.select_one('.fw_light')
                     if date_elem:
                         date_text = date_elem.text.strip()
-                        dates = re.findall(r'\d{4}\.\d{2}\.\d{2}', date_text)
+                        dates = DOT_DATE_PATTERN.findall(date_text)
                         start_date = dates[0] if dates else ''
                         end_date = dates[1] if len(dates) > 1 else start_date
                     else:
@@ -97,111 +109,66 @@ class PerformanceCrawler:
                         performances.append(performance)
                         
                 except Exception as e:
-                    logger.error(f"항목 파싱 오류: {str(e)}")
+                    logger.error("항목 파싱 오류: %s", e)
                     continue
             
-            logger.info(f"{len(performances)}개의 공연 검색 결과")
+            logger.info("%s개의 공연 검색 결과", len(performances))
             return performances
             
         except Exception as e:
-            logger.error(f"공연 검색 실패: {str(e)}")
-            return []
+            logger.error("공연 검색 실패: %s", e)
+            return None
             
+    @profiled("crawler.get_latest_performances")
     def get_latest_performances(self, genre_code: str = "", page: int = 1, size: int = 40) -> List[Dict]:
         """최신 공연 목록 조회"""
         try:
             # 인터파크 콘서트 페이지 직접 크롤링
             url = "https://tickets.interpark.com/contents/genre/concert"
-            logger.info(f"콘서트 페이지 크롤링: {url}")
+            logger.info("콘서트 페이지 크롤링: %s", url)
             
-            response = self.session.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            performances = []
-            
-            # 모든 goods 링크 찾기 (가장 직접적인 방법)
-            goods_links = soup.find_all('a', href=re.compile(r'/goods/(\d+)'))
-            logger.info(f"{len(goods_links)}개의 공연 링크 발견")
+            performances = parse_latest_performances(response.text, size, self.DETAIL_URL)
             
-            for link in goods_links[:size]:
-                try:
-                    href = link.get('href', '')
-                    goods_match = re.search(r'/goods/(\d+)', href)
-                    if not goods_match:
-                        continue
-                        
-                    goods_code = goods_match.group(1)
-                    
-                    # 링크 텍스트를 공연명으로 사용
-                    name = link.get_text(strip=True)
-                    
-                    # 이미지 태그 찾기
-                    img = link.find('img')
-                    if img:
-                        name = img.get('alt', name).strip()
-                        poster_url = img.get('src', '')
-                    else:
-                        poster_url = ''
-                    
-                    # 부모 요소에서 추가 정보 찾기
-                    parent = link.parent
-                    place = ''
-                    start_date = ''
-                    end_date = ''
-                    
-                    # 부모 요소의 텍스트에서 날짜 패턴 찾기
-                    if parent:
-                        parent_text = parent.get_text()
-                        date_matches = re.findall(r'\d{4}\.\d{2}\.\d{2}', parent_text)
-                        if date_matches:
-                            start_date = date_matches[0]
-                            end_date = date_matches[1] if len(date_matches) > 1 else start_date
-                    
-                    performance = {
-                        'id': goods_code,
-                        'name': name,
-                        'place': place,
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'poster_url': poster_url,
-                        'url': f"{self.DETAIL_URL}/{goods_code}"
-                    }
-                    
-                    if name and goods_code:
-                        performances.append(performance)
-                        logger.info(f"공연 추가: {name} (ID: {goods_code})")
-                        
-                except Exception as e:
-                    logger.error(f"링크 파싱 오류: {str(e)}")
-                    continue
-            
-            logger.info(f"총 {len(performances)}개의 공연 발견")
+            logger.info("총 %s개의 공연 발견", len(performances))
             return performances
             
         except Exception as e:
-            logger.error(f"최신 공연 목록 가져오기 실패: {str(e)}")
+            logger.error("최신 공연 목록 가져오기 실패: %s", e)
             return []
             
             
-    def get_performance_detail(self, performance_id: str) -> Optional[Dict]:
+    @profiled("crawler.get_performance_detail")
+    def get_performance_detail(self, performance_id: str, use_cache: bool = True) -> Optional[Dict]:
         """공연 상세 정보 조회"""
+        if self.detail_cache and use_cache:
+            cached = self.detail_cache.get(performance_id)
+            if cached:
+                logger.info("캐시된 공연 상세 정보 사용: %s", performance_id)
+                return cached
+                
+        # 여러 스레드에서 동시에 호출될 수 있으므로 브라우저는 호출마다 따로 생성
+        driver_manager = None
         try:
             url = f"{self.DETAIL_URL}/{performance_id}"
-            logger.info(f"공연 상세 정보 가져오기: {url}")
+            logger.info("공연 상세 정보 가져오기: %s", url)
             
             # Selenium으로 페이지 로드
-            if not self.driver_manager:
-                self.driver_manager = WebDriverManager()
-                self.driver_manager.initialize(headless=True)
+            driver_manager = WebDriverManager()
+            driver_manager.initialize(headless=True, wait_timeout=self.settings.WEBDRIVER_TIMEOUT)
             
-            driver = self.driver_manager.get_driver()
-            wait = self.driver_manager.get_wait()
+            driver = driver_manager.get_driver()
+            wait = driver_manager.get_wait()
             
             driver.get(url)
             
+            # 이전에 HTTP 세션이 얻은 사이트 상태를 새 브라우저에 반영 (이후 페이지 요청부터 적용)
+            driver_manager.import_cookies(self.session)
+            
             # 페이지 로드 대기
-            time.sleep(3)
+            time.sleep(self.settings.DETAIL_PAGE_LOAD_DELAY)
             
             # 날짜와 시간 정보 추출
             dates = []
@@ -212,7 +179,7 @@ class PerformanceCrawler:
                 calendar_btn = driver.find_element(By.CSS_SELECTOR, '[class*="calendar"], [class*="date"], .sideContainer.containerTop')
                 if calendar_btn:
                     driver.execute_script("arguments[0].click();", calendar_btn)
-                    time.sleep(1)
+                    time.sleep(self.settings.DETAIL_CLICK_DELAY)
             except:
                 pass
             
@@ -263,7 +230,7 @@ class PerformanceCrawler:
                                 dates.append(str(date_val))
                 
             except Exception as e:
-                logger.error(f"날짜 추출 중 오류: {str(e)}")
+                logger.error("날짜 추출 중 오류: %s", e)
             
             # 시간 추출
             try:
@@ -271,7 +238,7 @@ class PerformanceCrawler:
                 time_btn = driver.find_element(By.CSS_SELECTOR, '[class*="time"], [class*="round"], .sideContainer.containerMiddle')
                 if time_btn:
                     driver.execute_script("arguments[0].click();", time_btn)
-                    time.sleep(1)
+                    time.sleep(self.settings.DETAIL_CLICK_DELAY)
             except:
                 pass
             
@@ -313,7 +280,10 @@ class PerformanceCrawler:
                         times.extend(js_times)
                 
             except Exception as e:
-                logger.error(f"시간 추출 중 오류: {str(e)}")
+                logger.error("시간 추출 중 오류: %s", e)
+            
+            # 브라우저에서 얻은 사이트 상태를 HTTP 세션에 반영
+            driver_manager.export_cookies(self.session)
             
             # 페이지 소스로 BeautifulSoup 생성
             page_source = driver.page_source
@@ -337,21 +307,24 @@ class PerformanceCrawler:
                 'seat_grades': self._extract_seat_grades(soup)
             }
             
-            logger.info(f"추출된 날짜: {dates}")
-            logger.info(f"추출된 시간: {times}")
+            logger.info("추출된 날짜: %s", dates)
+            logger.info("추출된 시간: %s", times)
+            
+            if self.detail_cache and (dates or times):
+                self.detail_cache.put(performance_id, detail)
             
             return detail
             
         except Exception as e:
-            logger.error(f"공연 상세 정보 조회 실패: {str(e)}")
+            logger.error("공연 상세 정보 조회 실패: %s", e)
             return None
         finally:
             # WebDriver 종료
-            if self.driver_manager:
-                self.driver_manager.quit()
-                self.driver_manager = None
+            if driver_manager:
+                driver_manager.quit()
             
-    def _extract_dates(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _extract_dates(soup: BeautifulSoup) -> List[str]:
         """공연 날짜 추출"""
         dates = []
         try:
@@ -406,15 +379,16 @@ class PerformanceCrawler:
                         dates.extend([d.replace('.', '-') for d in date_matches])
                         
         except Exception as e:
-            logger.error(f"날짜 추출 실패: {str(e)}")
+            logger.error("날짜 추출 실패: %s", e)
         
         # 중복 제거 및 정렬
         dates = sorted(list(set(dates)))
-        logger.debug(f"추출된 날짜 목록: {dates}")
+        logger.debug("추출된 날짜 목록: %s", dates)
         
         return dates
         
-    def _extract_times(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _extract_times(soup: BeautifulSoup) -> List[str]:
         """공연 시간 추출"""
         times = []
         try:
@@ -477,7 +451,7 @@ class PerformanceCrawler:
                     times.extend(time_matches)
                     
         except Exception as e:
-            logger.error(f"시간 추출 실패: {str(e)}")
+            logger.error("시간 추출 실패: %s", e)
         
         # 중복 제거 및 정렬
         times = sorted(list(set(times)))
@@ -488,11 +462,12 @@ class PerformanceCrawler:
             if 0 <= hour <= 23 and 0 <= minute <= 59:
                 valid_times.append(time)
         
-        logger.debug(f"추출된 시간 목록: {valid_times}")
+        logger.debug("추출된 시간 목록: %s", valid_times)
         
         return valid_times
         
-    def _extract_seat_grades(self, soup: BeautifulSoup) -> List[Dict]:
+    @staticmethod
+    def _extract_seat_grades(soup: BeautifulSoup) -> List[Dict]:
         """좌석 등급 정보 추출"""
         grades = []
         try:
@@ -508,6 +483,97 @@ class PerformanceCrawler:
                     })
                     
         except Exception as e:
-            logger.error(f"좌석 등급 추출 실패: {str(e)}")
+            logger.error("좌석 등급 추출 실패: %s", e)
             
-        return grades
\ No newline at end of file
+        return grades
+
+
+def _card_container(link):
+    """공연 카드 요소 (이미지 링크와 제목 링크를 함께 감싸는 요소)"""
+    return link.find_parent(['li', 'article']) or link.parent
+
+
+def _merge_field(record: Dict, key: str, value: str):
+    if value and not record[key]:
+        record[key] = value
+
+
+def parse_latest_performances(html: str, size: int, detail_url: str) -> List[Dict]:
+    """장르 페이지 HTML에서 공연 목록 추출
+
+    같은 공연 카드의 링크(이미지, 제목 등)는 공연 코드 기준으로 한 레코드에 필드별로 합치고,
+    카드 요소의 텍스트는 한 번만 파싱한다. size는 중복을 제거한 공연 수 기준이다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    index: Dict[str, Dict] = {}
+    parsed_containers = set()
+
+    goods_links = soup.find_all('a', href=GOODS_PATTERN)
+    logger.info("%s개의 공연 링크 발견", len(goods_links))
+
+    for link in goods_links:
+        try:
+            goods_match = GOODS_PATTERN.search(link.get('href', ''))
+            if not goods_match:
+                continue
+            goods_code = goods_match.group(1)
+
+            record = index.get(goods_code)
+            if record is None:
+                if len(index) >= size:
+                    continue
+                record = index[goods_code] = {
+                    'id': goods_code,
+                    'name': '',
+                    'place': '',
+                    'start_date': '',
+                    'end_date': '',
+                    'poster_url': '',
+                    'url': f"{detail_url}/{goods_code}"
+                }
+
+            # 이미지 alt가 있으면 링크 텍스트보다 우선
+            img = link.find('img')
+            if img:
+                alt = img.get('alt', '').strip()
+                if alt:
+                    record['name'] = alt
+                _merge_field(record, 'poster_url', img.get('src', ''))
+            else:
+                _merge_field(record, 'name', link.get_text(strip=True))
+
+            container = _card_container(link)
+            # 여러 공연이 한 요소에 묶여 있을 수 있으므로 공연별로 한 번씩 확인
+            container_key = (id(container), goods_code)
+            if container is not None and container_key not in parsed_containers:
+                parsed_containers.add(container_key)
+                if not record['start_date']:
+                    date_matches = DOT_DATE_PATTERN.findall(container.get_text())
+                    if date_matches:
+                        record['start_date'] = date_matches[0]
+                        record['end_date'] = date_matches[1] if len(date_matches) > 1 else date_matches[0]
+
+        except Exception as e:
+            logger.error("링크 파싱 오류: %s", e)
+            continue
+
+    performances = [record for record in index.values() if record['name']]
+    for performance in performances:
+        logger.debug("공연 추가: %s (ID: %s)", performance['name'], performance['id'])
+    return performances
+
+
+def parse_detail_page(performance_id: str, html: str, url: str) -> Dict:
+    """상세 페이지 HTML에서 날짜, 시간, 좌석 등급 추출 (브라우저 없이, 다른 프로세스에서도 호출 가능)
+
+    정적 HTML 휴리스틱 결과이므로 source='static'으로 표시한다 (예매에는 사용하지 않음).
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    return {
+        'id': performance_id,
+        'url': url,
+        'source': 'static',
+        'dates': PerformanceCrawler._extract_dates(soup),
+        'times': PerformanceCrawler._extract_times(soup),
+        'seat_grades': PerformanceCrawler._extract_seat_grades(soup)
+    }
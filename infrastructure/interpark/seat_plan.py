@@ -0,0 +1,59 @@
+from typing import Hashable, List, Optional, Sequence, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (구역, 줄, 열) - 구역마다 줄/열 번호가 다시 시작할 수 있음
+SeatKey = Tuple[str, int, int]
+
+
+class SeatPlan:
+    """점수순으로 정렬된 좌석 후보 계획
+
+    좌석 충돌이 나면 시도한 좌석을 제외하고 다음 후보 묶음으로 바로 넘어간다.
+    """
+
+    def __init__(self, seats: Sequence, keys: Sequence[SeatKey], group_size: int,
+                 available_count: int, preference_key: Hashable):
+        self.seats = list(seats)
+        self.keys = list(keys)
+        self.group_size = group_size
+        self.available_count = available_count
+        self.preference_key = preference_key
+        self.lost: Set[SeatKey] = set()
+        self.last_group: List[int] = []
+        self._cursor = 0
+
+    def next_group(self) -> List[int]:
+        """다음 후보 묶음의 인덱스 목록 (잃은 좌석은 건너뜀)"""
+        group = []
+        while self._cursor < len(self.seats) and len(group) < self.group_size:
+            if self.keys[self._cursor] not in self.lost:
+                group.append(self._cursor)
+            self._cursor += 1
+
+        self.last_group = group
+        return group
+
+    def mark_last_group_lost(self):
+        """직전 시도한 좌석을 모두 잃은 것으로 표시"""
+        self.lost.update(self.keys[i] for i in self.last_group)
+        logger.debug("Marked %s seats as lost (%s total)", len(self.last_group), len(self.lost))
+        self.last_group = []
+
+    @property
+    def exhausted(self) -> bool:
+        return self._cursor >= len(self.seats)
+
+    def is_stale(self, available_count: int, preference_key: Hashable, refresh_ratio: float) -> bool:
+        """좌석 현황이 크게 바뀌었거나 선호 조건이 달라졌는지 확인"""
+        if preference_key != self.preference_key or self.exhausted:
+            return True
+        if self.available_count == 0:
+            return available_count > 0
+        change = abs(available_count - self.available_count) / self.available_count
+        return change > refresh_ratio
+
+    @staticmethod
+    def seat_key(section: Optional[str], row: Optional[int], col: Optional[int]) -> SeatKey:
+        return (section or '', row or 0, col or 0)
@@ -0,0 +1,179 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+import re
+
+import numpy as np
+
+from domain.entities import SeatDirection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SeatScoringWeights:
+    """좌석 점수 가중치 (양수일수록 해당 요소를 더 중시)
+
+    기본값은 기존 정렬(앞줄 우선, 같은 줄에서는 선택 방향 우선)과 같다.
+    중앙/통로 가중치는 SEAT_SCORE_WEIGHTS로 켠다 (예: {"stage_distance": 1.0, "row_depth": 2.0}).
+    """
+    stage_distance: float = 0.0
+    row_depth: float = 1.0
+    aisle: float = 0.0
+    section: float = 0.0
+    price: float = 0.0
+    direction: float = 1.0
+    section_order: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, values: Optional[Dict[str, Any]]) -> 'SeatScoringWeights':
+        """설정 dict에서 생성 (알 수 없는 키는 무시)"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (values or {}).items() if k in names})
+
+
+class SeatLayout:
+    """좌석 상태(예매 가능/완료)와 무관한 전체 좌석 배치
+
+    무대 중앙과 통로는 이 배치를 기준으로 계산하므로 좌석이 팔려도 점수가 바뀌지 않는다.
+    """
+
+    def __init__(self, rows: Sequence[int], cols: Sequence[int], sections: Sequence[str]):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        self.size = rows.size
+        self.col_min = float(cols.min()) if cols.size else 0.0
+        self.col_max = float(cols.max()) if cols.size else 0.0
+        self.row_min = float(rows.min()) if rows.size else 0.0
+        self.row_max = float(rows.max()) if rows.size else 0.0
+        row_gaps = np.diff(np.unique(rows))
+        self.min_row_gap = float(row_gaps.min()) if row_gaps.size else 0.0
+        self._section_ids = {name: i + 1 for i, name in enumerate(sorted(set(sections)))}
+        # 좌석 위치를 정수 하나로 인코딩 (범위 밖 위치는 has_seat에서 먼저 걸러냄)
+        self._max_row = int(rows.max()) if rows.size else -1
+        self._max_col = int(cols.max()) if cols.size else -1
+        self._row_stride = self._max_col + 2
+        self._section_stride = (self._max_row + 1) * self._row_stride
+        self._keys = np.unique(self._encode(rows, cols, sections))
+
+    def has_seat(self, rows: np.ndarray, cols: np.ndarray, sections: Sequence[str]) -> np.ndarray:
+        """해당 위치에 좌석이 있는지 (배치 범위 밖이면 False)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        inside = (cols >= 0) & (cols <= self._max_col) & (rows >= 0) & (rows <= self._max_row)
+        return inside & np.isin(self._encode(rows, cols, sections), self._keys)
+
+    def _encode(self, rows: np.ndarray, cols: np.ndarray, sections: Sequence[str]) -> np.ndarray:
+        section_ids = np.fromiter((self._section_ids.get(s, 0) for s in sections),
+                                  dtype=np.int64, count=rows.size)
+        return section_ids * self._section_stride + rows * self._row_stride + (cols + 1)
+
+
+class SeatScorer:
+    """전체 좌석 점수를 NumPy 벡터로 한 번에 계산"""
+
+    def __init__(self, weights: Optional[SeatScoringWeights] = None,
+                 seat_grades: Optional[List[Dict]] = None):
+        self.weights = weights or SeatScoringWeights()
+        self.grade_prices = self._parse_grade_prices(seat_grades or [])
+        self.section_rank = {name: i for i, name in enumerate(self.weights.section_order)}
+
+    def score(self,
+              rows: Sequence[int],
+              cols: Sequence[int],
+              sections: Sequence[str],
+              grades: Sequence[str],
+              direction: SeatDirection,
+              layout: Optional[SeatLayout] = None) -> np.ndarray:
+        """좌석별 점수 계산 (높을수록 좋음, layout이 없으면 주어진 좌석을 배치로 간주)"""
+        rows = np.asarray(rows, dtype=np.float64)
+        cols = np.asarray(cols, dtype=np.float64)
+        if rows.size == 0:
+            return np.empty(0)
+
+        w = self.weights
+        if layout is None or layout.size == 0:
+            layout = SeatLayout(rows, cols, sections)
+        col_norm = self._scale(cols, layout.col_min, layout.col_max)
+
+        # 무대 중앙(전체 배치의 좌우 중심)까지 거리
+        center = (layout.col_min + layout.col_max) / 2
+        half_width = max((layout.col_max - layout.col_min) / 2, 1.0)
+        stage_distance = np.abs(cols - center) / half_width
+
+        # 앞줄일수록 0
+        row_depth = self._scale(rows, layout.row_min, layout.row_max)
+
+        scores = -w.stage_distance * stage_distance - w.row_depth * row_depth
+
+        if w.aisle:
+            scores += w.aisle * self._aisle_proximity(layout, rows, cols, sections)
+
+        if w.section and self.section_rank:
+            unknown = len(self.section_rank)
+            rank = np.fromiter((self.section_rank.get(s, unknown) for s in sections),
+                               dtype=np.float64, count=rows.size)
+            scores -= w.section * rank / max(unknown, 1)
+
+        if w.price and self.grade_prices:
+            prices = np.fromiter((self.grade_prices.get(g, np.nan) for g in grades),
+                                 dtype=np.float64, count=rows.size)
+            known = np.isfinite(prices)
+            if known.any():
+                # 등급 정보가 없는 좌석은 최저가로 간주
+                prices[~known] = prices[known].min()
+                scores += w.price * self._normalize(prices)
+
+        # 같은 줄에서 선택 방향 우선 (줄 간격의 절반보다 작게 해서 줄 순서를 바꾸지 않음)
+        row_span = layout.row_max - layout.row_min
+        tie_scale = w.row_depth * layout.min_row_gap / row_span / 2 if w.row_depth and row_span else 1.0
+        if direction == SeatDirection.RIGHT:
+            scores -= w.direction * tie_scale * col_norm
+        else:
+            scores -= w.direction * tie_scale * (1 - col_norm)
+
+        return scores
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """상위 k개 인덱스를 점수 내림차순으로 반환"""
+        n = scores.size
+        if n == 0 or k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k >= n:
+            return np.argsort(-scores, kind='stable')
+
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    @staticmethod
+    def _aisle_proximity(layout: SeatLayout, rows: np.ndarray, cols: np.ndarray,
+                         sections: Sequence[str]) -> np.ndarray:
+        """배치상 같은 구역, 같은 줄의 옆자리가 없으면(통로/끝자리) 1 (팔린 좌석은 옆자리로 봄)"""
+        left_open = ~layout.has_seat(rows, cols - 1, sections)
+        right_open = ~layout.has_seat(rows, cols + 1, sections)
+        return (left_open | right_open).astype(np.float64)
+
+    @staticmethod
+    def _scale(values: np.ndarray, low: float, high: float) -> np.ndarray:
+        """배치 범위 기준 0~1 변환 (배치 밖 값은 잘라냄)"""
+        if high <= low:
+            return np.zeros_like(values)
+        return np.clip((values - low) / (high - low), 0.0, 1.0)
+
+    @staticmethod
+    def _normalize(values: np.ndarray) -> np.ndarray:
+        span = values.max() - values.min()
+        if span == 0:
+            return np.zeros_like(values)
+        return (values - values.min()) / span
+
+    @staticmethod
+    def _parse_grade_prices(seat_grades: List[Dict]) -> Dict[str, float]:
+        """'VIP석 / 154,000원' 형태의 등급 가격을 숫자로 변환"""
+        prices = {}
+        for grade in seat_grades:
+            digits = re.sub(r'[^\d]', '', grade.get('price', ''))
+            if grade.get('name') and digits:
+                prices[grade['name']] = float(digits)
+        return prices
@@ -1,99 +1,432 @@
-from typing import List, Tuple, Optional
+import json
+from typing import Dict, List, Optional, Tuple
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver import Chrome
 from domain.entities import SeatPreference, SeatSelectionType, SeatDirection
+from infrastructure.interpark.seat_scoring import SeatLayout, SeatScorer, SeatScoringWeights
+from infrastructure.interpark.seat_plan import SeatPlan, SeatKey
+from infrastructure.web_driver.cdp_backend import CdpBackend, CdpError
 import logging
 
 logger = logging.getLogger(__name__)
 
+SEAT_ATTRIBUTES = ('data-row', 'data-col', 'data-section', 'data-grade')
+
+# 좌석 속성을 한 번의 왕복으로 읽어오는 스크립트
+SEAT_ATTRIBUTES_SCRIPT = """
+    var names = arguments[1];
+    return arguments[0].map(function(el) {
+        return names.map(function(name) { return el.getAttribute(name); });
+    });
+"""
+
+# 좌석 선택 상태 (클래스, aria 속성, DOM 연결) - 클릭 전후로 비교해 실제로 선택됐는지 확인
+SEAT_STATE_FUNCTION = """
+    function state(el) {
+        return [el.className, el.getAttribute('aria-selected'), el.getAttribute('aria-pressed'),
+                el.isConnected].join('|');
+    }
+"""
+
+# 선택한 좌석들의 클릭 이벤트를 한 번의 왕복으로 발생시키는 스크립트
+# 합성 이벤트는 페이지가 무시할 수 있으므로 좌석 상태가 바뀐 경우만 성공으로 본다
+CLICK_SEATS_SCRIPT = SEAT_STATE_FUNCTION + """
+    return arguments[0].map(function(el) {
+        try {
+            var before = state(el);
+            var delivered = ['mousedown', 'mouseup', 'click'].map(function(type) {
+                return el.dispatchEvent(new MouseEvent(type, {bubbles: true, cancelable: true, view: window}));
+            });
+            return {changed: state(el) !== before, delivered: delivered[2]};
+        } catch (e) {
+            return {changed: false, delivered: false};
+        }
+    });
+"""
+
+AVAILABLE_SEAT_COUNT_SCRIPT = "return document.querySelectorAll('.seat_available').length;"
+
+# 예매 여부와 관계없이 모든 좌석 (중앙/통로 계산용 배치)
+LAYOUT_SEAT_SELECTOR = "[data-row][data-col]"
+
+LAYOUT_SCRIPT = """
+    var names = arguments[1];
+    return Array.from(document.querySelectorAll(arguments[0])).map(function(el) {
+        return names.map(function(name) { return el.getAttribute(name); });
+    });
+"""
+
+# CDP 경로: 좌석 요소를 페이지에 보관해 두고 속성만 값으로 가져옴
+CDP_READ_SEATS_SCRIPT = """
+(function(names) {
+    var seats = Array.from(document.querySelectorAll('.seat_available'));
+    window.__plannedSeats = seats;
+    return seats.map(function(el) {
+        return names.map(function(name) { return el.getAttribute(name); });
+    });
+})(%s)
+"""
+
+# CDP 경로: 보관한 좌석 하나의 클릭 좌표와 현재 상태 (스크롤하면 다른 좌석 좌표가 바뀌므로 클릭 직전에 좌석마다 계산)
+# iframe 안의 좌표는 최상위 페이지 좌표로 변환
+CDP_SEAT_POINT_SCRIPT = """
+(function(i) {""" + SEAT_STATE_FUNCTION + """
+    var el = (window.__plannedSeats || [])[i];
+    if (!el || !el.isConnected) return null;
+    el.scrollIntoView({block: 'center', inline: 'center'});
+    var rect = el.getBoundingClientRect();
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    for (var w = window; w.frameElement; w = w.parent) {
+        var frame = w.frameElement.getBoundingClientRect();
+        x += frame.left + w.frameElement.clientLeft;
+        y += frame.top + w.frameElement.clientTop;
+    }
+    return {x: x, y: y, state: state(el)};
+})(%d)
+"""
+
+CDP_SEAT_STATE_SCRIPT = """
+(function(i) {""" + SEAT_STATE_FUNCTION + """
+    var el = (window.__plannedSeats || [])[i];
+    return el ? state(el) : null;
+})(%d)
+"""
+
+CDP_AVAILABLE_SEAT_COUNT_SCRIPT = "document.querySelectorAll('.seat_available').length"
+
+CDP_LAYOUT_SCRIPT = """
+(function(selector, names) {
+    return Array.from(document.querySelectorAll(selector)).map(function(el) {
+        return names.map(function(name) { return el.getAttribute(name); });
+    });
+})(%s, %s)
+"""
+
+
+class CdpSeat:
+    """CDP로 읽은 좌석 (WebElement 대체, 페이지에 보관한 요소의 순번으로 참조)"""
+
+    def __init__(self, index: int, values: List[Optional[str]], selector: "SeatSelector"):
+        self.index = index
+        self.values = values
+        self.selector = selector
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.values[SEAT_ATTRIBUTES.index(name)] if name in SEAT_ATTRIBUTES else None
+
+    def click(self):
+        """Selenium으로 클릭 (CDP 클릭이 실패했을 때 사용하는 기존 경로)"""
+        self.selector._find_element(self).click()
+
 
 class SeatSelector:
-    def __init__(self, driver: Chrome):
+    def __init__(self, driver: Chrome,
+                 seat_grades: Optional[List[Dict]] = None,
+                 weights: Optional[SeatScoringWeights] = None,
+                 plan_depth: int = 64,
+                 plan_refresh_ratio: float = 0.2,
+                 cdp: Optional[CdpBackend] = None,
+                 cdp_frame: Optional[str] = None):
         self.driver = driver
+        # 설정 시 좌석 조회/클릭은 CDP로 직접 처리 (실패하면 Selenium 사용)
+        self.cdp = cdp
+        self.cdp_frame = cdp_frame
+        self.scorer = SeatScorer(weights, seat_grades)
+        self.plan_depth = plan_depth
+        self.plan_refresh_ratio = plan_refresh_ratio
+        self.plan: Optional[SeatPlan] = None
+        # 좌석 배치는 공연 중 바뀌지 않으므로 처음 한 번만 읽음
+        self.layout: Optional[SeatLayout] = None
         self.selected_seats: List[WebElement] = []
         
     def select_seats(self, preference: SeatPreference) -> bool:
         """좌석 선택 수행"""
         try:
-            available_seats = self._get_available_seats()
+            candidate_seats = self._next_candidate_seats(preference)
             
-            if not available_seats:
+            if not candidate_seats:
                 logger.warning("No available seats found")
                 return False
                 
             if preference.selection_type == SeatSelectionType.SMALL_GRAPE:
-                return self._select_small_grape_pattern(available_seats, preference)
+                return self._select_small_grape_pattern(candidate_seats, preference)
             elif preference.selection_type == SeatSelectionType.LARGE_GRAPE:
-                return self._select_large_grape_pattern(available_seats, preference)
+                return self._select_large_grape_pattern(candidate_seats, preference)
             else:
-                return self._select_normal_pattern(available_seats, preference)
+                return self._select_normal_pattern(candidate_seats, preference)
                 
         except Exception as e:
-            logger.error(f"Error selecting seats: {str(e)}")
+            # 좌석 요소가 갱신되었을 수 있으므로 다음 시도에서 계획을 새로 만든다
+            self.plan = None
+            logger.error("Error selecting seats: %s", e)
             return False
             
+    def mark_conflict(self):
+        """직전에 시도한 좌석을 이미 선택된 좌석으로 처리"""
+        if self.plan:
+            self.plan.mark_last_group_lost()
+            
+    def _next_candidate_seats(self, preference: SeatPreference) -> List[WebElement]:
+        """후보 계획에서 다음 좌석 묶음 반환 (좌석 현황이 크게 바뀌면 계획 갱신)"""
+        preference_key = (preference.selection_type, preference.direction, preference.count)
+        rebuilt = False
+        
+        if self.plan is None or self.plan.is_stale(
+                self._count_available_seats(), preference_key, self.plan_refresh_ratio):
+            self.plan = self._build_plan(preference, preference_key)
+            rebuilt = True
+            
+        group = self.plan.next_group()
+        if not group and not rebuilt:
+            self.plan = self._build_plan(preference, preference_key)
+            group = self.plan.next_group()
+            
+        return [self.plan.seats[i] for i in group]
+        
+    def _build_plan(self, preference: SeatPreference, preference_key) -> SeatPlan:
+        """전체 좌석을 한 번 조회/점수화하여 후보 계획 생성"""
+        if self.layout is None:
+            self.layout = self._read_layout()
+        available_seats = self._get_available_seats()
+        ranked_seats, keys = self._rank_seats(available_seats, preference.direction, self.plan_depth)
+        
+        logger.debug("Built seat plan: %s candidates from %s seats", len(ranked_seats), len(available_seats))
+        
+        return SeatPlan(ranked_seats, keys, self._group_size(preference),
+                        len(available_seats), preference_key)
+        
+    @staticmethod
+    def _group_size(preference: SeatPreference) -> int:
+        if preference.selection_type == SeatSelectionType.SMALL_GRAPE:
+            return min(4, preference.count)
+        if preference.selection_type == SeatSelectionType.LARGE_GRAPE:
+            return min(2, preference.count)
+        return preference.count
+        
+    def _count_available_seats(self) -> int:
+        """사용 가능한 좌석 수만 조회 (요소 전송 없이)"""
+        if self.cdp:
+            try:
+                count = self.cdp.evaluate(CDP_AVAILABLE_SEAT_COUNT_SCRIPT, self._cdp_frame_id())
+                if isinstance(count, int):
+                    return count
+            except CdpError as e:
+                logger.debug("CDP seat count failed: %s", e)
+                
+        try:
+            count = self.driver.execute_script(AVAILABLE_SEAT_COUNT_SCRIPT)
+            if isinstance(count, int):
+                return count
+        except Exception as e:
+            logger.debug("Seat count script failed: %s", e)
+            
+        return len(self._get_available_seats())
+        
     def _get_available_seats(self) -> List[WebElement]:
         """사용 가능한 좌석 조회"""
+        if self.cdp:
+            try:
+                values = self.cdp.evaluate(CDP_READ_SEATS_SCRIPT % json.dumps(SEAT_ATTRIBUTES), self._cdp_frame_id())
+                if isinstance(values, list):
+                    return [CdpSeat(i, row, self) for i, row in enumerate(values)]
+            except CdpError as e:
+                logger.debug("CDP seat read failed: %s", e)
+                
         try:
             return self.driver.find_elements(By.CSS_SELECTOR, ".seat_available")
         except Exception as e:
-            logger.error(f"Failed to get available seats: {str(e)}")
+            logger.error("Failed to get available seats: %s", e)
             return []
             
     def _select_small_grape_pattern(self, seats: List[WebElement], 
                                    preference: SeatPreference) -> bool:
         """작은 포도알 패턴으로 좌석 선택 (최대 4석)"""
-        sorted_seats = self._sort_seats_by_preference(seats, preference.direction)
         seats_to_select = min(4, preference.count)
         
-        for seat in sorted_seats[:seats_to_select]:
-            seat.click()
-            self.selected_seats.append(seat)
-            
-        return len(self.selected_seats) > 0
+        return self._select_exactly(seats, seats_to_select)
         
     def _select_large_grape_pattern(self, seats: List[WebElement], 
                                    preference: SeatPreference) -> bool:
         """큰 포도알 패턴으로 좌석 선택 (최대 2석)"""
-        sorted_seats = self._sort_seats_by_preference(seats, preference.direction)
         seats_to_select = min(2, preference.count)
         
-        for seat in sorted_seats[:seats_to_select]:
-            seat.click()
-            self.selected_seats.append(seat)
-            
-        return len(self.selected_seats) > 0
+        return self._select_exactly(seats, seats_to_select)
         
     def _select_normal_pattern(self, seats: List[WebElement], 
                               preference: SeatPreference) -> bool:
         """일반 패턴으로 좌석 선택"""
-        sorted_seats = self._sort_seats_by_preference(seats, preference.direction)
+        return self._select_exactly(seats, preference.count)
         
-        for i in range(min(len(sorted_seats), preference.count)):
-            sorted_seats[i].click()
-            self.selected_seats.append(sorted_seats[i])
+    def _select_exactly(self, seats: List[WebElement], quantity: int) -> bool:
+        """quantity석을 모두 선택한 경우만 성공 (일부만 선택되면 선택을 되돌림)"""
+        results = self._click_seats(seats[:quantity])
+        clicked = [seat for seat, ok in zip(seats, results) if ok]
+        if len(clicked) == quantity:
+            return True
             
-        return len(self.selected_seats) > 0
-        
-    def _sort_seats_by_preference(self, seats: List[WebElement], 
-                                 direction: SeatDirection) -> List[WebElement]:
-        """선호도에 따라 좌석 정렬"""
-        seat_with_positions: List[Tuple[WebElement, int, int]] = []
+        if clicked:
+            logger.warning("Only %s of %s seats selected, releasing partial selection", len(clicked), quantity)
+            self._release_seats(clicked)
+        return False
         
+    def _release_seats(self, seats: List[WebElement]):
+        """선택한 좌석을 다시 클릭해 선택 해제"""
         for seat in seats:
             try:
-                row = int(seat.get_attribute('data-row') or '0')
-                col = int(seat.get_attribute('data-col') or '0')
-                seat_with_positions.append((seat, row, col))
-            except (ValueError, TypeError):
+                seat.click()
+            except Exception as e:
+                logger.warning("Failed to release seat: %s", e)
+            if seat in self.selected_seats:
+                self.selected_seats.remove(seat)
+                
+    def _click_seats(self, seats: List[WebElement]) -> List[bool]:
+        """좌석 일괄 클릭 후 좌석별 성공 여부 반환 (스크립트 실패 시 개별 클릭)"""
+        results = None
+        if seats and isinstance(seats[0], CdpSeat):
+            results = self._cdp_click(seats)
+        else:
+            try:
+                outcomes = self.driver.execute_script(CLICK_SEATS_SCRIPT, seats)
+                if isinstance(outcomes, list):
+                    results = [bool(outcome and outcome.get('changed')) for outcome in outcomes]
+                    cancelled = sum(1 for outcome in outcomes if outcome and not outcome.get('delivered'))
+                    if cancelled:
+                        logger.debug("Synthetic click cancelled by page for %s seats", cancelled)
+            except Exception as e:
+                logger.debug("Batched click failed: %s", e)
+                
+        if not isinstance(results, list) or len(results) != len(seats):
+            results = [False] * len(seats)
+            
+        # 일괄 클릭으로 상태가 바뀌지 않은 좌석은 개별 클릭
+        for i, seat in enumerate(seats):
+            if results[i]:
+                continue
+            try:
+                seat.click()
+                results[i] = True
+            except Exception as e:
+                logger.debug("Seat click failed: %s", e)
+                
+        if seats and not any(results):
+            # 좌석 요소가 모두 무효화됨 - 다음 시도에서 계획 재생성
+            self.plan = None
+            
+        self.selected_seats.extend(seat for seat, clicked in zip(seats, results) if clicked)
+        return results
+        
+    def _rank_seats(self, seats: List[WebElement], 
+                    direction: SeatDirection, count: int) -> Tuple[List[WebElement], List[SeatKey]]:
+        """점수 상위 count개 좌석과 좌석 키를 순서대로 반환"""
+        valid_seats = []
+        rows, cols, sections, grades = [], [], [], []
+        
+        for seat, (row, col, section, grade) in zip(seats, self._read_seat_attributes(seats)):
+            position = self._parse_position(row, col)
+            if position is None:
                 continue
+            valid_seats.append(seat)
+            rows.append(position[0])
+            cols.append(position[1])
+            sections.append(section or '')
+            grades.append(grade or '')
+            
+        scores = self.scorer.score(rows, cols, sections, grades, direction, self.layout)
+        top = self.scorer.top_k(scores, count)
+        
+        return [valid_seats[i] for i in top], [SeatPlan.seat_key(sections[i], rows[i], cols[i]) for i in top]
+        
+    @staticmethod
+    def _parse_position(row: Optional[str], col: Optional[str]) -> Optional[Tuple[int, int]]:
+        """좌석 줄/열 변환 (형식이 잘못된 좌석은 None - 해당 좌석만 제외)"""
+        try:
+            return int(row or '0'), int(col or '0')
+        except (ValueError, TypeError):
+            return None
+            
+    def _read_layout(self) -> Optional[SeatLayout]:
+        """예매 가능 여부와 관계없이 전체 좌석 배치 조회 (실패하면 None - 예매 가능 좌석으로 계산)"""
+        values = None
+        if self.cdp:
+            try:
+                values = self.cdp.evaluate(
+                    CDP_LAYOUT_SCRIPT % (json.dumps(LAYOUT_SEAT_SELECTOR), json.dumps(SEAT_ATTRIBUTES)),
+                    self._cdp_frame_id())
+            except CdpError as e:
+                logger.debug("CDP layout read failed: %s", e)
+                
+        if not isinstance(values, list):
+            try:
+                values = self.driver.execute_script(LAYOUT_SCRIPT, LAYOUT_SEAT_SELECTOR, list(SEAT_ATTRIBUTES))
+            except Exception as e:
+                logger.debug("Layout script failed: %s", e)
+                
+        if not isinstance(values, list):
+            try:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, LAYOUT_SEAT_SELECTOR)
+                values = [[element.get_attribute(name) for name in SEAT_ATTRIBUTES] for element in elements]
+            except Exception as e:
+                logger.debug("Layout read failed: %s", e)
+                return None
+                
+        rows, cols, sections = [], [], []
+        for row, col, section, _ in values:
+            position = self._parse_position(row, col)
+            if position is not None:
+                rows.append(position[0])
+                cols.append(position[1])
+                sections.append(section or '')
+                
+        return SeatLayout(rows, cols, sections) if rows else None
+        
+    def _read_seat_attributes(self, seats: List[WebElement]) -> List[List[Optional[str]]]:
+        """좌석 속성 일괄 조회 (스크립트 실패 시 개별 조회)"""
+        if seats and isinstance(seats[0], CdpSeat):
+            return [seat.values for seat in seats]
+            
+        try:
+            values = self.driver.execute_script(SEAT_ATTRIBUTES_SCRIPT, seats, list(SEAT_ATTRIBUTES))
+            if values and len(values) == len(seats):
+                return values
+        except Exception as e:
+            logger.debug("Bulk attribute read failed: %s", e)
+            
+        return [[seat.get_attribute(name) for name in SEAT_ATTRIBUTES] for seat in seats]
+        
+    def _cdp_frame_id(self) -> Optional[str]:
+        return self.cdp.frame_id(self.cdp_frame) if self.cdp_frame else None
+        
+    def _cdp_click(self, seats: List[CdpSeat]) -> List[bool]:
+        """좌석마다 클릭 직전에 좌표를 구해 실제 마우스 입력으로 클릭하고 상태가 바뀌었는지 확인"""
+        results = []
+        try:
+            frame_id = self._cdp_frame_id()
+        except CdpError as e:
+            logger.debug("CDP frame lookup failed: %s", e)
+            return [False] * len(seats)
+            
+        for seat in seats:
+            try:
+                point = self.cdp.evaluate(CDP_SEAT_POINT_SCRIPT % seat.index, frame_id)
+                if not point:
+                    results.append(False)
+                    continue
+                self.cdp.click_at(point['x'], point['y'])
+                state = self.cdp.evaluate(CDP_SEAT_STATE_SCRIPT % seat.index, frame_id)
+                results.append(state is not None and state != point['state'])
+            except CdpError as e:
+                logger.debug("CDP click failed: %s", e)
+                results.append(False)
                 
-        seat_with_positions.sort(
-            key=lambda x: (x[1], x[2] if direction == SeatDirection.RIGHT else -x[2])
-        )
+        return results
         
-        return [seat[0] for seat in seat_with_positions]
+    def _find_element(self, seat: CdpSeat) -> WebElement:
+        """CDP로 읽은 좌석에 해당하는 Selenium 요소 (좌석 iframe으로 전환된 상태에서 호출)"""
+        # 선택 후에는 seat_available 클래스가 빠질 수 있으므로 좌석 속성으로만 찾음 (선택 해제 시)
+        selector = ''.join(
+            f"[{name}={json.dumps(value)}]" for name, value in zip(SEAT_ATTRIBUTES, seat.values) if value is not None)
+        return self.driver.find_element(By.CSS_SELECTOR, selector)
         
     def clear_selection(self):
         """선택한 좌석 초기화"""
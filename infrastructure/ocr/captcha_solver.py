@@ -8,12 +8,14 @@ import logging
 from typing import Optional
 from selenium.webdriver.remote.webelement import WebElement
 
+from config.settings import Settings
+
 logger = logging.getLogger(__name__)
 
 
 class CaptchaSolver:
-    def __init__(self):
-        self.tesseract_config = '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    def __init__(self, tesseract_config: Optional[str] = None):
+        self.tesseract_config = tesseract_config or Settings.TESSERACT_CONFIG
         
     def solve(self, captcha_element: WebElement) -> Optional[str]:
         """캡차 이미지를 해결하고 텍스트 반환"""
@@ -23,11 +25,11 @@ class CaptchaSolver:
             text = self._perform_ocr(processed_image)
             cleaned_text = self._clean_text(text)
             
-            logger.info(f"Captcha solved: {cleaned_text}")
+            logger.info("Captcha solved: %s", cleaned_text)
             return cleaned_text
             
         except Exception as e:
-            logger.error(f"Failed to solve captcha: {str(e)}")
+            logger.error("Failed to solve captcha: %s", e)
             return None
             
     def _capture_element_image(self, element: WebElement) -> np.ndarray:
@@ -56,7 +58,7 @@ class CaptchaSolver:
             text = pytesseract.image_to_string(image, config=self.tesseract_config)
             return text.strip()
         except Exception as e:
-            logger.error(f"OCR failed: {str(e)}")
+            logger.error("OCR failed: %s", e)
             return ""
             
     def _clean_text(self, text: str) -> str:
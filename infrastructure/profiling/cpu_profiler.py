@@ -0,0 +1,107 @@
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CpuProfiler:
+    """cProfile 기반 호출 단위 CPU 프로파일러 (설정으로 켬)
+
+    호출마다 .prof 파일을 남기고 상위 N개 함수 요약을 로그로 출력한다.
+    같은 스레드에서 중첩 호출되면 가장 바깥 호출만 기록한다.
+    """
+
+    def __init__(self, enabled: bool = False, output_dir: str = "profiles", keep: int = 20,
+                 top_n: int = 20, sort_key: str = "cumulative"):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.keep = keep
+        self.top_n = top_n
+        self.sort_key = sort_key
+        self._local = threading.local()
+        self._rotate_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "CpuProfiler":
+        return cls(
+            enabled=settings.CPU_PROFILE_ENABLED,
+            output_dir=settings.CPU_PROFILE_DIR,
+            keep=settings.CPU_PROFILE_KEEP,
+            top_n=settings.CPU_PROFILE_TOP_N
+        )
+
+    @contextmanager
+    def profile(self, name: str):
+        """with 블록 실행 구간 프로파일링"""
+        if not self.enabled or getattr(self._local, 'active', False):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # 다른 프로파일러가 이미 동작 중 (예: 다른 스레드의 sys.monitoring 기반 프로파일러)
+            logger.debug("CPU 프로파일링 생략 (%s): %s", name, e)
+            yield
+            return
+
+        self._local.active = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._local.active = False
+            self._report(name, profiler, time.perf_counter() - started)
+
+    def _report(self, name: str, profiler: cProfile.Profile, elapsed: float):
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+            path = os.path.join(self.output_dir, f"{safe_name}_{datetime.now():%Y%m%d_%H%M%S_%f}.prof")
+            profiler.dump_stats(path)
+            self._rotate()
+
+            buffer = io.StringIO()
+            stats = pstats.Stats(profiler, stream=buffer)
+            stats.strip_dirs().sort_stats(self.sort_key).print_stats(self.top_n)
+            logger.info("CPU 프로파일 [%s] %.3f초 → %s\n%s", name, elapsed, path, buffer.getvalue())
+        except Exception as e:
+            logger.error("CPU 프로파일 저장 실패: %s", e)
+
+    def _rotate(self):
+        """오래된 프로파일 파일 정리 (최근 keep개 유지)"""
+        with self._rotate_lock:
+            files = [os.path.join(self.output_dir, f) for f in os.listdir(self.output_dir) if f.endswith('.prof')]
+            files.sort(key=os.path.getmtime, reverse=True)
+            for path in files[self.keep:]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def profiled(name: Optional[str] = None):
+    """메서드 프로파일링 데코레이터 (인스턴스의 cpu_profiler 사용)"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, 'cpu_profiler', None)
+            if profiler is None or not profiler.enabled:
+                return func(self, *args, **kwargs)
+            with profiler.profile(label):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,336 @@
+import logging
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from domain.entities import (
+    Reservation, Performance, SeatPreference, SeatSelectionType, SeatDirection, ReservationPhase
+)
+from domain.repositories.reservation_repository import ReservationRepository
+from domain.use_cases import MakeReservationUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LatencyDistribution:
+    """메서드 지연 시간 분포 (초)
+
+    kind: "constant" (mean), "uniform" (mean ± spread), "lognormal" (평균 mean, 로그 표준편차 spread)
+    """
+    kind: str = "lognormal"
+    mean: float = 0.05
+    spread: float = 0.5
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.mean
+        if self.kind == "uniform":
+            return max(0.0, rng.uniform(self.mean - self.spread, self.mean + self.spread))
+        # 평균이 mean이 되도록 mu 보정
+        mu = math.log(self.mean) - self.spread ** 2 / 2
+        return rng.lognormvariate(mu, self.spread)
+
+
+@dataclass
+class SimulationConfig:
+    """시뮬레이션 설정"""
+    total_seats: int = 200
+    conflict_probability: float = 0.2
+    captcha_failure_rate: float = 0.1
+    queue_failure_rate: float = 0.0
+    # 다른 예매자들이 가상 시간 1초당 가져가는 좌석 수
+    competitor_rate: float = 20.0
+    latencies: Dict[str, LatencyDistribution] = field(default_factory=lambda: {
+        'enter_queue': LatencyDistribution(mean=1.5, spread=0.6),
+        'enter_reservation_window': LatencyDistribution(mean=0.8, spread=0.4),
+        'solve_captcha': LatencyDistribution(mean=0.4, spread=0.3),
+        'select_seats': LatencyDistribution(mean=0.25, spread=0.4),
+        'handle_seat_conflict': LatencyDistribution(mean=0.1, spread=0.3)
+    })
+
+
+class VirtualClock:
+    """가상 시계 (실제로 기다리지 않고 시간만 진행)"""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class VirtualTimeline:
+    """여러 가상 예매자를 가상 시각 순서대로 번갈아 실행하는 스케줄러
+
+    예매자마다 스레드를 두되 한 번에 하나만 실행한다. 지연 시간만큼 시계를 진행한 예매자는
+    차례를 내려놓고, 다음 이벤트 시각이 가장 이른 예매자(같으면 먼저 참가한 예매자)가 이어서 실행된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._times: Dict[int, float] = {}
+        self._turns: Dict[int, threading.Event] = {}
+        self._ids = 0
+
+    def join(self, start: float) -> int:
+        """참가자 등록 (start 시각에 첫 차례를 받음)"""
+        with self._lock:
+            participant = self._ids
+            self._ids += 1
+            self._times[participant] = start
+            self._turns[participant] = threading.Event()
+            return participant
+
+    def wait(self, participant: int, at: float):
+        """at 시각까지 진행했음을 알리고 다시 차례가 올 때까지 대기"""
+        with self._lock:
+            self._times[participant] = at
+            turn = self._turns[participant]
+            turn.clear()
+            self._hand_off()
+        turn.wait()
+
+    def leave(self, participant: int):
+        with self._lock:
+            self._times.pop(participant, None)
+            self._turns.pop(participant, None)
+            self._hand_off()
+
+    def _hand_off(self):
+        if self._times:
+            earliest = min(self._times, key=lambda key: (self._times[key], key))
+            self._turns[earliest].set()
+
+
+class SeatInventory:
+    """여러 가상 예매자가 공유하는 잔여 좌석
+
+    다른 예매자들은 competitor_rate에 따라 가상 시간이 흐른 만큼 좌석을 가져간다.
+    """
+
+    def __init__(self, total_seats: int, competitor_rate: float = 0.0):
+        self.remaining = total_seats
+        self.competitor_rate = competitor_rate
+        self._drained_until = 0.0
+        self._carry = 0.0
+        self._lock = threading.Lock()
+
+    def available(self, at: float) -> int:
+        with self._lock:
+            self._drain_until(at)
+            return self.remaining
+
+    def try_claim(self, count: int, at: float) -> bool:
+        with self._lock:
+            self._drain_until(at)
+            if self.remaining < count:
+                return False
+            self.remaining -= count
+            return True
+
+    def _drain_until(self, at: float):
+        if at <= self._drained_until or not self.competitor_rate:
+            return
+        self._carry += (at - self._drained_until) * self.competitor_rate
+        self._drained_until = at
+        taken = min(self.remaining, int(self._carry))
+        self.remaining -= taken
+        self._carry -= taken
+
+
+class SimulatedRepository(ReservationRepository):
+    """브라우저 없이 동작하는 메모리 내 ReservationRepository
+
+    메서드마다 지연 시간 분포에서 값을 뽑아 가상 시계를 진행시키고,
+    좌석 충돌, 보안문자 실패, 잔여 좌석 소진을 설정한 확률대로 재현한다.
+    """
+
+    def __init__(self, config: Optional[SimulationConfig] = None,
+                 inventory: Optional[SeatInventory] = None,
+                 clock: Optional[VirtualClock] = None,
+                 rng: Optional[random.Random] = None,
+                 realtime: bool = False,
+                 timeline: Optional[VirtualTimeline] = None):
+        self.config = config or SimulationConfig()
+        self.inventory = inventory or SeatInventory(self.config.total_seats, self.config.competitor_rate)
+        self.clock = clock or VirtualClock()
+        self.rng = rng or random.Random()
+        self.realtime = realtime
+        self.timeline = timeline
+        self.participant = timeline.join(self.clock.now) if timeline else None
+        self.phase: Optional[ReservationPhase] = None
+        self.seat_attempts = 0
+        self.conflicts = 0
+        self._pending_conflict = False
+
+    def enter_queue(self, reservation: Reservation) -> bool:
+        self._spend('enter_queue')
+        if self.rng.random() < self.config.queue_failure_rate:
+            return False
+        self.phase = ReservationPhase.RESERVATION_WINDOW
+        return True
+
+    def enter_reservation_window(self) -> bool:
+        self._spend('enter_reservation_window')
+        self.phase = ReservationPhase.CAPTCHA
+        return True
+
+    def solve_captcha(self) -> Optional[str]:
+        self._spend('solve_captcha')
+        if self.rng.random() < self.config.captcha_failure_rate:
+            return None
+        self.phase = ReservationPhase.SEAT_SELECTION
+        return "SIM"
+
+    def select_seats(self, reservation: Reservation) -> bool:
+        self._spend('select_seats')
+        self.seat_attempts += 1
+
+        count = reservation.seat_preference.count
+        if self.inventory.available(self.clock.now) < count:
+            return False
+
+        # 다른 예매자가 같은 좌석을 먼저 잡은 경우
+        if self.rng.random() < self.config.conflict_probability:
+            self._pending_conflict = True
+            self.conflicts += 1
+            return False
+
+        return self.inventory.try_claim(count, self.clock.now)
+
+    def handle_seat_conflict(self) -> bool:
+        self._spend('handle_seat_conflict')
+        conflict, self._pending_conflict = self._pending_conflict, False
+        return conflict
+
+    def detect_phase(self) -> Optional[ReservationPhase]:
+        return self.phase
+
+    def _spend(self, method: str):
+        latency = self.config.latencies[method].sample(self.rng) if method in self.config.latencies else 0.0
+        self.clock.advance(latency)
+        if self.realtime:
+            time.sleep(latency)
+        if self.timeline:
+            # 다른 예매자가 더 이른 시각의 작업을 먼저 처리하도록 차례를 넘김
+            self.timeline.wait(self.participant, self.clock.now)
+
+
+@dataclass
+class SimulationReport:
+    """시뮬레이션 결과"""
+    runs: int
+    successes: int
+    booking_times: List[float]
+    seat_attempts: List[int]
+    wall_seconds: float
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.runs if self.runs else 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.wall_seconds if self.wall_seconds else 0.0
+
+    def percentile_time(self, ratio: float) -> float:
+        times = sorted(self.booking_times)
+        return times[min(len(times) - 1, int(len(times) * ratio))] if times else 0.0
+
+    def format_report(self) -> str:
+        average_attempts = sum(self.seat_attempts) / len(self.seat_attempts) if self.seat_attempts else 0.0
+        return (f"시뮬레이션 {self.runs}회: 성공률 {self.success_rate:.1%}, "
+                f"가상 소요 시간 p50 {self.percentile_time(0.5):.2f}초 / p95 {self.percentile_time(0.95):.2f}초, "
+                f"평균 좌석 시도 {average_attempts:.1f}회, 초당 {self.runs_per_second:.0f}회 실행")
+
+
+def run_simulation(config: Optional[SimulationConfig] = None, runs: int = 1000, users: int = 1,
+                   max_seat_retry: int = 100, seat_count: int = 1, seed: Optional[int] = None,
+                   quiet: bool = True) -> SimulationReport:
+    """MakeReservationUseCase를 시뮬레이터로 반복 실행
+
+    users명이 같은 잔여 좌석을 두고 경쟁하는 라운드를 runs // users번 반복한다.
+    한 라운드의 예매자들은 VirtualTimeline으로 가상 시각 순서대로 번갈아 실행되므로
+    잔여 좌석 확인과 좌석 확보가 실제 도착 순서대로 일어난다.
+    """
+    config = config or SimulationConfig()
+    rng = random.Random(seed)
+    reservation = Reservation(
+        performance=Performance(name="simulation", url="sim://performance", date="", time=""),
+        target_time=datetime.now(),
+        seat_preference=SeatPreference(SeatSelectionType.NORMAL, SeatDirection.RIGHT, seat_count)
+    )
+
+    # 실행마다 남는 진행 로그가 측정을 왜곡하지 않도록 잠시 끔
+    use_case_logger = logging.getLogger(MakeReservationUseCase.__module__)
+    previous_level = use_case_logger.level
+    if quiet:
+        use_case_logger.setLevel(logging.WARNING)
+
+    successes = 0
+    booking_times: List[float] = []
+    seat_attempts: List[int] = []
+    rounds = max(1, runs // max(1, users))
+    # 예매자 스레드는 라운드마다 만들지 않고 전체 실행 동안 재사용
+    pool = ThreadPoolExecutor(max_workers=users, thread_name_prefix="sim-user") if users > 1 else None
+    started = time.perf_counter()
+    try:
+        for _ in range(rounds):
+            inventory = SeatInventory(config.total_seats, config.competitor_rate)
+            timeline = VirtualTimeline() if users > 1 else None
+            repositories = [
+                SimulatedRepository(config, inventory, rng=random.Random(rng.random()), timeline=timeline)
+                for _ in range(max(1, users))
+            ]
+            results = _run_round(repositories, reservation, max_seat_retry, pool)
+            for repository, success in zip(repositories, results):
+                if success:
+                    successes += 1
+                    booking_times.append(repository.clock.now)
+                seat_attempts.append(repository.seat_attempts)
+    finally:
+        if pool:
+            pool.shutdown(wait=True)
+        use_case_logger.setLevel(previous_level)
+
+    report = SimulationReport(
+        runs=rounds * max(1, users),
+        successes=successes,
+        booking_times=booking_times,
+        seat_attempts=seat_attempts,
+        wall_seconds=time.perf_counter() - started
+    )
+    logger.info(report.format_report())
+    return report
+
+
+def _run_round(repositories: List[SimulatedRepository], reservation: Reservation,
+               max_seat_retry: int, pool: Optional[ThreadPoolExecutor] = None) -> List[bool]:
+    """한 라운드 실행 (pool이 있으면 예매자마다 작업자 하나를 써서 타임라인 순서대로 번갈아 실행)"""
+    results = [False] * len(repositories)
+
+    def run(index: int, repository: SimulatedRepository):
+        try:
+            if repository.timeline:
+                repository.timeline.wait(repository.participant, repository.clock.now)
+            results[index] = MakeReservationUseCase(repository, max_seat_retry).execute(reservation)
+        except Exception as e:
+            logger.error("시뮬레이션 실행 오류: %s", e)
+        finally:
+            if repository.timeline:
+                repository.timeline.leave(repository.participant)
+
+    if pool is None or not repositories[0].timeline:
+        for index, repository in enumerate(repositories):
+            run(index, repository)
+        return results
+
+    # 작업자 수가 예매자 수와 같아야 모든 예매자가 타임라인에서 차례를 기다릴 수 있음
+    wait([pool.submit(run, index, repository) for index, repository in enumerate(repositories)])
+    return results
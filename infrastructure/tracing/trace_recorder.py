@@ -0,0 +1,81 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from domain.entities import ReservationPhase
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류 (파일 크기를 줄이기 위해 짧은 키 사용)
+EVENT_PHASE = "phase"
+EVENT_COMMAND = "cmd"
+EVENT_SEAT_MAP = "dom"
+EVENT_POPUP = "popup"
+
+
+class TraceRecorder:
+    """예매 실행 추적 기록기 (gzip JSON Lines 파일)"""
+
+    def __init__(self, trace_dir: str):
+        self.trace_dir = trace_dir
+        self.path = os.path.join(trace_dir, f"trace_{datetime.now():%Y%m%d_%H%M%S}.jsonl.gz")
+        self.phase: Optional[str] = None
+        self._events: List[Dict[str, Any]] = []
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def on_phase(self, phase: ReservationPhase):
+        """유스케이스 단계 전환 기록"""
+        self.phase = phase.value
+        self._append(EVENT_PHASE, {})
+
+    def record_command(self, name: str, duration: float, failed: bool = False):
+        """WebDriver 명령 기록 (WebDriverManager 명령 리스너)"""
+        event = {'n': name, 'd': round(duration, 6)}
+        if failed:
+            event['e'] = 1
+        self._append(EVENT_COMMAND, event)
+
+    def record_seat_map(self, html: str):
+        """좌석 iframe DOM 스냅샷 기록"""
+        self._append(EVENT_SEAT_MAP, {'html': html})
+
+    def record_popup(self, text: str, handled: bool):
+        self._append(EVENT_POPUP, {'text': text, 'handled': handled})
+
+    def save(self) -> Optional[str]:
+        """추적 파일 저장"""
+        with self._lock:
+            events = list(self._events)
+        if not events:
+            return None
+
+        try:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')))
+                    f.write('\n')
+            logger.info("추적 파일 저장: %s (%s개 이벤트)", self.path, len(events))
+            return self.path
+        except Exception as e:
+            logger.error("추적 파일 저장 실패: %s", e)
+            return None
+
+    def _append(self, kind: str, event: Dict[str, Any]):
+        event['k'] = kind
+        event['t'] = round(time.perf_counter() - self._started, 6)
+        event['p'] = self.phase
+        with self._lock:
+            self._events.append(event)
+
+
+def load_trace(path: str) -> List[Dict[str, Any]]:
+    """추적 파일 읽기"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
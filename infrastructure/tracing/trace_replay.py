@@ -0,0 +1,109 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
+
+from domain.entities import SeatPreference
+from infrastructure.interpark.seat_selector import SeatSelector
+from infrastructure.tracing.trace_recorder import EVENT_SEAT_MAP, load_trace
+
+logger = logging.getLogger(__name__)
+
+
+class ReplaySeat:
+    """기록된 좌석 요소 (WebElement 대체)"""
+
+    def __init__(self, attrs: Dict[str, str]):
+        self.attrs = attrs
+        self.clicked = False
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        value = self.attrs.get(name)
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+
+    def click(self):
+        self.clicked = True
+
+    @property
+    def position(self) -> Tuple[str, str]:
+        return self.attrs.get('data-row', ''), self.attrs.get('data-col', '')
+
+
+class ReplayDriver:
+    """기록된 좌석 맵을 제공하는 오프라인 드라이버"""
+
+    def __init__(self, html: str):
+        self.soup = BeautifulSoup(html, 'html.parser')
+        self.seats: List[ReplaySeat] = []
+
+    def find_elements(self, by: str, value: str) -> List[ReplaySeat]:
+        if by == By.CSS_SELECTOR:
+            elements = self.soup.select(value)
+        elif by == By.ID:
+            elements = self.soup.find_all(id=value)
+        elif by == By.CLASS_NAME:
+            elements = self.soup.find_all(class_=value)
+        elif by == By.TAG_NAME:
+            elements = self.soup.find_all(value)
+        else:
+            raise ValueError(f"Replay supports CSS selector, id, class name and tag name lookups only: {by}")
+        self.seats = [ReplaySeat(dict(elem.attrs)) for elem in elements]
+        return self.seats
+
+    def execute_script(self, script: str, *args):
+        # 오프라인에서는 스크립트를 실행할 수 없음 - None을 받으면 SeatSelector는 좌석별 조회/클릭을 사용
+        return None
+
+
+@dataclass
+class ReplayResult:
+    snapshot_index: int
+    available_count: int
+    success: bool
+    elapsed_ms: float
+    selected: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class TraceReplayer:
+    """기록된 좌석 맵으로 SeatSelector를 오프라인 실행"""
+
+    def __init__(self, trace_path: str):
+        self.trace_path = trace_path
+        self.events = load_trace(trace_path)
+
+    def seat_maps(self) -> List[str]:
+        """기록된 좌석 iframe DOM 목록"""
+        return [event['html'] for event in self.events if event.get('k') == EVENT_SEAT_MAP]
+
+    def benchmark(self,
+                  preference: SeatPreference,
+                  selector_factory: Callable[[ReplayDriver], SeatSelector] = SeatSelector,
+                  repeat: int = 1) -> List[ReplayResult]:
+        """좌석 맵마다 선택 전략 실행 시간 측정"""
+        results = []
+        for index, html in enumerate(self.seat_maps()):
+            for _ in range(repeat):
+                driver = ReplayDriver(html)
+                selector = selector_factory(driver)
+
+                started = time.perf_counter()
+                success = selector.select_seats(preference)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                results.append(ReplayResult(
+                    snapshot_index=index,
+                    available_count=len(driver.seats),
+                    success=success,
+                    elapsed_ms=elapsed_ms,
+                    selected=[seat.position for seat in driver.seats if seat.clicked]
+                ))
+
+        if results:
+            average = sum(r.elapsed_ms for r in results) / len(results)
+            logger.info("리플레이 완료: %s회 실행, 평균 %.2fms", len(results), average)
+        return results
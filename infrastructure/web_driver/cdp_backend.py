@@ -0,0 +1,210 @@
+import itertools
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CdpError(Exception):
+    """CDP 명령 실패 (호출 측은 Selenium 경로로 대체)"""
+
+
+class CdpBackend:
+    """WebDriverManager가 띄운 브라우저 탭에 직접 연결한 Chrome DevTools Protocol 클라이언트
+
+    chromedriver를 거치지 않고 WebSocket 하나를 유지하며 스크립트 실행, 입력 이벤트 전달,
+    iframe 실행 컨텍스트 같은 자주 쓰는 명령만 처리한다. 나머지 조작은 계속 Selenium을 사용한다.
+    """
+
+    def __init__(self, websocket_url: str, target_id: str, timeout: float = 5.0,
+                 on_command: Optional[Callable[[str, float, bool], None]] = None):
+        self.websocket_url = websocket_url
+        self.target_id = target_id
+        self.timeout = timeout
+        self.on_command = on_command
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # 프레임 ID → 기본 실행 컨텍스트 ID
+        self._contexts: Dict[str, int] = {}
+        self._frames: Dict[str, str] = {}
+
+    @classmethod
+    def attach(cls, driver, timeout: float = 5.0,
+               on_command: Optional[Callable[[str, float, bool], None]] = None) -> "CdpBackend":
+        """Selenium 드라이버의 현재 창에 해당하는 탭에 연결"""
+        address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
+        if not address:
+            raise CdpError("debuggerAddress를 찾을 수 없습니다.")
+
+        target_id = driver.current_window_handle
+        targets = requests.get(f"http://{address}/json", timeout=timeout).json()
+        for target in targets:
+            if target.get('type') == 'page' and target.get('id', '').upper() == target_id.upper():
+                backend = cls(target['webSocketDebuggerUrl'], target_id, timeout, on_command)
+                backend.connect()
+                return backend
+
+        # 다른 탭을 조작하지 않도록 일치하는 탭이 없으면 연결하지 않음
+        raise CdpError(f"현재 창에 해당하는 DevTools 대상이 없습니다: {target_id}")
+
+    def connect(self):
+        import websocket
+
+        # Origin 헤더를 보내지 않으면 --remote-allow-origins 없이도 연결 가능
+        self._ws = websocket.create_connection(self.websocket_url, timeout=self.timeout, suppress_origin=True)
+        self.send('Runtime.enable')
+        self.send('Page.enable')
+        logger.info("CDP 연결: %s", self.target_id)
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def close(self):
+        with self._lock:
+            if self._ws is not None:
+                try:
+                    self._ws.close()
+                except Exception as e:
+                    logger.debug("CDP 연결 종료 실패: %s", e)
+                finally:
+                    self._ws = None
+                    self._contexts.clear()
+                    self._frames.clear()
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """CDP 명령 실행 후 결과 반환 (응답을 기다리는 동안 받은 이벤트는 상태 갱신에 사용)"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            with self._lock:
+                if self._ws is None:
+                    raise CdpError("CDP가 연결되지 않았습니다.")
+                message_id = next(self._ids)
+                try:
+                    self._ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+                    while True:
+                        message = json.loads(self._ws.recv())
+                        if message.get('id') == message_id:
+                            break
+                        self._on_event(message)
+                except CdpError:
+                    raise
+                except Exception as e:
+                    # 연결이 끊겼으면 이후 호출은 바로 Selenium으로 대체되도록 닫음
+                    self._ws = None
+                    raise CdpError(f"{method} 실패: {e}") from e
+
+            if 'error' in message:
+                raise CdpError(f"{method} 실패: {message['error'].get('message')}")
+            return message.get('result', {})
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if self.on_command:
+                self.on_command(f"cdp:{method}", time.perf_counter() - started, failed)
+
+    def evaluate(self, expression: str, frame_id: Optional[str] = None) -> Any:
+        """스크립트 실행 후 값 반환 (frame_id가 있으면 해당 프레임에서 실행)"""
+        params: Dict[str, Any] = {'expression': expression, 'returnByValue': True}
+        if frame_id:
+            context_id = self._contexts.get(frame_id)
+            if context_id is None:
+                raise CdpError(f"프레임 실행 컨텍스트가 없습니다: {frame_id}")
+            params['contextId'] = context_id
+
+        result = self.send('Runtime.evaluate', params)
+        if 'exceptionDetails' in result:
+            raise CdpError(f"스크립트 오류: {result['exceptionDetails'].get('text')}")
+        return result.get('result', {}).get('value')
+
+    def frame_id(self, selector: str) -> str:
+        """iframe 요소의 프레임 ID (같은 출처 iframe만, 결과는 컨텍스트가 바뀔 때까지 보관)"""
+        frame_id = self._frames.get(selector)
+        if frame_id and frame_id in self._contexts:
+            return frame_id
+
+        result = self.send('Runtime.evaluate', {'expression': f"document.querySelector({json.dumps(selector)})"})
+        object_id = result.get('result', {}).get('objectId')
+        if not object_id:
+            raise CdpError(f"iframe을 찾을 수 없습니다: {selector}")
+        try:
+            node = self.send('DOM.describeNode', {'objectId': object_id})['node']
+        finally:
+            self.send('Runtime.releaseObject', {'objectId': object_id})
+
+        frame_id = node.get('frameId')
+        if not frame_id or frame_id not in self._contexts:
+            # 다른 출처 iframe은 별도 대상이므로 이 연결로는 다룰 수 없음
+            raise CdpError(f"iframe 실행 컨텍스트가 없습니다: {selector}")
+        self._frames[selector] = frame_id
+        return frame_id
+
+    def click_at(self, x: float, y: float):
+        """페이지 좌표에 실제 마우스 클릭 입력 전달"""
+        for event_type in ('mousePressed', 'mouseReleased'):
+            self.send('Input.dispatchMouseEvent', {
+                'type': event_type, 'x': x, 'y': y, 'button': 'left', 'clickCount': 1
+            })
+
+    def _on_event(self, message: Dict[str, Any]):
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Runtime.executionContextCreated':
+            context = params.get('context', {})
+            aux = context.get('auxData', {})
+            if aux.get('isDefault') and aux.get('frameId'):
+                self._contexts[aux['frameId']] = context['id']
+        elif method == 'Runtime.executionContextDestroyed':
+            context_id = params.get('executionContextId')
+            for frame_id, known_id in list(self._contexts.items()):
+                if known_id == context_id:
+                    del self._contexts[frame_id]
+        elif method == 'Runtime.executionContextsCleared':
+            self._contexts.clear()
+
+
+@dataclass
+class LatencyComparison:
+    """같은 작업의 Selenium / CDP 명령 지연 시간 비교 (밀리초)"""
+    name: str
+    selenium_ms: float
+    cdp_ms: float
+
+    @property
+    def speedup(self) -> float:
+        return self.selenium_ms / self.cdp_ms if self.cdp_ms else 0.0
+
+
+def benchmark(driver, backend: CdpBackend, iterations: int = 50) -> List[LatencyComparison]:
+    """Selenium과 CDP의 명령당 지연 시간 비교 (현재 열린 페이지에서 실행)"""
+    cases = [
+        ('script', lambda: driver.execute_script("return 1;"), lambda: backend.evaluate("1")),
+        ('element count', lambda: driver.execute_script("return document.querySelectorAll('*').length;"),
+         lambda: backend.evaluate("document.querySelectorAll('*').length")),
+        ('page title', lambda: driver.title, lambda: backend.evaluate("document.title")),
+    ]
+
+    def median_ms(func: Callable) -> float:
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        return samples[len(samples) // 2]
+
+    results = [LatencyComparison(name, median_ms(selenium_call), median_ms(cdp_call))
+               for name, selenium_call, cdp_call in cases]
+    for result in results:
+        logger.info("%s: Selenium %.2fms, CDP %.2fms (%.1f배)",
+                    result.name, result.selenium_ms, result.cdp_ms, result.speedup)
+    return results
@@ -0,0 +1,87 @@
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities import ReservationPhase
+
+logger = logging.getLogger(__name__)
+
+NO_PHASE = "-"
+
+
+class CommandStats:
+    __slots__ = ('count', 'errors', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float, failed: bool):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if failed:
+            self.errors += 1
+
+
+class CommandProfiler:
+    """WebDriver 명령별 호출 횟수/소요 시간 집계 (유스케이스 단계별)"""
+
+    def __init__(self):
+        self.phase: str = NO_PHASE
+        self._stats: Dict[Tuple[str, str], CommandStats] = {}
+        self._lock = threading.Lock()
+
+    def on_phase(self, phase: ReservationPhase):
+        self.phase = phase.value
+
+    def on_command(self, command: str, duration: float, failed: bool = False):
+        key = (self.phase, command)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CommandStats()
+            stats.add(duration, failed)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+        self.phase = NO_PHASE
+
+    def phase_totals(self) -> Dict[str, Tuple[int, float]]:
+        """단계별 (명령 수, 총 소요 시간)"""
+        totals: Dict[str, Tuple[int, float]] = {}
+        with self._lock:
+            for (phase, _), stats in self._stats.items():
+                count, total = totals.get(phase, (0, 0.0))
+                totals[phase] = (count + stats.count, total + stats.total)
+        return totals
+
+    def hottest(self, top_n: int = 10) -> List[Tuple[str, str, CommandStats]]:
+        """총 소요 시간 기준 상위 명령"""
+        with self._lock:
+            items = [(phase, command, stats) for (phase, command), stats in self._stats.items()]
+        items.sort(key=lambda item: item[2].total, reverse=True)
+        return items[:top_n]
+
+    def format_report(self, top_n: int = 10) -> List[str]:
+        lines = []
+        for phase, (count, total) in self.phase_totals().items():
+            lines.append(f"[{phase}] {count} commands, {total * 1000:.0f}ms")
+        for phase, command, stats in self.hottest(top_n):
+            lines.append(
+                f"[{phase}] {command}: n={stats.count} total={stats.total * 1000:.0f}ms "
+                f"avg={stats.total / stats.count * 1000:.1f}ms max={stats.max * 1000:.1f}ms err={stats.errors}"
+            )
+        return lines
+
+    def log_report(self, top_n: int = 10, title: Optional[str] = None):
+        """실행별 명령 통계 로그 출력"""
+        lines = self.format_report(top_n)
+        if not lines:
+            return
+        logger.info(title or "WebDriver 명령 통계")
+        for line in lines:
+            logger.info("  %s", line)
@@ -0,0 +1,96 @@
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import logging
+
+import requests
+from selenium.webdriver import Chrome
+
+logger = logging.getLogger(__name__)
+
+
+class CookieBridge:
+    """WebDriver와 requests.Session 간 쿠키 동기화"""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def driver_to_session(self, driver: Chrome) -> int:
+        """브라우저 쿠키를 세션으로 복사"""
+        copied = 0
+        try:
+            for cookie in driver.get_cookies():
+                self.session.cookies.set_cookie(self._to_session_cookie(cookie))
+                copied += 1
+        except Exception as e:
+            logger.error("브라우저 쿠키 복사 실패: %s", e)
+
+        logger.debug("브라우저 → 세션 쿠키 %s개 동기화", copied)
+        return copied
+
+    def session_to_driver(self, driver: Chrome) -> int:
+        """세션 쿠키를 현재 페이지 도메인의 브라우저로 복사"""
+        # WebDriver는 현재 페이지와 도메인이 맞는 쿠키만 추가할 수 있음
+        host = urlparse(driver.current_url).hostname or ''
+        copied = 0
+
+        for cookie in self.session.cookies:
+            if not self._domain_matches(host, cookie.domain):
+                continue
+
+            try:
+                driver.add_cookie(self._to_driver_cookie(cookie))
+                copied += 1
+            except Exception as e:
+                logger.debug("쿠키 추가 실패 (%s): %s", cookie.name, e)
+
+        logger.debug("세션 → 브라우저 쿠키 %s개 동기화", copied)
+        return copied
+
+    def sync(self, driver: Chrome) -> None:
+        """양방향 동기화 (브라우저 쿠키 우선)"""
+        self.session_to_driver(driver)
+        self.driver_to_session(driver)
+
+    @staticmethod
+    def _to_session_cookie(cookie: Dict):
+        """Selenium 쿠키 dict를 requests 쿠키로 변환"""
+        rest = {}
+        if cookie.get('httpOnly'):
+            rest['HttpOnly'] = None
+        if cookie.get('sameSite'):
+            rest['SameSite'] = cookie['sameSite']
+
+        return requests.cookies.create_cookie(
+            name=cookie['name'],
+            value=cookie['value'],
+            domain=cookie.get('domain', ''),
+            path=cookie.get('path', '/'),
+            secure=cookie.get('secure', False),
+            expires=cookie.get('expiry'),
+            rest=rest
+        )
+
+    @staticmethod
+    def _to_driver_cookie(cookie) -> Dict:
+        """requests 쿠키를 Selenium 쿠키 dict로 변환"""
+        driver_cookie = {
+            'name': cookie.name,
+            'value': cookie.value,
+            'path': cookie.path or '/',
+            'secure': bool(cookie.secure)
+        }
+        if cookie.domain:
+            driver_cookie['domain'] = cookie.domain
+        if cookie.expires:
+            driver_cookie['expiry'] = int(cookie.expires)
+        if cookie.has_nonstandard_attr('HttpOnly'):
+            driver_cookie['httpOnly'] = True
+        return driver_cookie
+
+    @staticmethod
+    def _domain_matches(host: str, cookie_domain: Optional[str]) -> bool:
+        """쿠키 도메인이 호스트에 적용되는지 확인"""
+        if not cookie_domain:
+            return True
+        domain = cookie_domain.lstrip('.')
+        return host == domain or host.endswith(f".{domain}")
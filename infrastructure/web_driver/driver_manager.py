@@ -2,8 +2,15 @@ from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-from typing import Optional
+from typing import Callable, List, Optional
 import logging
+import time
+
+import requests
+
+from infrastructure.web_driver.cookie_bridge import CookieBridge
+from infrastructure.web_driver.command_profiler import CommandProfiler
+from infrastructure.web_driver.cdp_backend import CdpBackend
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +19,14 @@ class WebDriverManager:
     def __init__(self):
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        self.command_profiler = CommandProfiler()
+        self._cdp: Optional[CdpBackend] = None
+        self._cdp_failed_handle: Optional[str] = None
+        self._command_listeners: List[Callable[[str, float, bool], None]] = [
+            self.command_profiler.on_command
+        ]
         
-    def initialize(self, headless: bool = False, wait_timeout: int = 10):
+    def initialize(self, headless: bool = False, wait_timeout: int = 10, poll_frequency: float = 0.5):
         """웹드라이버 초기화"""
         try:
             options = webdriver.ChromeOptions()
@@ -31,19 +44,49 @@ class WebDriverManager:
             # ChromeDriver 자동 설치 및 실행
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=options)
+            self._install_command_hook(self.driver)
             
             self.driver.execute_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
             
-            self.wait = WebDriverWait(self.driver, wait_timeout)
+            self.wait = WebDriverWait(self.driver, wait_timeout, poll_frequency=poll_frequency)
             
             logger.info("WebDriver initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize WebDriver: {str(e)}")
+            logger.error("Failed to initialize WebDriver: %s", e)
             raise
             
+    def add_command_listener(self, listener: Callable[[str, float, bool], None]):
+        """WebDriver 명령 실행 알림 리스너 등록 (명령명, 소요 시간, 실패 여부)"""
+        self._command_listeners.append(listener)
+        
+    def remove_command_listener(self, listener: Callable[[str, float, bool], None]):
+        if listener in self._command_listeners:
+            self._command_listeners.remove(listener)
+            
+    def _install_command_hook(self, driver: webdriver.Chrome):
+        """driver.execute를 감싸 모든 명령의 소요 시간 측정
+
+        command executor가 아닌 driver.execute를 감싸야 응답 검사(check_response)에서
+        발생하는 WebDriver 오류(no such element, stale element 등)도 실패로 집계된다.
+        """
+        original_execute = driver.execute
+        
+        def profiled_execute(driver_command, params=None):
+            started = time.perf_counter()
+            failed = False
+            try:
+                return original_execute(driver_command, params)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self._notify_command(driver_command, time.perf_counter() - started, failed)
+                    
+        driver.execute = profiled_execute
+        
     def get_driver(self) -> webdriver.Chrome:
         if not self.driver:
             raise RuntimeError("WebDriver not initialized")
@@ -54,14 +97,65 @@ class WebDriverManager:
             raise RuntimeError("WebDriverWait not initialized")
         return self.wait
         
+    def export_cookies(self, session: requests.Session) -> int:
+        """브라우저 쿠키를 HTTP 세션으로 내보내기"""
+        return CookieBridge(session).driver_to_session(self.get_driver())
+        
+    def import_cookies(self, session: requests.Session) -> int:
+        """HTTP 세션 쿠키를 브라우저로 가져오기 (현재 페이지 도메인의 쿠키만)"""
+        return CookieBridge(session).session_to_driver(self.get_driver())
+        
+    def get_cdp_backend(self) -> Optional[CdpBackend]:
+        """현재 창에 연결된 CDP 백엔드 반환 (연결할 수 없으면 None - Selenium 사용)"""
+        driver = self.get_driver()
+        handle = None
+        try:
+            handle = driver.current_window_handle
+            # 팝업 창으로 전환했으면 해당 탭에 다시 연결 (연결에 실패한 창은 다시 시도하지 않음)
+            if self._cdp and self._cdp.connected and self._cdp.target_id == handle:
+                return self._cdp
+            if handle == self._cdp_failed_handle:
+                return None
+            self.close_cdp_backend()
+            self._cdp = CdpBackend.attach(driver, on_command=self._notify_command)
+            return self._cdp
+        except Exception as e:
+            self._cdp_failed_handle = handle
+            logger.warning("CDP 연결 실패, Selenium 사용: %s", e)
+            return None
+            
+    def close_cdp_backend(self):
+        if self._cdp:
+            self._cdp.close()
+            self._cdp = None
+            
+    def _notify_command(self, command: str, elapsed: float, failed: bool):
+        # 리스너 오류가 명령 결과나 예외를 덮어쓰지 않도록 격리
+        for listener in list(self._command_listeners):
+            try:
+                listener(command, elapsed, failed)
+            except Exception as e:
+                logger.error("명령 리스너 오류: %s", e)
+            
+    def is_alive(self) -> bool:
+        """브라우저가 아직 응답하는지 확인"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+            
     def quit(self):
         """웹드라이버 종료"""
+        self.close_cdp_backend()
         if self.driver:
             try:
                 self.driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as e:
-                logger.error(f"Error closing WebDriver: {str(e)}")
+                logger.error("Error closing WebDriver: %s", e)
             finally:
                 self.driver = None
                 self.wait = None
\ No newline at end of file
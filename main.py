@@ -1,4 +1,10 @@
-from presentation.gui_app import launch_gui
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # 인자가 있으면 Tk 없이 CLI로 실행
+        from presentation.cli_app import launch_cli
+        sys.exit(launch_cli())
+    
+    from presentation.gui_app import launch_gui
     launch_gui()
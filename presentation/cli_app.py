@@ -0,0 +1,135 @@
+import argparse
+import json
+import logging
+import signal
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from application.dtos.reservation_dto import ReservationRequestDTO
+from application.services.reservation_service import ReservationService
+from config.dependency_injection import container, configure_container
+from config.logging_config import configure_logging, shutdown_logging
+from config.settings import Settings
+from domain.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+DTO_FIELDS = (
+    'performance_name', 'performance_url', 'date', 'time', 'target_time',
+    'seat_type', 'seat_direction', 'seat_count', 'user_id', 'user_password'
+)
+
+
+def _emit(event: str, **fields: Any):
+    """진행 상황을 JSON 한 줄로 출력"""
+    record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'event': event}
+    record.update(fields)
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='main.py', description='인터파크 자동 티켓팅 (GUI 없이 실행)')
+    parser.add_argument('--job', help='예매 작업 JSON 파일 (ReservationRequestDTO 필드)')
+    parser.add_argument('--name', dest='performance_name')
+    parser.add_argument('--url', dest='performance_url')
+    parser.add_argument('--date', help='YYYY-MM-DD')
+    parser.add_argument('--time', help='공연 시간 (HH:MM)')
+    parser.add_argument('--target-time', dest='target_time', help='대기 시작 시간 (HH:MM:SS)')
+    parser.add_argument('--seat-type', dest='seat_type', choices=['일반', '작은 포도알', '큰 포도알'])
+    parser.add_argument('--seat-direction', dest='seat_direction', choices=['오른쪽부터', '왼쪽부터'])
+    parser.add_argument('--seat-count', dest='seat_count', type=int)
+    parser.add_argument('--user-id', dest='user_id')
+    parser.add_argument('--user-password', dest='user_password')
+    parser.add_argument('--headless', action='store_true', help='브라우저 창 없이 실행 (WEBDRIVER_HEADLESS)')
+    return parser.parse_args(argv)
+
+
+def _build_request(args: argparse.Namespace) -> ReservationRequestDTO:
+    """작업 파일과 명령행 인자로 요청 DTO 생성 (인자가 우선)"""
+    values: Dict[str, Any] = {'seat_type': '일반', 'seat_direction': '오른쪽부터', 'seat_count': 1}
+
+    if args.job:
+        with open(args.job, encoding='utf-8') as f:
+            values.update(json.load(f))
+
+    for name in DTO_FIELDS:
+        value = getattr(args, name, None)
+        if value is not None:
+            values[name] = value
+
+    missing = [name for name in ('performance_name', 'performance_url', 'date', 'time', 'target_time')
+               if not values.get(name)]
+    if missing:
+        raise ValueError(f"필수 항목 누락: {', '.join(missing)}")
+
+    return ReservationRequestDTO(**{k: v for k, v in values.items() if k in DTO_FIELDS + ('seat_grades',)})
+
+
+def _wait_until(target_time: datetime, cancel_token: CancellationToken, settings=Settings):
+    """대기 시작 시간까지 대기"""
+    last_report: Optional[int] = None
+    while not cancel_token.is_cancelled:
+        remaining = (target_time - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return
+
+        # 남은 시간은 10초 단위로만 출력
+        bucket = int(remaining // 10)
+        if bucket != last_report:
+            _emit('waiting', remaining=round(remaining, 1))
+            last_report = bucket
+
+        if remaining > 60:
+            cancel_token.wait(min(settings.COUNTDOWN_IDLE_INTERVAL, remaining - 60))
+        else:
+            cancel_token.wait(min(settings.COUNTDOWN_POLL_INTERVAL, remaining))
+
+
+def launch_cli(argv: Optional[List[str]] = None) -> int:
+    """CLI 실행 (종료 코드 반환)"""
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    configure_container()
+    # stdout은 JSON 이벤트 전용 - 로그는 stderr로
+    configure_logging(Settings, stream=sys.stderr)
+    try:
+        return _run(args)
+    finally:
+        container.dispose()
+        shutdown_logging()
+
+
+def _run(args: argparse.Namespace) -> int:
+    """예매 작업 실행"""
+    if args.headless:
+        Settings.WEBDRIVER_HEADLESS = True
+
+    try:
+        request_dto = _build_request(args)
+        target_time = datetime.strptime(f"{request_dto.date} {request_dto.target_time}", "%Y-%m-%d %H:%M:%S")
+    except (OSError, ValueError, TypeError) as e:
+        _emit('error', message=str(e))
+        return 2
+    _emit('start', performance=request_dto.performance_name, target_time=target_time.isoformat(),
+          headless=Settings.WEBDRIVER_HEADLESS, profile=Settings.PROFILE)
+
+    # Ctrl+C / SIGTERM은 취소 토큰으로 전달해 브라우저를 정상 종료
+    cancel_token = CancellationToken()
+    signal.signal(signal.SIGINT, lambda *_: cancel_token.cancel())
+    signal.signal(signal.SIGTERM, lambda *_: cancel_token.cancel())
+
+    _wait_until(target_time, cancel_token)
+    if cancel_token.is_cancelled:
+        _emit('result', success=False, message="예매가 중지되었습니다.", error=None)
+        return 130
+
+    _emit('progress', message="티켓팅 시작!")
+
+    service = container.resolve(ReservationService)
+    response = service.make_reservation(request_dto, lambda message: _emit('progress', message=message),
+                                        cancel_token)
+
+    _emit('result', success=response.success, message=response.message, error=response.error)
+    return 0 if response.success else 1
@@ -5,15 +5,22 @@ import logging
 
 from application.services.reservation_service import ReservationService
 from application.dtos.reservation_dto import ReservationRequestDTO
+from config.dependency_injection import container
+from domain.cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
 
 class ReservationController:
-    def __init__(self):
-        self.service = ReservationService()
+    def __init__(self, service: Optional[ReservationService] = None):
+        if service is None:
+            # 컴포지션 루트를 거치지 않은 경우(configure_container 미호출) 직접 생성
+            service = (container.resolve(ReservationService) if container.is_registered(ReservationService)
+                       else ReservationService())
+        self.service = service
         self.is_running = False
         self._reservation_thread: Optional[threading.Thread] = None
+        self._cancel_token = CancellationToken()
         
     def start_reservation(self, 
                          request_dto: ReservationRequestDTO,
@@ -25,23 +32,23 @@ class ReservationController:
             return
             
         self.is_running = True
+        self._cancel_token = CancellationToken()
         self._reservation_thread = threading.Thread(
             target=self._run_reservation,
-            args=(request_dto, progress_callback, completion_callback),
+            args=(request_dto, progress_callback, completion_callback, self._cancel_token),
             daemon=True
         )
         self._reservation_thread.start()
         
     def stop_reservation(self):
-        """예매 중지"""
-        self.is_running = False
-        if self._reservation_thread and self._reservation_thread.is_alive():
-            self.service.cleanup()
+        """예매 중지 (작업 스레드가 다음 폴링 시점에 멈추고 브라우저를 정리함)"""
+        self._cancel_token.cancel()
             
     def _run_reservation(self,
                         request_dto: ReservationRequestDTO,
                         progress_callback: Callable[[str], None],
-                        completion_callback: Callable[[bool, str], None]):
+                        completion_callback: Callable[[bool, str], None],
+                        cancel_token: CancellationToken):
         """예매 실행"""
         try:
             target_time = datetime.strptime(
@@ -51,27 +58,27 @@ class ReservationController:
             
             progress_callback("대기 중...")
             
-            while datetime.now() < target_time and self.is_running:
+            while datetime.now() < target_time and not cancel_token.is_cancelled:
                 remaining = (target_time - datetime.now()).total_seconds()
                 progress_callback(f"남은 시간: {remaining:.1f}초")
                 
                 if remaining > 60:
-                    threading.Event().wait(10)
+                    cancel_token.wait(self.service.settings.COUNTDOWN_IDLE_INTERVAL)
                 else:
-                    threading.Event().wait(0.1)
+                    cancel_token.wait(self.service.settings.COUNTDOWN_POLL_INTERVAL)
                     
-            if not self.is_running:
+            if cancel_token.is_cancelled:
                 completion_callback(False, "예매가 중지되었습니다.")
                 return
                 
             progress_callback("티켓팅 시작!")
             
-            response = self.service.make_reservation(request_dto, progress_callback)
+            response = self.service.make_reservation(request_dto, progress_callback, cancel_token)
             
             completion_callback(response.success, response.message)
             
         except Exception as e:
-            logger.error(f"Controller error: {str(e)}")
+            logger.error("Controller error: %s", e)
             completion_callback(False, f"오류 발생: {str(e)}")
             
         finally:
@@ -1,9 +1,19 @@
 import tkinter as tk
 from presentation.views.main_window import MainWindow
+from config.dependency_injection import container, configure_container
+from config.logging_config import configure_logging, shutdown_logging
+from infrastructure.http_client.http_transport import HttpTransport
 
 
 def launch_gui():
     """GUI 애플리케이션 실행"""
+    configure_container()
+    configure_logging()
+    
     root = tk.Tk()
     app = MainWindow(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    app.lag_monitor.log_report()
+    container.resolve(HttpTransport).metrics.log_report()
+    container.dispose()
+    shutdown_logging()
\ No newline at end of file
@@ -2,12 +2,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from datetime import datetime
 import logging
+import queue
 
 from presentation.controllers.reservation_controller import ReservationController
 from application.dtos.reservation_dto import ReservationRequestDTO
 from presentation.views.performance_search_dialog import PerformanceSearchDialog
+from presentation.views.ui_lag_monitor import UiLagMonitor
+from config.settings import Settings
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -18,9 +20,19 @@ class MainWindow:
         self.root.geometry("800x700")
         
         self.controller = ReservationController()
+        # 작업 스레드 → UI 스레드 전달 큐 (로그 문자열 또는 UI 스레드에서 실행할 함수)
+        self._ui_queue = queue.SimpleQueue()
         
         self._setup_ui()
         
+        # 이벤트 루프 지연 측정 (상태 표시줄에 1초마다 표시)
+        self.lag_monitor = UiLagMonitor.from_settings(
+            self.root, Settings, on_update=lambda text: self.status_label.config(text=text))
+        for name in ('_drain_ui_queue', '_finish_reservation'):
+            setattr(self, name, self.lag_monitor.track(f"main_window.{name}", getattr(self, name)))
+        self.lag_monitor.start()
+        self.root.after(Settings.LOG_VIEW_DRAIN_MS, self._drain_ui_queue)
+        
     def _setup_ui(self):
         """UI 구성"""
         main_frame = ttk.Frame(self.root, padding="10")
@@ -32,6 +44,9 @@ class MainWindow:
         self._create_control_frame(main_frame)
         self._create_log_frame(main_frame)
         
+        self.status_label = ttk.Label(main_frame, text="", anchor=tk.E)
+        self.status_label.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        
         self._configure_grid(main_frame)
         
     def _create_performance_frame(self, parent):
@@ -123,7 +138,7 @@ class MainWindow:
         
     def _open_search_dialog(self):
         """공연 검색 다이얼로그 열기"""
-        dialog = PerformanceSearchDialog(self.root)
+        dialog = PerformanceSearchDialog(self.root, lag_monitor=self.lag_monitor)
         self.root.wait_window(dialog.dialog)
         
         result = dialog.get_result()
@@ -140,11 +155,36 @@ class MainWindow:
             self._log_message(f"날짜: {result['date']}, 시간: {result['time']}")
         
     def _log_message(self, message):
-        """로그 메시지 출력"""
+        """로그 메시지 출력 (어느 스레드에서든 호출 가능 - 큐에 넣기만 함)"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.insert(tk.END, f"[{current_time}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self._ui_queue.put(f"[{current_time}] {message}\n")
+        
+    def _drain_ui_queue(self):
+        """큐에 쌓인 로그를 한 번에 출력하고 예약된 UI 작업 실행"""
+        lines = []
+        actions = []
+        try:
+            while True:
+                item = self._ui_queue.get_nowait()
+                if callable(item):
+                    actions.append(item)
+                else:
+                    lines.append(item)
+        except queue.Empty:
+            pass
+            
+        if lines:
+            self.log_text.insert(tk.END, ''.join(lines))
+            # 오래된 줄은 잘라 위젯 크기 유지
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > Settings.LOG_VIEW_MAX_LINES:
+                self.log_text.delete('1.0', f"{line_count - Settings.LOG_VIEW_MAX_LINES}.0")
+            self.log_text.see(tk.END)
+            
+        for action in actions:
+            action()
+            
+        self.root.after(Settings.LOG_VIEW_DRAIN_MS, self._drain_ui_queue)
         
     def _on_start(self):
         """시작 버튼 핸들러"""
@@ -170,8 +210,12 @@ class MainWindow:
         self.stop_button.config(state=tk.DISABLED)
         
     def _on_completion(self, success, message):
-        """예매 완료 콜백"""
+        """예매 완료 콜백 (작업 스레드에서 호출)"""
         self._log_message(message)
+        self._ui_queue.put(lambda: self._finish_reservation(success, message))
+        
+    def _finish_reservation(self, success, message):
+        """예매 결과 표시"""
         
         if success:
             messagebox.showinfo("성공", message)
@@ -207,5 +251,6 @@ class MainWindow:
             seat_direction=self.seat_direction.get(),
             seat_count=int(self.seat_count.get()),
             user_id=self.user_id.get() if self.user_id.get() else None,
-            user_password=self.user_pw.get() if self.user_pw.get() else None
+            user_password=self.user_pw.get() if self.user_pw.get() else None,
+            seat_grades=self.performance_data.get('seat_grades')
         )
\ No newline at end of file
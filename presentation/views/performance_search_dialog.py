@@ -1,13 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Dict, Callable, List
-import threading
 from PIL import Image, ImageTk
-import requests
 from io import BytesIO
 import logging
 
 from infrastructure.interpark.performance_crawler import PerformanceCrawler
+from infrastructure.interpark.detail_prefetcher import DetailPrefetcher
+from infrastructure.concurrency.keyed_executor import KeyedExecutor
+from infrastructure.cache.search_result_cache import SearchResultCache
+from infrastructure.cache.detail_cache import PerformanceDetailCache, StaticDetailCache
+from infrastructure.cache.catalog_snapshot import CatalogSnapshot
+from presentation.views.ui_lag_monitor import UiLagMonitor
+from presentation.views.virtual_result_list import VirtualResultList
+from config.dependency_injection import container
+from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +22,34 @@ logger = logging.getLogger(__name__)
 class PerformanceSearchDialog:
     """공연 검색 다이얼로그"""
     
-    def __init__(self, parent):
+    # 공용 작업자 풀의 작업 키 (같은 키의 이전 작업은 새 요청으로 대체됨)
+    RESULTS_TASK = "search_dialog.results"
+    POSTER_TASK = "search_dialog.poster"
+    # 다이얼로그를 열 때 표시하는 최신 공연 수
+    LATEST_SIZE = 50
+    
+    def __init__(self, parent, lag_monitor: Optional[UiLagMonitor] = None):
         self.parent = parent
-        self.crawler = PerformanceCrawler()
+        # 크롤러, 캐시, 미리 불러오기 작업자는 모든 다이얼로그가 공유
+        self.crawler = container.resolve(PerformanceCrawler)
+        self.detail_cache = container.resolve(PerformanceDetailCache)
+        self.static_detail_cache = container.resolve(StaticDetailCache)
+        self.catalog_snapshot = container.resolve(CatalogSnapshot)
+        self._search_cache = container.resolve(SearchResultCache)
+        self.prefetcher = container.resolve(DetailPrefetcher)
+        self.executor = container.resolve(KeyedExecutor)
+        self._hovered_id = None
+        self._search_generation = 0
+        self._debounce_id = None
         self.selected_performance = None
         self.selected_date = None
         self.selected_time = None
+        self.selected_detail = None
+        
+        # 작업 스레드 결과를 반영하는 콜백의 실행 시간 측정
+        if lag_monitor:
+            for name in ('_update_search_results', '_revalidate_latest', '_update_detail', '_show_poster'):
+                setattr(self, name, lag_monitor.track(f"search_dialog.{name}", getattr(self, name)))
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("공연 검색")
@@ -29,8 +58,9 @@ class PerformanceSearchDialog:
         self.dialog.grab_set()
         
         self._setup_ui()
+        self.dialog.bind('<Destroy>', self._on_destroy)
         # 다이얼로그 열릴 때 바로 최신 공연 목록 로드
-        self.dialog.after(100, self._load_latest_performances)
+        self._load_latest_performances()
         
     def _setup_ui(self):
         """UI 구성"""
@@ -43,6 +73,7 @@ class PerformanceSearchDialog:
         self.search_entry = ttk.Entry(search_frame, width=40)
         self.search_entry.pack(side=tk.LEFT, padx=(0, 10))
         self.search_entry.bind('<Return>', lambda e: self._search())
+        self.search_entry.bind('<KeyRelease>', self._on_search_input)
         
         self.search_button = ttk.Button(search_frame, text="검색", command=self._search)
         self.search_button.pack(side=tk.LEFT)
@@ -60,14 +91,20 @@ class PerformanceSearchDialog:
         
         ttk.Label(left_frame, text="검색 결과").pack()
         
-        # 리스트박스 스크롤바
-        list_scroll = ttk.Scrollbar(left_frame)
-        list_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        # 결과 내 필터 (네트워크 요청 없이 현재 목록만 거름)
+        filter_frame = ttk.Frame(left_frame)
+        filter_frame.pack(fill=tk.X, pady=(5, 5))
+        
+        ttk.Label(filter_frame, text="필터:").pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_entry = ttk.Entry(filter_frame)
+        self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.filter_entry.bind('<KeyRelease>', lambda e: self.result_list.filter(self.filter_entry.get()))
         
-        self.result_listbox = tk.Listbox(left_frame, yscrollcommand=list_scroll.set, width=50)
-        self.result_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.result_listbox.bind('<<ListboxSelect>>', self._on_performance_select)
-        list_scroll.config(command=self.result_listbox.yview)
+        # 보이는 행만 생성하는 결과 목록 (열 제목 클릭 시 정렬)
+        self.result_list = VirtualResultList(left_frame, on_select=self._on_performance_select,
+                                             on_view_change=lambda items: self._update_prefetch())
+        self.result_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.result_list.bind_row_event('<Motion>', self._on_performance_hover)
         
         # 중간 구분선
         ttk.Separator(result_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=10)
@@ -93,70 +130,161 @@ class PerformanceSearchDialog:
         self.performances = []
         
     def _load_latest_performances(self):
-        """최신 공연 목록 로드"""
-        self.result_listbox.delete(0, tk.END)
-        self.result_listbox.insert(tk.END, "공연 목록을 불러오는 중...")
+        """최신 공연 목록 로드 (저장된 스냅샷을 먼저 표시하고 백그라운드에서 갱신)"""
+        # 스냅샷에는 동기화 파이프라인이 모은 공연도 있으므로 최신 공연만 표시
+        snapshot = (self.catalog_snapshot.load() or [])[:self.LATEST_SIZE]
+        if snapshot:
+            self._update_search_results(snapshot)
+        else:
+            self.result_list.set_message("공연 목록을 불러오는 중...")
         
-        threading.Thread(target=self._load_latest_thread, daemon=True).start()
+        self.executor.submit(self.RESULTS_TASK, self._load_latest_thread, self._search_generation)
         
-    def _load_latest_thread(self):
+    def _load_latest_thread(self, generation: int):
         """최신 공연 목록 로드 스레드"""
         try:
-            performances = self.crawler.get_latest_performances(size=50)
-            self.performances = performances
+            performances = self.crawler.get_latest_performances(size=self.LATEST_SIZE)
+            # 파이프라인이 모은 공연을 지우지 않도록 교체 대신 합침
+            self.catalog_snapshot.upsert(performances)
             
-            self.dialog.after(0, self._update_search_results, performances)
+            self.dialog.after(0, self._revalidate_latest, generation, performances)
             
         except Exception as e:
-            logger.error(f"공연 목록 로드 실패: {str(e)}")
+            logger.error("공연 목록 로드 실패: %s", e)
             self.dialog.after(0, messagebox.showerror, "로드 오류", f"공연 목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
         
+    def _revalidate_latest(self, generation: int, performances: List[Dict]):
+        """새로 받은 목록을 표시 중인 스냅샷과 비교해 바뀐 경우에만 반영"""
+        if generation != self._search_generation:
+            return
+            
+        if not performances and self.performances:
+            # 갱신 실패 시 스냅샷 유지
+            return
+            
+        diff = CatalogSnapshot.diff(self.performances, performances)
+        if diff.unchanged and performances:
+            logger.debug("공연 목록 변경 없음")
+            return
+            
+        logger.info("공연 목록 갱신: 추가 %s개, 삭제 %s개, 변경 %s개", len(diff.added), len(diff.removed), len(diff.changed))
+        self.performances = performances
+        if performances:
+            self.result_list.set_items(performances, keep_position=True)
+        else:
+            self.result_list.set_message("검색 결과가 없습니다.")
+            
+    def _on_search_input(self, event):
+        """입력 중 검색 (마지막 입력 후 디바운스 시간이 지나면 실행)"""
+        if event.keysym in ('Return', 'Up', 'Down', 'Left', 'Right', 'Tab'):
+            return
+            
+        if self._debounce_id:
+            self.dialog.after_cancel(self._debounce_id)
+        self._debounce_id = self.dialog.after(Settings.SEARCH_DEBOUNCE_MS, self._search_live)
+        
+    def _search_live(self):
+        self._debounce_id = None
+        keyword = self.search_entry.get().strip()
+        if len(keyword) >= Settings.SEARCH_MIN_CHARS:
+            self._start_search(keyword)
+            
     def _search(self):
         """공연 검색"""
+        if self._debounce_id:
+            self.dialog.after_cancel(self._debounce_id)
+            self._debounce_id = None
+            
         keyword = self.search_entry.get().strip()
         if not keyword:
             messagebox.showwarning("입력 오류", "검색어를 입력해주세요.")
             return
             
-        self.search_button.config(state=tk.DISABLED)
-        self.result_listbox.delete(0, tk.END)
+        self._start_search(keyword)
+        
+    def _start_search(self, keyword: str):
+        """캐시 우선 검색 (이전 검색 결과는 더 새로운 검색이 있으면 버림)"""
+        self._search_generation += 1
+        generation = self._search_generation
         
-        threading.Thread(target=self._search_thread, args=(keyword,), daemon=True).start()
+        cached = self._search_cache.get(keyword)
+        if cached is not None:
+            self._apply_results(generation, cached)
+            return
+            
+        # 짧은 검색어 결과가 캐시에 있으면 로컬 필터링 결과를 먼저 표시
+        refined = self._search_cache.refine_from_prefix(keyword)
+        if refined is not None:
+            self._apply_results(generation, refined)
+        else:
+            self.result_list.set_message("검색 중...")
+            
+        self.executor.submit(self.RESULTS_TASK, self._search_thread, keyword, generation)
         
-    def _search_thread(self, keyword: str):
+    def _search_thread(self, keyword: str, generation: int):
         """검색 스레드"""
+        if generation != self._search_generation:
+            return
+            
         try:
             performances = self.crawler.search_performances(keyword)
-            self.performances = performances
+            if performances is None:
+                # 일시적인 오류일 수 있으므로 캐시하지 않음
+                self.dialog.after(0, self._apply_search_failure, generation)
+                return
+            self._search_cache.put(keyword, performances)
             
-            self.dialog.after(0, self._update_search_results, performances)
+            self.dialog.after(0, self._apply_results, generation, performances)
             
         except Exception as e:
             self.dialog.after(0, messagebox.showerror, "검색 오류", f"검색 중 오류가 발생했습니다: {str(e)}")
-        finally:
-            self.dialog.after(0, self.search_button.config, {'state': tk.NORMAL})
             
+    def _apply_search_failure(self, generation: int):
+        """검색 실패 표시 (더 새로운 검색이 있으면 무시)"""
+        if generation == self._search_generation:
+            self.result_list.set_message("검색에 실패했습니다. 잠시 후 다시 시도해주세요.")
+            
+    def _apply_results(self, generation: int, performances: List[Dict]):
+        """가장 최근 요청의 결과만 반영"""
+        if generation != self._search_generation:
+            logger.debug("오래된 검색 결과 무시 (요청 %s, 최신 %s)", generation, self._search_generation)
+            return
+            
+        self._update_search_results(performances)
+        
     def _update_search_results(self, performances: List[Dict]):
         """검색 결과 업데이트"""
-        self.result_listbox.delete(0, tk.END)
+        self.performances = performances
         
-        for perf in performances:
-            display_text = f"{perf['name']} ({perf['place']}) - {perf['start_date']}~{perf['end_date']}"
-            self.result_listbox.insert(tk.END, display_text)
+        if performances:
+            self.result_list.set_items(performances)
+        else:
+            self.result_list.set_message("검색 결과가 없습니다.")
             
-        if not performances:
-            self.result_listbox.insert(tk.END, "검색 결과가 없습니다.")
-            
-    def _on_performance_select(self, event):
+    def _on_performance_select(self, performance: Dict):
         """공연 선택 이벤트"""
-        selection = self.result_listbox.curselection()
-        if not selection:
-            return
+        self._show_performance_detail(performance)
+        
+    def _on_performance_hover(self, performance: Optional[Dict]):
+        """마우스가 올라간 공연도 미리 불러오기 대상에 포함"""
+        hovered_id = performance['id'] if performance else None
+        if hovered_id != self._hovered_id:
+            self._hovered_id = hovered_id
+            self._update_prefetch()
             
-        index = selection[0]
-        if index < len(self.performances):
-            performance = self.performances[index]
-            self._show_performance_detail(performance)
+    def _update_prefetch(self):
+        """화면 상단 K개와 마우스가 올라간 공연의 상세 정보를 미리 불러옴"""
+        wanted = [perf['id'] for perf in self.result_list.visible_items()[:Settings.DETAIL_PREFETCH_TOP_K]]
+        if self._hovered_id:
+            wanted.insert(0, self._hovered_id)
+        self.prefetcher.prefetch(wanted)
+        
+    def _on_destroy(self, event):
+        # 공유 작업자이므로 종료하지 않고 대기 중인 미리 불러오기만 취소
+        if event.widget is self.dialog:
+            self.prefetcher.prefetch([])
+            self.executor.cancel(self.RESULTS_TASK)
+            self.executor.cancel(self.POSTER_TASK)
             
     def _show_performance_detail(self, performance: Dict):
         """공연 상세 정보 표시"""
@@ -166,7 +294,8 @@ class PerformanceSearchDialog:
             
         # 포스터 이미지
         if performance.get('poster_url'):
-            threading.Thread(target=self._load_poster, args=(performance['poster_url'],), daemon=True).start()
+            future = self.executor.submit(self.POSTER_TASK, self._load_poster, performance['poster_url'])
+            future.add_done_callback(self._on_poster_loaded)
             
         # 공연 정보
         info_frame = ttk.Frame(self.detail_frame)
@@ -188,43 +317,75 @@ class PerformanceSearchDialog:
         self.time_combo = ttk.Combobox(date_frame, width=20)
         self.time_combo.grid(row=1, column=1, padx=(10, 0), pady=(10, 0))
         
-        # 상세 정보 로드
+        # 상세 정보 로드 (미리 불러온 결과가 있으면 바로 표시)
         self.selected_performance = performance
-        threading.Thread(target=self._load_detail, args=(performance['id'],), daemon=True).start()
+        self.selected_detail = None
+        detail = self.prefetcher.get(performance['id']) or self.detail_cache.get(performance['id'])
+        if detail:
+            self._update_detail(detail)
+        else:
+            # 브라우저 결과가 올 때까지 정적 파싱 결과로 날짜/시간만 미리 표시
+            preview = self.static_detail_cache.get(performance['id'])
+            if preview:
+                self._update_detail(preview)
+            future = self.prefetcher.request(performance['id'])
+            future.add_done_callback(lambda f: self._on_detail_loaded(performance['id'], f))
         
         self.select_button.config(state=tk.NORMAL)
         
     def _load_poster(self, url: str):
-        """포스터 이미지 로드"""
+        """포스터 이미지 로드 (작업 스레드)"""
+        response = self.crawler.transport.get(url)
+        response.raise_for_status()
+        img = Image.open(BytesIO(response.content))
+        return img.resize((150, 200), Image.Resampling.LANCZOS)
+        
+    def _on_poster_loaded(self, future):
+        """포스터 로드 완료 (다른 공연을 선택해 대체된 경우 무시)"""
+        if future.cancelled():
+            return
         try:
-            response = requests.get(url)
-            img = Image.open(BytesIO(response.content))
-            img = img.resize((150, 200), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
-            self.dialog.after(0, self._show_poster, photo)
+            self.dialog.after(0, self._show_poster, future.result())
             
+        except tk.TclError:
+            # 다이얼로그가 이미 닫힘
+            pass
         except Exception as e:
-            logger.error(f"포스터 로드 실패: {str(e)}")
+            logger.error("포스터 로드 실패: %s", e)
             
-    def _show_poster(self, photo):
+    def _show_poster(self, img):
         """포스터 표시"""
+        # PhotoImage는 Tk 스레드에서 생성
+        photo = ImageTk.PhotoImage(img)
         poster_label = ttk.Label(self.detail_frame, image=photo)
         poster_label.image = photo  # 참조 유지
         poster_label.pack(pady=10)
         
-    def _load_detail(self, performance_id: str):
-        """공연 상세 정보 로드"""
+    def _on_detail_loaded(self, performance_id: str, future):
+        """상세 정보 로드 완료 (작업 스레드에서 호출)"""
+        if future.cancelled():
+            return
         try:
-            detail = self.crawler.get_performance_detail(performance_id)
+            detail = future.result()
             if detail:
                 self.dialog.after(0, self._update_detail, detail)
                 
+        except tk.TclError:
+            # 다이얼로그가 이미 닫힘
+            pass
         except Exception as e:
-            logger.error(f"상세 정보 로드 실패: {str(e)}")
+            logger.error("상세 정보 로드 실패 (%s): %s", performance_id, e)
             
     def _update_detail(self, detail: Dict):
         """상세 정보 업데이트"""
+        # 그 사이 다른 공연을 선택했다면 무시
+        if not self.selected_performance or self.selected_performance['id'] != detail.get('id'):
+            return
+            
+        # 정적 파싱 결과는 미리보기일 뿐이므로 좌석 등급 등 예매 정보로 쓰지 않음
+        if detail.get('source') != 'static':
+            self.selected_detail = detail
+        
         if detail.get('dates'):
             self.date_combo['values'] = detail['dates']
             if detail['dates']:
@@ -256,6 +417,7 @@ class PerformanceSearchDialog:
             return {
                 'performance': self.selected_performance,
                 'date': self.selected_date,
-                'time': self.selected_time
+                'time': self.selected_time,
+                'seat_grades': (self.selected_detail or {}).get('seat_grades', [])
             }
         return None
\ No newline at end of file
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackStats:
+    """Tk 콜백 실행 시간 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+
+class UiLagMonitor:
+    """Tk 이벤트 루프 지연 측정기
+
+    after()로 주기적인 하트비트를 예약하고 예정 시각보다 얼마나 늦게 실행됐는지 기록한다.
+    track()으로 감싼 콜백은 이름별 실행 시간을 따로 모아, 지연이 생기면 원인 후보로 로그에 남긴다.
+    """
+
+    def __init__(self, root, interval_ms: int = 100, warn_ms: int = 200, window: int = 600,
+                 on_update: Optional[Callable[[str], None]] = None, update_every: int = 10):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.warn_ms = warn_ms
+        self.on_update = on_update
+        self.update_every = update_every
+        self._lags = deque(maxlen=window)
+        self._max_lag = 0.0
+        self._callbacks: Dict[str, CallbackStats] = {}
+        self._recent: List[Tuple[str, float]] = []
+        self._expected: Optional[float] = None
+        self._beats = 0
+        self._after_id = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, root, settings, on_update: Optional[Callable[[str], None]] = None) -> "UiLagMonitor":
+        return cls(root, interval_ms=settings.UI_LAG_INTERVAL_MS, warn_ms=settings.UI_LAG_WARN_MS,
+                   on_update=on_update)
+
+    def start(self):
+        if self._after_id is None:
+            self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def track(self, name: str, func: Callable) -> Callable:
+        """콜백 실행 시간을 기록하는 래퍼 반환"""
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record_callback(name, time.perf_counter() - started)
+        return wrapper
+
+    def snapshot(self) -> Dict:
+        """지연 통계 (밀리초)"""
+        with self._lock:
+            lags = sorted(self._lags)
+            slowest = sorted(self._callbacks.items(), key=lambda item: item[1].max, reverse=True)[:5]
+            max_lag = self._max_lag
+
+        def percentile(ratio: float) -> float:
+            return lags[min(len(lags) - 1, int(len(lags) * ratio))] * 1000 if lags else 0.0
+
+        return {
+            'samples': len(lags),
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'max_ms': max_lag * 1000,
+            'slowest_callbacks': [
+                {'name': name, 'count': stats.count, 'max_ms': stats.max * 1000,
+                 'avg_ms': stats.total / stats.count * 1000}
+                for name, stats in slowest
+            ]
+        }
+
+    def format_status(self) -> str:
+        stats = self.snapshot()
+        return f"UI 지연 p95 {stats['p95_ms']:.0f}ms / 최대 {stats['max_ms']:.0f}ms"
+
+    def log_report(self):
+        stats = self.snapshot()
+        if not stats['samples']:
+            return
+        lines = [f"UI 지연: p50 {stats['p50_ms']:.1f}ms, p95 {stats['p95_ms']:.1f}ms, "
+                 f"최대 {stats['max_ms']:.1f}ms ({stats['samples']}개 표본)"]
+        for callback in stats['slowest_callbacks']:
+            lines.append(f"  {callback['name']}: {callback['count']}회, 평균 {callback['avg_ms']:.1f}ms, "
+                         f"최대 {callback['max_ms']:.1f}ms")
+        logger.info("\n".join(lines))
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        lag = max(0.0, time.perf_counter() - self._expected)
+        with self._lock:
+            self._lags.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+            recent, self._recent = self._recent, []
+
+        if lag * 1000 >= self.warn_ms:
+            suspects = ", ".join(f"{name} {duration * 1000:.0f}ms"
+                                 for name, duration in sorted(recent, key=lambda r: r[1], reverse=True)[:3])
+            logger.warning("UI 이벤트 루프 %.0fms 지연 (최근 콜백: %s)", lag * 1000, suspects or "없음")
+
+        self._beats += 1
+        if self.on_update and self._beats % self.update_every == 0:
+            self.on_update(self.format_status())
+
+        self._schedule()
+
+    def _record_callback(self, name: str, duration: float):
+        with self._lock:
+            stats = self._callbacks.get(name)
+            if stats is None:
+                stats = self._callbacks[name] = CallbackStats()
+            stats.add(duration)
+            self._recent.append((name, duration))
@@ -0,0 +1,272 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualResultList:
+    """화면에 보이는 행만 생성하는 가상 공연 목록 (ttk.Treeview)
+
+    전체 목록은 인덱스 배열로만 관리하고, 스크롤 시 고정된 수의 행을 재사용해 값을 바꿔 넣는다.
+    """
+
+    COLUMNS = (
+        ('name', '공연명', 260),
+        ('place', '장소', 140),
+        ('date', '기간', 170)
+    )
+    SORT_KEYS = {
+        'name': lambda perf: perf.get('name', ''),
+        'place': lambda perf: perf.get('place', ''),
+        'date': lambda perf: (perf.get('start_date', ''), perf.get('end_date', ''))
+    }
+
+    def __init__(self, parent, on_select: Callable[[Dict], None],
+                 on_view_change: Optional[Callable[[List[Dict]], None]] = None):
+        self.on_select = on_select
+        self.on_view_change = on_view_change
+
+        self.frame = ttk.Frame(parent)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree = ttk.Treeview(self.frame, columns=[c[0] for c in self.COLUMNS],
+                                 show='headings', selectmode='browse')
+        for column, title, width in self.COLUMNS:
+            self.tree.heading(column, text=title, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=width, stretch=(column == 'name'))
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self._visible_rows))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self._visible_rows))
+
+        row_height = ttk.Style().lookup('Treeview', 'rowheight')
+        self._row_height = int(row_height) if row_height else 20
+
+        self._items: List[Dict] = []
+        self._haystack: List[str] = []
+        self._sorted_orders: Dict[str, List[int]] = {}
+        self._index: List[int] = []
+        self._sort_column: Optional[str] = None
+        self._sort_reverse = False
+        self._filter_text = ''
+        self._offset = 0
+        self._visible_rows = 20
+        self._selected: Optional[int] = None
+        self._rendering = False
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def bind_row_event(self, sequence: str, callback: Callable[[Optional[Dict]], None]):
+        """행 단위 이벤트 바인딩 (예: 마우스 오버)"""
+        self.tree.bind(sequence, lambda e: callback(self._item_at_y(e.y)), add='+')
+
+    def set_items(self, items: List[Dict], keep_position: bool = False):
+        """전체 목록 교체 (정렬/필터 상태 유지)
+
+        keep_position이면 같은 ID의 선택 항목과 스크롤 위치를 유지한다.
+        """
+        selected_id = None
+        if keep_position and self._selected is not None:
+            selected_id = self._items[self._selected].get('id')
+
+        self._items = items
+        self._haystack = [f"{p.get('name', '')} {p.get('place', '')}".casefold() for p in items]
+        self._sorted_orders.clear()
+        self._selected = next((i for i, p in enumerate(items) if p.get('id') == selected_id), None) \
+            if selected_id is not None else None
+        if not keep_position:
+            self._offset = 0
+        self._rebuild_index()
+        self._set_offset(self._offset)
+
+    def set_message(self, text: str):
+        """목록 대신 안내 문구 한 줄 표시"""
+        self._items = []
+        self._haystack = []
+        self._sorted_orders.clear()
+        self._index = []
+        self._selected = None
+        self._offset = 0
+        self.tree.delete(*self.tree.get_children())
+        self.tree.insert('', tk.END, iid='message', values=(text, '', ''))
+        self.scrollbar.set(0, 1)
+
+    def sort_by(self, column: str):
+        """열 제목 클릭 시 정렬 (같은 열을 다시 누르면 역순)"""
+        if self._sort_column == column:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column
+            self._sort_reverse = False
+        self._offset = 0
+        self._rebuild_index()
+
+    def filter(self, text: str):
+        """공연명/장소에 text가 포함된 항목만 표시"""
+        self._filter_text = text.strip().casefold()
+        self._offset = 0
+        self._rebuild_index()
+
+    def scroll(self, rows: int):
+        self._set_offset(self._offset + rows)
+
+    def visible_items(self) -> List[Dict]:
+        """현재 화면에 보이는 항목 목록"""
+        return [self._items[i] for i in self._index[self._offset:self._offset + self._visible_rows]]
+
+    def _rebuild_index(self):
+        order = self._sorted_order()
+        if self._filter_text:
+            text = self._filter_text
+            order = [i for i in order if text in self._haystack[i]]
+        self._index = order
+        self._render()
+
+    def _sorted_order(self) -> List[int]:
+        """열별 정렬 순서 (목록이 바뀌기 전까지 캐시)"""
+        if not self._sort_column:
+            return list(range(len(self._items)))
+
+        order = self._sorted_orders.get(self._sort_column)
+        if order is None:
+            key = self.SORT_KEYS[self._sort_column]
+            order = sorted(range(len(self._items)), key=lambda i: key(self._items[i]))
+            self._sorted_orders[self._sort_column] = order
+        return order[::-1] if self._sort_reverse else order
+
+    def _set_offset(self, offset: int):
+        max_offset = max(0, len(self._index) - self._visible_rows)
+        offset = max(0, min(offset, max_offset))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _render(self):
+        """보이는 구간의 행만 채움"""
+        self._rendering = True
+        try:
+            window = self._index[self._offset:self._offset + self._visible_rows]
+            existing = self.tree.get_children()
+            if 'message' in existing:
+                self.tree.delete('message')
+                existing = self.tree.get_children()
+
+            for row, item_index in enumerate(window):
+                iid = f"row{row}"
+                values = self._format_row(self._items[item_index])
+                if row < len(existing):
+                    self.tree.item(iid, values=values)
+                else:
+                    self.tree.insert('', tk.END, iid=iid, values=values)
+
+            for iid in existing[len(window):]:
+                self.tree.delete(iid)
+
+            selected_row = self._row_of(self._selected)
+            self.tree.selection_set((f"row{selected_row}",) if selected_row is not None else ())
+            self._update_scrollbar()
+        finally:
+            self._rendering = False
+
+        if self.on_view_change:
+            self.on_view_change(self.visible_items())
+
+    def _update_scrollbar(self):
+        total = len(self._index)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        first = self._offset / total
+        last = min(1.0, (self._offset + self._visible_rows) / total)
+        self.scrollbar.set(first, last)
+
+    @staticmethod
+    def _format_row(perf: Dict):
+        return (perf.get('name', ''), perf.get('place', ''),
+                f"{perf.get('start_date', '')}~{perf.get('end_date', '')}")
+
+    def _row_of(self, item_index: Optional[int]) -> Optional[int]:
+        if item_index is None:
+            return None
+        window = self._index[self._offset:self._offset + self._visible_rows]
+        try:
+            return window.index(item_index)
+        except ValueError:
+            return None
+
+    def _item_at_y(self, y: int) -> Optional[Dict]:
+        iid = self.tree.identify_row(y)
+        if not iid or not iid.startswith('row'):
+            return None
+        position = self._offset + int(iid[3:])
+        return self._items[self._index[position]] if position < len(self._index) else None
+
+    def _on_tree_select(self, event):
+        if self._rendering:
+            return
+        selection = self.tree.selection()
+        if not selection or not selection[0].startswith('row'):
+            return
+        position = self._offset + int(selection[0][3:])
+        if position < len(self._index):
+            self._select_position(position)
+
+    def _select_position(self, position: int):
+        item_index = self._index[position]
+        if item_index == self._selected:
+            return
+        self._selected = item_index
+        self.on_select(self._items[item_index])
+
+    def _move_selection(self, delta: int):
+        """키보드 이동 (화면 밖으로 나가면 스크롤)"""
+        if not self._index:
+            return 'break'
+
+        try:
+            current = self._index.index(self._selected) if self._selected is not None else -1
+        except ValueError:
+            current = -1
+        position = max(0, min(len(self._index) - 1, current + delta))
+
+        if position < self._offset:
+            self._set_offset(position)
+        elif position >= self._offset + self._visible_rows:
+            self._set_offset(position - self._visible_rows + 1)
+
+        self._select_position(position)
+        self._render()
+        return 'break'
+
+    def _on_scrollbar(self, *args):
+        if not self._index:
+            return
+        if args[0] == 'moveto':
+            self._set_offset(int(float(args[1]) * len(self._index)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self.scroll(amount * self._visible_rows if args[2] == 'pages' else amount)
+
+    def _on_mousewheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _on_configure(self, event):
+        # 헤더 한 줄을 뺀 높이만큼 행 표시
+        rows = max(1, event.height // self._row_height - 1)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._set_offset(self._offset)
+            self._render()
@@ -0,0 +1,19 @@
+from infrastructure.cache.catalog_snapshot import CatalogSnapshot
+
+
+def performance(performance_id, name):
+    return {'id': performance_id, 'name': name, 'place': '', 'start_date': '', 'end_date': '',
+            'poster_url': '', 'url': ''}
+
+
+def test_upsert_keeps_entries_missing_from_the_update(tmp_path):
+    path = str(tmp_path / "catalog.json")
+    snapshot = CatalogSnapshot(path)
+    snapshot.save([performance('1', 'old'), performance('2', 'synced by pipeline')])
+
+    snapshot.upsert([performance('3', 'new'), performance('1', 'renamed')])
+
+    reloaded = CatalogSnapshot(path).load()
+    assert [(perf['id'], perf['name']) for perf in reloaded] == [
+        ('3', 'new'), ('1', 'renamed'), ('2', 'synced by pipeline')
+    ]
@@ -0,0 +1,49 @@
+import requests
+
+from infrastructure.web_driver.cookie_bridge import CookieBridge
+
+
+class FakeDriver:
+    def __init__(self, url, cookies=None):
+        self.current_url = url
+        self.cookies = list(cookies or [])
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+
+def test_driver_to_session_copies_browser_cookies():
+    session = requests.Session()
+    driver = FakeDriver("https://tickets.interpark.com/goods/1", [
+        {'name': 'sid', 'value': 'abc', 'domain': '.interpark.com', 'path': '/', 'httpOnly': True}
+    ])
+
+    assert CookieBridge(session).driver_to_session(driver) == 1
+    assert session.cookies.get('sid', domain='.interpark.com') == 'abc'
+
+
+def test_session_to_driver_copies_only_matching_domain():
+    session = requests.Session()
+    session.cookies.set('sid', 'abc', domain='.interpark.com', path='/')
+    session.cookies.set('other', 'x', domain='example.com', path='/')
+    driver = FakeDriver("https://tickets.interpark.com/goods/1")
+
+    assert CookieBridge(session).session_to_driver(driver) == 1
+    assert [(c['name'], c['value'], c['domain'], c['path']) for c in driver.cookies] == \
+        [('sid', 'abc', '.interpark.com', '/')]
+
+
+def test_sync_round_trip_prefers_browser_values():
+    session = requests.Session()
+    session.cookies.set('sid', 'old', domain='.interpark.com', path='/')
+    driver = FakeDriver("https://tickets.interpark.com/", [
+        {'name': 'token', 'value': 'new', 'domain': '.interpark.com', 'path': '/'}
+    ])
+
+    CookieBridge(session).sync(driver)
+
+    assert {cookie['name'] for cookie in driver.cookies} == {'sid', 'token'}
+    assert session.cookies.get('token', domain='.interpark.com') == 'new'
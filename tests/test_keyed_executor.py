@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import CancelledError, wait
+
+import pytest
+
+from infrastructure.concurrency.keyed_executor import KeyedExecutor
+
+
+def test_shutdown_cancels_queued_unkeyed_work():
+    executor = KeyedExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    running = executor.submit(None, lambda: started.set() or release.wait(5))
+    assert started.wait(1)
+    queued = executor.submit(None, lambda: 'never')
+
+    executor.shutdown()
+    release.set()
+
+    assert queued.cancelled()
+    with pytest.raises(CancelledError):
+        queued.result(timeout=1)
+    assert running.result(timeout=1) is True
+
+
+def test_submit_after_shutdown_returns_cancelled_future():
+    executor = KeyedExecutor()
+    executor.shutdown()
+
+    assert executor.submit(None, lambda: 1).cancelled()
+    assert executor.submit('key', lambda: 1, browser=True).cancelled()
+
+
+def test_submit_racing_shutdown_never_hangs_or_raises():
+    executor = KeyedExecutor(max_workers=2, max_browser_jobs=1)
+    futures, errors = [], []
+    start = threading.Barrier(5)
+
+    def submit_many(index):
+        start.wait()
+        for i in range(200):
+            try:
+                futures.append(executor.submit(None if i % 2 else f"{index}-{i}", lambda: i, browser=i % 3 == 0))
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=submit_many, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    executor.shutdown()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    done, not_done = wait(futures, timeout=5)
+    assert not not_done
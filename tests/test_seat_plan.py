@@ -0,0 +1,11 @@
+from infrastructure.interpark.seat_plan import SeatPlan
+
+
+def test_lost_seat_does_not_hide_same_position_in_another_section():
+    keys = [SeatPlan.seat_key('A', 1, 1), SeatPlan.seat_key('B', 1, 1)]
+    plan = SeatPlan(['a11', 'b11'], keys, group_size=1, available_count=2, preference_key=None)
+
+    assert plan.next_group() == [0]
+    plan.mark_last_group_lost()
+
+    assert plan.next_group() == [1]
@@ -0,0 +1,37 @@
+import numpy as np
+
+from domain.entities import SeatDirection
+from infrastructure.interpark.seat_scoring import SeatLayout, SeatScorer, SeatScoringWeights
+
+
+def test_default_weights_keep_front_row_then_direction_order():
+    rows, cols = [2, 1, 1, 1], [1, 3, 1, 2]
+    scorer = SeatScorer()
+
+    scores = scorer.score(rows, cols, [''] * 4, [''] * 4, SeatDirection.RIGHT)
+
+    assert list(scorer.top_k(scores, 4)) == [2, 3, 1, 0]
+
+
+def test_sold_seats_do_not_move_aisles_or_centre():
+    # 한 줄 1~9열 (배치상 통로 없음)
+    layout = SeatLayout([1] * 9, list(range(1, 10)), [''] * 9)
+    scorer = SeatScorer(SeatScoringWeights(stage_distance=1.0, aisle=1.0))
+
+    all_cols = list(range(1, 10))
+    before = scorer.score([1] * 9, all_cols, [''] * 9, [''] * 9, SeatDirection.RIGHT, layout)
+
+    # 5열과 9열이 팔려도 남은 좌석 점수는 그대로
+    remaining = [c for c in all_cols if c not in (5, 9)]
+    after = scorer.score([1] * len(remaining), remaining, [''] * len(remaining), [''] * len(remaining),
+                         SeatDirection.RIGHT, layout)
+
+    assert np.allclose(after, before[[c - 1 for c in remaining]])
+
+
+def test_sections_reusing_numbers_have_separate_aisles():
+    layout = SeatLayout([1, 1, 1], [1, 2, 3], ['A', 'A', 'B'])
+
+    has_seat = layout.has_seat(np.array([1, 1]), np.array([2, 2]), ['A', 'B'])
+
+    assert list(has_seat) == [True, False]
@@ -0,0 +1,129 @@
+import re
+
+from domain.entities import SeatDirection, SeatPreference, SeatSelectionType
+from infrastructure.interpark.seat_selector import SeatSelector
+from infrastructure.tracing.trace_replay import ReplayDriver
+
+
+def seat_map(*seats):
+    cells = ''.join(f'<span class="seat_available" data-row="{row}" data-col="{col}"></span>'
+                    for row, col in seats)
+    return f'<div id="seatMap">{cells}</div>'
+
+
+def preference(count, direction=SeatDirection.RIGHT):
+    return SeatPreference(SeatSelectionType.NORMAL, direction, count)
+
+
+def test_malformed_column_skips_only_that_seat():
+    driver = ReplayDriver(seat_map((1, 1), (1, 'x'), (1, 2), (2, 1)))
+    selector = SeatSelector(driver)
+
+    assert selector.select_seats(preference(2))
+    assert [seat.position for seat in driver.seats if seat.clicked] == [('1', '1'), ('1', '2')]
+
+
+class ToggleSeat:
+    """클릭하면 선택 상태가 바뀌는 좌석 (broken이면 클릭 실패)"""
+
+    def __init__(self, row, col, broken=False):
+        self.attrs = {'data-row': str(row), 'data-col': str(col)}
+        self.broken = broken
+        self.selected = False
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def click(self):
+        if self.broken:
+            raise RuntimeError("element click intercepted")
+        self.selected = not self.selected
+
+
+class ToggleDriver:
+    def __init__(self, seats):
+        self.seats = seats
+
+    def find_elements(self, by, value):
+        return list(self.seats)
+
+    def execute_script(self, script, *args):
+        return None
+
+
+def test_partial_selection_is_released_and_reported_as_failure():
+    seats = [ToggleSeat(1, 1), ToggleSeat(1, 2, broken=True), ToggleSeat(1, 3)]
+    selector = SeatSelector(ToggleDriver(seats))
+
+    assert not selector.select_seats(preference(3))
+    assert [seat.selected for seat in seats] == [False, False, False]
+    assert selector.selected_seats == []
+
+
+def test_full_selection_succeeds():
+    seats = [ToggleSeat(1, 1), ToggleSeat(1, 2), ToggleSeat(1, 3)]
+    selector = SeatSelector(ToggleDriver(seats))
+
+    assert selector.select_seats(preference(2))
+    assert [seat.selected for seat in seats] == [True, True, False]
+    assert len(selector.selected_seats) == 2
+
+
+class FakeCdp:
+    """좌석을 세로로 100px 간격으로 배치하고, scrollIntoView마다 스크롤 위치가 바뀌는 CDP 백엔드"""
+
+    def __init__(self, seats, ignored=()):
+        self.seats = seats
+        self.ignored = set(ignored)
+        self.scroll = 0
+
+    def evaluate(self, script, frame_id=None):
+        index = re.search(r'\((\d+)\)\s*$', script)
+        if '__plannedSeats = seats' in script:
+            return [[seat.attrs['data-row'], seat.attrs['data-col'], None, None] for seat in self.seats]
+        if 'scrollIntoView' in script:
+            i = int(index.group(1))
+            self.scroll = i * 100
+            return {'x': 10, 'y': i * 100 - self.scroll + 5, 'state': str(self.seats[i].selected)}
+        if 'return el ? state(el)' in script:
+            return str(self.seats[int(index.group(1))].selected)
+        if 'querySelectorAll(selector)' in script:
+            return [[seat.attrs['data-row'], seat.attrs['data-col'], None, None] for seat in self.seats]
+        return len(self.seats)
+
+    def click_at(self, x, y):
+        i = int((y + self.scroll) // 100)
+        if i not in self.ignored:
+            self.seats[i].selected = not self.seats[i].selected
+
+
+class FallbackDriver(ToggleDriver):
+    def __init__(self, seats):
+        super().__init__(seats)
+        self.fallback_clicks = []
+
+    def find_element(self, by, value):
+        row, col = re.findall(r'"(\d+)"', value)[:2]
+        seat = next(s for s in self.seats if s.attrs['data-row'] == row and s.attrs['data-col'] == col)
+        self.fallback_clicks.append((row, col))
+        return seat
+
+
+def test_cdp_clicks_each_seat_at_its_current_position():
+    seats = [ToggleSeat(1, 1), ToggleSeat(1, 2), ToggleSeat(1, 3)]
+    driver = FallbackDriver(seats)
+    selector = SeatSelector(driver, cdp=FakeCdp(seats))
+
+    assert selector.select_seats(preference(3))
+    assert [seat.selected for seat in seats] == [True, True, True]
+    assert driver.fallback_clicks == []
+
+
+def test_cdp_click_without_state_change_falls_back_to_selenium():
+    seats = [ToggleSeat(1, 1), ToggleSeat(1, 2)]
+    driver = FallbackDriver(seats)
+    selector = SeatSelector(driver, cdp=FakeCdp(seats, ignored={1}))
+
+    assert selector.select_seats(preference(2))
+    assert [seat.selected for seat in seats] == [True, True]
+    assert driver.fallback_clicks == [('1', '2')]
@@ -0,0 +1,29 @@
+from infrastructure.simulation.simulated_repository import SimulationConfig, run_simulation
+
+
+def test_same_seed_gives_same_result():
+    config = SimulationConfig(total_seats=60)
+
+    first = run_simulation(config, runs=400, users=20, seed=3)
+    second = run_simulation(config, runs=400, users=20, seed=3)
+
+    assert (first.successes, first.booking_times) == (second.successes, second.booking_times)
+
+
+def test_users_in_a_round_share_the_inventory():
+    config = SimulationConfig(total_seats=5, competitor_rate=0.0, conflict_probability=0.0,
+                              captcha_failure_rate=0.0)
+
+    report = run_simulation(config, runs=40, users=20, seed=1)
+
+    # 라운드마다 좌석 5개를 20명이 나눠 가짐
+    assert report.successes == 2 * 5
+
+
+def test_throughput_benchmark():
+    """가상 시간으로 실행하므로 여러 예매자를 번갈아 실행해도 초당 수천 회 이상 유지"""
+    single = run_simulation(runs=2000, users=1, seed=1)
+    interleaved = run_simulation(runs=2000, users=50, seed=1)
+
+    assert single.runs_per_second > 2000
+    assert interleaved.runs_per_second > 500